@@ -0,0 +1,4 @@
+BUG_REPORT_MESSAGE = (
+    'This is an unexpected result and probably a bug. Please report it '
+    'on GitHub at https://github.com/1npo/nwsc/issues.'
+)
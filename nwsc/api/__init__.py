@@ -1,3 +1,6 @@
+from datetime import timedelta
+
+
 # See:
 # - https://github.com/weather-gov/api/discussions/478
 # - https://weather-gov.github.io/api/general-faqs, especially these sections:
@@ -31,6 +34,50 @@ NWS_API_ZONE_FORECASTS = 'http://api.weather.gov/zones/forecast/'
 NWS_API_ZONES = 'http://api.weather.gov/zones/'
 
 
+# How long to cache responses from each endpoint, based on how often NWS updates it.
+# Keys are requests-cache URL patterns: the scheme is ignored, `*` matches any
+# characters and each pattern also matches every URL that starts with it. The first
+# matching pattern wins, so more specific patterns must come before their prefixes.
+# Expired responses that have an ETag or Last-Modified header are revalidated with a
+# conditional request, so an unchanged response costs a 304 instead of a full download.
+#
+# See: https://requests-cache.readthedocs.io/en/stable/user_guide/expiration.html
+DEFAULT_EXPIRE_AFTER = timedelta(hours=1)
+NWS_API_EXPIRE_AFTER = {
+	# Alerts are issued and updated continuously
+	NWS_API_ALERT_TYPES:						timedelta(days=1),
+	NWS_API_ALERTS:								timedelta(seconds=30),
+	# Aviation
+	NWS_API_AVIATION_CWSU + '*/cwas':			timedelta(minutes=5),
+	NWS_API_AVIATION_CWSU:						timedelta(days=1),
+	NWS_API_AVIATION_SIGMETS:					timedelta(minutes=5),
+	# Observations are reported at least hourly, and often every 5 minutes
+	NWS_API_STATIONS + '*/observations':		timedelta(minutes=5),
+	NWS_API_ZONE_FORECASTS + '*/observations':	timedelta(minutes=5),
+	NWS_API_STATIONS:							timedelta(days=1),
+	# Forecasts are regenerated roughly hourly
+	NWS_API_GRIDPOINTS:							timedelta(minutes=30),
+	NWS_API_ZONE_FORECASTS + '*/forecast':		timedelta(minutes=30),
+	NWS_API_ZONE_FORECASTS + '*/stations':		timedelta(days=1),
+	# Radar status changes by the minute
+	NWS_API_RADAR_QUEUES:						timedelta(minutes=1),
+	NWS_API_RADAR_SERVERS:						timedelta(minutes=1),
+	NWS_API_RADAR_STATIONS:						timedelta(minutes=5),
+	# Products
+	NWS_API_PRODUCT_TYPES + '/*':				timedelta(minutes=5),
+	NWS_API_PRODUCT_TYPES:						timedelta(days=1),
+	NWS_API_PRODUCT_LOCATIONS:					timedelta(days=1),
+	NWS_API_PRODUCTS:							timedelta(minutes=5),
+	# Reference data that rarely changes
+	NWS_API_OFFICES + '*/headlines':			timedelta(minutes=15),
+	NWS_API_OFFICES:							timedelta(days=1),
+	NWS_API_POINTS:								timedelta(days=1),
+	NWS_API_ZONES:								timedelta(days=7),
+	NWS_API_GLOSSARY:							timedelta(days=30),
+	USCB_API_GEOCODE:							timedelta(days=30),
+}
+
+
 # See: https://codes.wmo.int/common/unit
 WMI_UNIT_MAP = {                            
 	'wmoUnit:Pa':               'pa',       # pressure in pascals
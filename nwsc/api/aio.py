@@ -0,0 +1,700 @@
+"""Asynchronous versions of the `nwsc.api.get_*` functions
+
+Every coroutine in this module mirrors the synchronous function of the same name, but
+performs its request with an `aiohttp.ClientSession` instead of a blocking
+`requests_cache.CachedSession`. Responses are parsed with the same `process_*`
+functions used by the synchronous API, so both APIs return identical dataclasses.
+
+Because all requests share the connection pool of a single session, many endpoints
+can be fetched concurrently from one event loop:
+
+.. code-block:: python
+
+	async with create_session() as session:
+		alerts, radar_servers, glossary = await asyncio.gather(
+			get_alerts(session),
+			get_radar_servers(session),
+			get_glossary(session),
+		)
+
+An `aiohttp_client_cache.CachedSession` can be passed anywhere a session is expected
+to get the same response caching as the synchronous API.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+from string import Template
+from datetime import datetime, timezone
+from aiohttp import ClientSession, ClientTimeout, ClientConnectionError, TCPConnector
+from nwsc.api.api_request import DEFAULT_TIMEOUT
+from nwsc.api.json_codec import loads
+from nwsc.api.rate_limit import (
+	RateLimiter,
+	RetryPolicy,
+	DEFAULT_RATE_LIMITER,
+	DEFAULT_RETRY_POLICY,
+)
+from nwsc.api.get_alerts import process_alert_data, process_alert_counts_data
+from nwsc.api.get_aviation import (
+	process_sigmets,
+	process_cwa_data,
+	process_cwsu_data,
+)
+from nwsc.api.get_enums import process_error_response, FAILED_TO_GET_ENUM_MESSAGE
+from nwsc.api.get_glossary import process_glossary_data
+from nwsc.api.get_location import process_geocode_data, process_location_data
+from nwsc.api.get_offices import (
+	InvalidOfficeException,
+	process_headline_data,
+	process_office_data,
+)
+from nwsc.api.get_products import (
+	process_product_data,
+	process_product_types_data,
+	process_product_locations_data,
+)
+from nwsc.api.get_radar import (
+	process_radar_station_data,
+	process_radar_server_data,
+	process_radar_station_alarms_data,
+	process_radar_queue_data,
+)
+from nwsc.api.get_stations import process_station_data
+from nwsc.api.get_weather import process_observations_data, process_forecast_data
+from nwsc.api.get_zones import process_zone_data, process_zone_forecast_data
+from nwsc.api import (
+	USCB_API_GEOCODE,
+	NWS_API_ALERTS,
+	NWS_API_ALERTS_AREA,
+	NWS_API_ALERTS_REGION,
+	NWS_API_ALERTS_ZONE,
+	NWS_API_ALERT_COUNTS,
+	NWS_API_ALERT_TYPES,
+	NWS_API_AVIATION_CWSU,
+	NWS_API_AVIATION_SIGMETS,
+	NWS_API_GLOSSARY,
+	NWS_API_GRIDPOINTS,
+	NWS_API_OFFICES,
+	NWS_API_POINTS,
+	NWS_API_PRODUCTS,
+	NWS_API_PRODUCT_LOCATIONS,
+	NWS_API_PRODUCT_TYPES,
+	NWS_API_RADAR_SERVERS,
+	NWS_API_RADAR_STATIONS,
+	NWS_API_RADAR_QUEUES,
+	NWS_API_STATIONS,
+	NWS_API_ZONE_FORECASTS,
+	NWS_API_ZONES,
+	VALID_NWS_ZONES,
+	VALID_NWS_FORECAST_OFFICES,
+)
+from nwsc.model.alerts import Alert, AlertCounts
+from nwsc.model.aviation import SIGMET, CenterWeatherAdvisory, CentralWeatherServiceUnit
+from nwsc.model.locations import Location
+from nwsc.model.offices import Office, OfficeHeadline
+from nwsc.model.products import Product, ProductLocation, ProductType
+from nwsc.model.radar import RadarStation, RadarStationAlarm, RadarQueueItem, RadarServer
+from nwsc.model.stations import Station
+from nwsc.model.weather import Observation, Forecast
+from nwsc.model.zones import Zone, ZoneForecast
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CONNECTION_LIMIT = 20
+
+
+def create_session(
+	connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+	**kwargs
+) -> ClientSession:
+	"""Create an `aiohttp.ClientSession` with a shared, bounded connection pool
+
+	Must be called from inside a running event loop.
+
+	:param connection_limit: The maximum number of simultaneous connections
+	:param kwargs: Any additional keyword arguments are passed to `ClientSession`
+	"""
+	connector = TCPConnector(limit=connection_limit)
+	return ClientSession(connector=connector, **kwargs)
+
+
+def _get_client_timeout(timeout: float | tuple) -> ClientTimeout:
+	if isinstance(timeout, tuple):
+		connect, read = timeout
+		return ClientTimeout(sock_connect=connect, sock_read=read)
+	return ClientTimeout(total=timeout)
+
+
+async def _api_request(
+	session: ClientSession,
+	url: str,
+	timeout: float | tuple,
+	rate_limiter: RateLimiter | None,
+	retry_policy: RetryPolicy | None
+) -> dict:
+	client_timeout = _get_client_timeout(timeout)
+	attempt = 0
+	while True:
+		if rate_limiter:
+			await rate_limiter.acquire_async(url)
+		try:
+			async with session.get(url, timeout=client_timeout) as response:
+				retry_after = response.headers.get('Retry-After')
+				if (not retry_policy
+						or not retry_policy.should_retry(attempt, response.status)):
+					data = loads(await response.read())
+					break
+		except (ClientConnectionError, asyncio.TimeoutError) as e:
+			if not retry_policy or not retry_policy.should_retry(attempt):
+				raise
+			delay = retry_policy.get_delay(attempt)
+			logger.warning(f'Request to {url} failed ({e!r}), retrying in {delay:.2f}s')
+		else:
+			delay = retry_policy.get_delay(attempt, retry_after)
+			if rate_limiter and retry_after:
+				rate_limiter.pause(url, delay)
+			logger.warning((
+				f'Request to {url} returned HTTP {response.status}, '
+				f'retrying in {delay:.2f}s'))
+		await asyncio.sleep(delay)
+		attempt += 1
+	# Cached responses from aiohttp_client_cache carry their own creation time. Fresh
+	# responses are stamped with the current time. Either way it's made timezone-aware
+	# UTC, the same as the `created_at` requests-cache gives the sync API.
+	created_at = getattr(response, 'created_at', None)
+	if not created_at:
+		created_at = datetime.now(timezone.utc)
+	elif created_at.tzinfo is None:
+		created_at = created_at.replace(tzinfo=timezone.utc)
+	return {'response': data, 'retrieved_at': created_at}
+
+
+# In-flight tasks keyed by (event loop, session, URL). A task can only be awaited
+# from its own loop, so callers in other loops (like `asyncio.run` in another
+# thread) get their own task.
+_flights: Dict[tuple, asyncio.Task] = {}
+
+
+def _forget_flight(key: tuple, task: asyncio.Task):
+	if _flights.get(key) is task:
+		del _flights[key]
+
+
+async def api_request(
+	session: ClientSession,
+	url: str,
+	timeout: float | tuple = DEFAULT_TIMEOUT,
+	rate_limiter: RateLimiter | None = DEFAULT_RATE_LIMITER,
+	retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+	coalesce: bool = True
+) -> dict:
+	"""Make a throttled, retried GET request, like `nwsc.api.api_request.api_request`
+
+	The rate limiter is shared with the synchronous API by default, so requests made
+	from threads and from tasks count against the same per-host budget.
+
+	When `coalesce` is True, concurrent calls for the same URL on the same session and
+	event loop await a single task and share its result, which must be treated as
+	read-only.
+	Cancelling one caller doesn't cancel the request for the others.
+	"""
+	if not coalesce:
+		return await _api_request(session, url, timeout, rate_limiter, retry_policy)
+
+	key = (id(asyncio.get_running_loop()), id(session), url)
+	task = _flights.get(key)
+	if task is None:
+		task = asyncio.ensure_future(
+			_api_request(session, url, timeout, rate_limiter, retry_policy))
+		_flights[key] = task
+		task.add_done_callback(lambda task: _forget_flight(key, task))
+	else:
+		logger.debug(f'Waiting for in-flight request to {url}')
+	return await asyncio.shield(task)
+
+
+# alerts
+async def get_alerts(session: ClientSession) -> List[Alert]:
+	alerts = await api_request(session, NWS_API_ALERTS)
+	response = alerts.get('response')
+	retrieved_at = alerts.get('retrieved_at')
+	return process_alert_data(response, retrieved_at)
+
+
+async def get_alerts_by_area(session: ClientSession, area: str) -> List[Alert]:
+	alerts = await api_request(session, NWS_API_ALERTS_AREA + area)
+	response = alerts.get('response')
+	retrieved_at = alerts.get('retrieved_at')
+	return process_alert_data(response, retrieved_at)
+
+
+async def get_alerts_by_zone(session: ClientSession, zone: str) -> List[Alert]:
+	alerts = await api_request(session, NWS_API_ALERTS_ZONE + zone)
+	response = alerts.get('response')
+	retrieved_at = alerts.get('retrieved_at')
+	return process_alert_data(response, retrieved_at)
+
+
+async def get_alerts_by_region(session: ClientSession, region: str) -> List[Alert]:
+	alerts = await api_request(session, NWS_API_ALERTS_REGION + region)
+	response = alerts.get('response')
+	retrieved_at = alerts.get('retrieved_at')
+	return process_alert_data(response, retrieved_at)
+
+
+async def get_alerts_by_id(session: ClientSession, alert_id: str) -> List[Alert]:
+	alerts = await api_request(session, NWS_API_ALERTS + alert_id)
+	response = alerts.get('response')
+	retrieved_at = alerts.get('retrieved_at')
+	return process_alert_data({'features': [response]}, retrieved_at)
+
+
+async def get_alert_types(session: ClientSession) -> List[str]:
+	alert_types_data = await api_request(session, NWS_API_ALERT_TYPES)
+	return alert_types_data.get('response').get('eventTypes')
+
+
+async def get_alert_counts(session: ClientSession) -> AlertCounts:
+	alert_counts_data = await api_request(session, NWS_API_ALERT_COUNTS)
+	response = alert_counts_data.get('response')
+	retrieved_at = alert_counts_data.get('retrieved_at')
+	return process_alert_counts_data(response, retrieved_at)
+
+
+# aviation
+async def get_all_sigmets(session: ClientSession) -> List[SIGMET]:
+	sigmets_data = await api_request(session, NWS_API_AVIATION_SIGMETS)
+	response = sigmets_data.get('response')
+	retrieved_at = sigmets_data.get('retrieved_at')
+	return process_sigmets(response, retrieved_at)
+
+
+async def get_all_atsu_sigmets(session: ClientSession, atsu: str) -> List[SIGMET]:
+	sigmets_data = await api_request(session, NWS_API_AVIATION_SIGMETS + atsu)
+	response = sigmets_data.get('response')
+	retrieved_at = sigmets_data.get('retrieved_at')
+	return process_sigmets(response, retrieved_at)
+
+
+async def get_all_atsu_sigmets_by_date(
+	session: ClientSession,
+	atsu: str,
+	date_str: str
+) -> List[SIGMET]:
+	sigmets_data = await api_request(session, (NWS_API_AVIATION_SIGMETS
+											   + atsu
+											   + f'/{date_str}'))
+	response = sigmets_data.get('response')
+	retrieved_at = sigmets_data.get('retrieved_at')
+	return process_sigmets(response, retrieved_at)
+
+
+async def get_sigmet(
+	session: ClientSession,
+	atsu: str,
+	date_str: str,
+	time_str: str
+) -> SIGMET:
+	sigmet_data = await api_request(session, (NWS_API_AVIATION_SIGMETS
+											  + atsu
+											  + f'/{date_str}/{time_str}'))
+	response = sigmet_data.get('response')
+	retrieved_at = sigmet_data.get('retrieved_at')
+	return process_sigmets(response, retrieved_at)
+
+
+async def get_cwsu(session: ClientSession, cwsu_id: str) -> CentralWeatherServiceUnit:
+	cwsu_data = await api_request(session, NWS_API_AVIATION_CWSU + cwsu_id)
+	response = cwsu_data.get('response')
+	retrieved_at = cwsu_data.get('retrieved_at')
+	return process_cwsu_data(response, retrieved_at)
+
+
+async def get_cwas(
+	session: ClientSession,
+	cwsu_id: str
+) -> List[CenterWeatherAdvisory]:
+	cwas_data = await api_request(session, NWS_API_AVIATION_CWSU + cwsu_id + '/cwas')
+	response = cwas_data.get('response')
+	retrieved_at = cwas_data.get('retrieved_at')
+	cwas = []
+	for feature in response.get('features', {}):
+		cwas.append(process_cwa_data(feature, retrieved_at))
+	return cwas
+
+
+async def get_cwa(
+	session: ClientSession,
+	cwsu_id: str,
+	date_str: str,
+	sequence: int
+) -> CenterWeatherAdvisory:
+	cwa_data = await api_request(session, (NWS_API_AVIATION_CWSU
+										   + cwsu_id
+										   + f'/cwas/{date_str}/{sequence}'))
+	response = cwa_data.get('response')
+	retrieved_at = cwa_data.get('retrieved_at')
+	return process_cwa_data(response, retrieved_at)
+
+
+# enums
+async def get_valid_zones(session: ClientSession) -> list:
+	enum_data = await api_request(session, NWS_API_ZONES + 'DEADBEEF')
+	response = enum_data.get('response')
+	parameter_errors = response.get('parameterErrors', {})
+	failure_message = Template(FAILED_TO_GET_ENUM_MESSAGE).substitute(enum_type='zones')
+	return process_error_response(parameter_errors, failure_message)
+
+
+async def get_valid_forecast_offices(session: ClientSession) -> list:
+	enum_data = await api_request(session, NWS_API_OFFICES + 'DEADBEEF')
+	response = enum_data.get('response')
+	parameter_errors = response.get('parameterErrors', {})
+	failure_message = (
+		Template(FAILED_TO_GET_ENUM_MESSAGE).substitute(enum_type='forecast offices')
+	)
+	return process_error_response(parameter_errors, failure_message)
+
+
+# glossary
+async def get_glossary(session: ClientSession) -> dict:
+	glossary_data = await api_request(session, NWS_API_GLOSSARY)
+	response = glossary_data.get('response')
+	return process_glossary_data(response)
+
+
+# location
+async def uscb_geocode(
+	session: ClientSession,
+	address: str
+) -> Tuple[float, float] | None:
+	coord_data = await api_request(session, (USCB_API_GEOCODE
+											 + address.replace(' ', '+')))
+	response = coord_data.get('response')
+	return process_geocode_data(response, address)
+
+
+async def get_location(session: ClientSession, address: str) -> Location:
+	coords = await uscb_geocode(session, address)
+	coords_str = f'{coords[0]},{coords[1]}'
+	location_data = await api_request(session, NWS_API_POINTS + coords_str)
+	response = location_data.get('response')
+	return process_location_data(response)
+
+
+# offices
+async def get_office_headlines(
+	session: ClientSession,
+	office_id: str
+) -> List[OfficeHeadline]:
+	if office_id not in VALID_NWS_FORECAST_OFFICES:
+		raise InvalidOfficeException
+	headlines_data = await api_request(session, (NWS_API_OFFICES
+												 + office_id
+												 + '/headlines'))
+	response = headlines_data.get('response')
+	retrieved_at = headlines_data.get('retrieved_at')
+	headlines = []
+	for headline in response.get('@graph', {}):
+		headlines.append(process_headline_data(headline, retrieved_at, office_id))
+	return headlines
+
+
+async def get_office_headline(
+	session: ClientSession,
+	office_id: str,
+	headline_id: str
+) -> OfficeHeadline:
+	if office_id not in VALID_NWS_FORECAST_OFFICES:
+		raise InvalidOfficeException
+	headline_data = await api_request(session, (NWS_API_OFFICES
+												+ office_id
+												+ '/headlines/'
+												+ headline_id))
+	response = headline_data.get('response')
+	retrieved_at = headline_data.get('retrieved_at')
+	return process_headline_data(response, retrieved_at, office_id)
+
+
+async def get_office(session: ClientSession, office_id: str) -> Office:
+	if office_id not in VALID_NWS_FORECAST_OFFICES:
+		raise InvalidOfficeException
+	office_data = await api_request(session, NWS_API_OFFICES + office_id)
+	response = office_data.get('response')
+	retrieved_at = office_data.get('retrieved_at')
+	return process_office_data(response, retrieved_at)
+
+
+# products
+async def get_product_types(session: ClientSession) -> List[ProductType]:
+	product_types_data = await api_request(session, NWS_API_PRODUCT_TYPES)
+	return process_product_types_data(product_types_data.get('response'))
+
+
+async def get_product_types_by_location(
+	session: ClientSession,
+	location_id: str
+) -> List[ProductType]:
+	product_types_data = await api_request(session, (NWS_API_PRODUCT_LOCATIONS
+													 + f'/{location_id}/types'))
+	return process_product_types_data(product_types_data.get('response'))
+
+
+async def get_product_locations(session: ClientSession) -> List[ProductLocation]:
+	product_locations_data = await api_request(session, NWS_API_PRODUCT_LOCATIONS)
+	return process_product_locations_data(product_locations_data.get('response'))
+
+
+async def get_product_locations_by_type(
+	session: ClientSession,
+	type_id: str
+) -> List[ProductLocation]:
+	product_locations_data = await api_request(session, (NWS_API_PRODUCT_TYPES
+														 + f'/{type_id}/locations'))
+	return process_product_locations_data(product_locations_data.get('response'))
+
+
+async def get_products(session: ClientSession) -> List[Product]:
+	products_data = await api_request(session, NWS_API_PRODUCTS)
+	response = products_data.get('response')
+	retrieved_at = products_data.get('retrieved_at')
+	return process_product_data(response.get('@graph', {}), retrieved_at)
+
+
+async def get_products_by_type(session: ClientSession, type_id: str) -> List[Product]:
+	products_data = await api_request(session, NWS_API_PRODUCT_TYPES + f'/{type_id}')
+	response = products_data.get('response')
+	retrieved_at = products_data.get('retrieved_at')
+	return process_product_data(response.get('@graph', {}), retrieved_at)
+
+
+async def get_products_by_type_and_location(
+	session: ClientSession,
+	type_id: str,
+	location_id: str
+) -> List[Product]:
+	products_data = await api_request(session, (NWS_API_PRODUCT_TYPES
+												+ f'/{type_id}/locations/{location_id}'))
+	response = products_data.get('response')
+	retrieved_at = products_data.get('retrieved_at')
+	return process_product_data(response.get('@graph', {}), retrieved_at)
+
+
+async def get_product(session: ClientSession, product_id: str) -> Product:
+	product_data = await api_request(session, NWS_API_PRODUCTS + product_id)
+	response = product_data.get('response')
+	retrieved_at = product_data.get('retrieved_at')
+	product = process_product_data([response], retrieved_at)[0]
+	product.text = response.get('productText')
+	return product
+
+
+# radar
+async def get_radar_station_alarms(
+	session: ClientSession,
+	radar_station_id: str
+) -> List[RadarStationAlarm]:
+	radar_alarm_data = await api_request(session, (NWS_API_RADAR_STATIONS
+												   + radar_station_id
+												   + '/alarms'))
+	response = radar_alarm_data.get('response')
+	retrieved_at = radar_alarm_data.get('retrieved_at')
+	return process_radar_station_alarms_data(response, retrieved_at)
+
+
+async def get_radar_stations(session: ClientSession) -> List[RadarStation]:
+	radar_stations_data = await api_request(session, NWS_API_RADAR_STATIONS)
+	response = radar_stations_data.get('response')
+	retrieved_at = radar_stations_data.get('retrieved_at')
+	stations = []
+	for feature in response.get('features', {}):
+		stations.append(process_radar_station_data(feature, retrieved_at))
+	return stations
+
+
+async def get_radar_station(session: ClientSession, station_id: str) -> RadarStation:
+	radar_station_data = await api_request(session, NWS_API_RADAR_STATIONS + station_id)
+	response = radar_station_data.get('response')
+	retrieved_at = radar_station_data.get('retrieved_at')
+	return process_radar_station_data(response, retrieved_at)
+
+
+async def get_radar_servers(session: ClientSession) -> List[RadarServer]:
+	radar_servers_data = await api_request(session, NWS_API_RADAR_SERVERS)
+	response = radar_servers_data.get('response')
+	retrieved_at = radar_servers_data.get('retrieved_at')
+	servers = []
+	for feature in response.get('@graph', {}):
+		servers.append(process_radar_server_data(feature, retrieved_at))
+	return servers
+
+
+async def get_radar_server(session: ClientSession, server_id: str) -> RadarServer:
+	radar_server_data = await api_request(session, NWS_API_RADAR_SERVERS + server_id)
+	response = radar_server_data.get('response')
+	retrieved_at = radar_server_data.get('retrieved_at')
+	return process_radar_server_data(response, retrieved_at)
+
+
+async def get_radar_queue(
+	session: ClientSession,
+	ldm_host: str,
+	station_id: str
+) -> List[RadarQueueItem]:
+	radar_queue_data = await api_request(session, (NWS_API_RADAR_QUEUES
+												   + ldm_host
+												   + f'?station={station_id}'))
+	response = radar_queue_data.get('response')
+	retrieved_at = radar_queue_data.get('retrieved_at')
+	return process_radar_queue_data(response, retrieved_at, station_id)
+
+
+# stations
+async def get_station(session: ClientSession, station_id: str) -> Station:
+	station_data = await api_request(session, NWS_API_STATIONS + station_id)
+	response = station_data.get('response')
+	retrieved_at = station_data.get('retrieved_at')
+	return process_station_data(response, retrieved_at)
+
+
+async def get_stations(session: ClientSession, url: str) -> List[Station]:
+	stations_data = await api_request(session, url)
+	response = stations_data.get('response')
+	retrieved_at = stations_data.get('retrieved_at')
+	stations = []
+	for feature in response.get('features', {}):
+		stations.append(process_station_data(feature, retrieved_at))
+	return stations
+
+
+async def get_stations_by_grid(
+	session: ClientSession,
+	forecast_office: str,
+	gridpoints: str
+) -> List[Station]:
+	return await get_stations(session, (NWS_API_GRIDPOINTS
+										+ f'/{forecast_office}/{gridpoints}/stations'))
+
+
+async def get_stations_near_location(
+	session: ClientSession,
+	location: Location
+) -> List[Station]:
+	return await get_stations(session, location.observation_stations_url)
+
+
+# weather
+async def get_all_observations(
+	session: ClientSession,
+	station_id: str
+) -> List[Observation]:
+	observations_data = await api_request(session, (NWS_API_STATIONS
+													+ station_id
+													+ '/observations'))
+	response = observations_data.get('response')
+	retrieved_at = observations_data.get('retrieved_at')
+	observations = []
+	for feature in response.get('features', {}):
+		observations.append(process_observations_data(feature, retrieved_at, station_id))
+	return observations
+
+
+async def get_latest_observations(
+	session: ClientSession,
+	station_id: str
+) -> Observation:
+	observations_data = await api_request(session, (NWS_API_STATIONS
+													+ station_id
+													+ '/observations/latest'))
+	response = observations_data.get('response')
+	retrieved_at = observations_data.get('retrieved_at')
+	return process_observations_data(response, retrieved_at, station_id)
+
+
+async def get_observations_at_time(
+	session: ClientSession,
+	station_id: str,
+	timestamp: str
+) -> Observation:
+	observations_data = await api_request(session, (NWS_API_STATIONS
+													+ station_id
+													+ '/observations/'
+													+ timestamp))
+	response = observations_data.get('response')
+	retrieved_at = observations_data.get('retrieved_at')
+	return process_observations_data(response, retrieved_at, station_id)
+
+
+async def get_extended_forecast(session: ClientSession, location: Location) -> Forecast:
+	forecast_data = await api_request(session, location.forecast_extended_url)
+	response = forecast_data.get('response')
+	retrieved_at = forecast_data.get('retrieved_at')
+	return process_forecast_data(response, retrieved_at, location)
+
+
+async def get_hourly_forecast(session: ClientSession, location: Location) -> Forecast:
+	forecast_data = await api_request(session, location.forecast_hourly_url)
+	response = forecast_data.get('response')
+	retrieved_at = forecast_data.get('retrieved_at')
+	return process_forecast_data(response, retrieved_at, location)
+
+
+# zones
+async def get_zone(session: ClientSession, zone_type: str, zone_id: str) -> Zone:
+	if zone_type not in VALID_NWS_ZONES:
+		raise ValueError((
+			f'Invalid zone type provided: {zone_type}. '
+			f'Valid zones are: {", ".join(VALID_NWS_ZONES)}'))
+	zone_data = await api_request(session, NWS_API_ZONES + f'/{zone_type}/{zone_id}')
+	response = zone_data.get('response')
+	retrieved_at = zone_data.get('retrieved_at')
+	return process_zone_data(response, retrieved_at)
+
+
+async def get_zones(session: ClientSession, zone_type: str = None) -> List[Zone]:
+	if zone_type:
+		zones_data = await api_request(session, NWS_API_ZONES + f'/{zone_type}')
+	else:
+		zones_data = await api_request(session, NWS_API_ZONES)
+	response = zones_data.get('response')
+	retrieved_at = zones_data.get('retrieved_at')
+	zones = []
+	for feature in response.get('features', {}):
+		zones.append(process_zone_data(feature, retrieved_at))
+	return zones
+
+
+async def get_zone_stations(session: ClientSession, zone_id: str) -> List[Station]:
+	zone_stations_data = await api_request(session, (NWS_API_ZONE_FORECASTS
+													 + f'{zone_id}/stations'))
+	response = zone_stations_data.get('response')
+	retrieved_at = zone_stations_data.get('retrieved_at')
+	zone_stations = []
+	for feature in response.get('features', {}):
+		zone_stations.append(process_station_data(feature, retrieved_at))
+	return zone_stations
+
+
+async def get_zone_observations(
+	session: ClientSession,
+	zone_id: str
+) -> List[Observation]:
+	zone_observations_data = await api_request(session, (NWS_API_ZONE_FORECASTS
+														 + f'{zone_id}/observations'))
+	response = zone_observations_data.get('response')
+	retrieved_at = zone_observations_data.get('retrieved_at')
+	zone_observations = []
+	for feature in response.get('features', {}):
+		zone_observations.append(process_observations_data(feature,
+														   retrieved_at,
+														   zone_id))
+	return zone_observations
+
+
+async def get_zone_forecast(session: ClientSession, zone_id: str) -> ZoneForecast:
+	zone_forecast_data = await api_request(session, (NWS_API_ZONE_FORECASTS
+													 + f'{zone_id}/forecast'))
+	response = zone_forecast_data.get('response')
+	retrieved_at = zone_forecast_data.get('retrieved_at')
+	return process_zone_forecast_data(response, retrieved_at, zone_id)
@@ -1,22 +1,347 @@
+import time
 import pytz
-from datetime import datetime
+import logging
+import threading
+import requests
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterator
+from urllib.parse import urlencode
 from requests_cache import CachedSession
+from nwsc.api.json_codec import loads
+from nwsc.api.rate_limit import (
+	RateLimiter,
+	RetryPolicy,
+	DEFAULT_RATE_LIMITER,
+	DEFAULT_RETRY_POLICY,
+)
+logger = logging.getLogger(__name__)
 
+try:
+	import ijson
+except ImportError:
+	ijson = None
 
-def api_request(
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5, 30)
+# The largest `limit` accepted by paginated NWS endpoints
+MAX_PAGE_SIZE = 500
+# The number of bytes to feed to the incremental JSON parser at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+# The timezone that parsed timestamps are converted to, unless configured otherwise
+DEFAULT_OUTPUT_TIMEZONE = 'US/Eastern'
+# NWS responses repeat the same few issuance, effective and expiration times across
+# many records, so even a small cache of parsed timestamps gets a high hit rate
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+class _Flight:
+	"""A request that is in progress, and its eventual result or exception"""
+
+	def __init__(self):
+		self.done = threading.Event()
+		self.result = None
+		self.error = None
+
+
+_flights: dict = {}
+_flights_lock = threading.Lock()
+
+
+def is_cached(session: CachedSession, url: str) -> bool:
+	"""Whether a fresh response for `url` can be served from the session's cache
+
+	Expired responses don't count, since requesting them still goes to the network
+	to revalidate or replace them.
+	"""
+	cache = getattr(session, 'cache', None)
+	if cache is None:
+		return False
+	try:
+		response = cache.get_response(cache.create_key(requests.Request('GET', url)))
+	except Exception:
+		return False
+	return response is not None and not response.is_expired
+
+
+def send_request(
+	session: CachedSession,
+	url: str,
+	timeout: float | tuple = DEFAULT_TIMEOUT,
+	rate_limiter: RateLimiter | None = DEFAULT_RATE_LIMITER,
+	retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+	**kwargs
+) -> requests.Response:
+	"""Make a GET request, throttled by `rate_limiter` and retried by `retry_policy`
+
+	Requests that can be answered from the cache without going to the network aren't
+	throttled. If the server asks
+	the client to slow down with a `Retry-After` header, every request to that host
+	is paused, not just this one. If all retries fail, the last response is returned
+	so that callers can still inspect the error body.
+
+	:param timeout: Passed to `requests`, either seconds or a (connect, read) tuple
+	:param rate_limiter: The rate limiter to use, or None to disable throttling
+	:param retry_policy: The retry policy to use, or None to disable retries
+	:param kwargs: Any additional keyword arguments are passed to `session.get`
+	"""
+	attempt = 0
+	while True:
+		if rate_limiter and not is_cached(session, url):
+			rate_limiter.acquire(url)
+		try:
+			response = session.get(url, timeout=timeout, **kwargs)
+		except (requests.ConnectionError, requests.Timeout) as e:
+			if not retry_policy or not retry_policy.should_retry(attempt):
+				raise
+			delay = retry_policy.get_delay(attempt)
+			logger.warning(f'Request to {url} failed ({e}), retrying in {delay:.2f}s')
+		else:
+			if not retry_policy or not retry_policy.should_retry(attempt, response.status_code):
+				return response
+			retry_after = response.headers.get('Retry-After')
+			delay = retry_policy.get_delay(attempt, retry_after)
+			if rate_limiter and retry_after:
+				rate_limiter.pause(url, delay)
+			logger.warning((
+				f'Request to {url} returned HTTP {response.status_code}, '
+				f'retrying in {delay:.2f}s'))
+			# Release the connection back to the pool, since streamed responses
+			# hold on to it until they're read or closed
+			response.close()
+		time.sleep(delay)
+		attempt += 1
+
+
+def _api_request(
 	session: CachedSession,
-	url: str
+	url: str,
+	timeout: float | tuple,
+	rate_limiter: RateLimiter | None,
+	retry_policy: RetryPolicy | None
 ) -> dict:
-	response = session.get(url)
-	data = response.json()
+	response = send_request(session, url, timeout, rate_limiter, retry_policy)
+	data = loads(response.content)
 	created_at = response.created_at
 	return {'response': data, 'retrieved_at': created_at}
 
 
+def api_request(
+	session: CachedSession,
+	url: str,
+	timeout: float | tuple = DEFAULT_TIMEOUT,
+	rate_limiter: RateLimiter | None = DEFAULT_RATE_LIMITER,
+	retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+	coalesce: bool = True
+) -> dict:
+	"""Get a URL and return its parsed JSON and retrieval time
+
+	When `coalesce` is True, concurrent calls for the same URL on the same session
+	share a single request: the first caller makes it, and every other caller waits
+	for it and gets the same result (or exception). The shared result must be treated
+	as read-only.
+	"""
+	if not coalesce:
+		return _api_request(session, url, timeout, rate_limiter, retry_policy)
+
+	key = (id(session), url)
+	with _flights_lock:
+		flight = _flights.get(key)
+		is_leader = flight is None
+		if is_leader:
+			flight = _Flight()
+			_flights[key] = flight
+
+	if not is_leader:
+		logger.debug(f'Waiting for in-flight request to {url}')
+		flight.done.wait()
+		if flight.error is not None:
+			raise flight.error
+		return flight.result
+
+	try:
+		flight.result = _api_request(session, url, timeout, rate_limiter, retry_policy)
+	except BaseException as e:
+		flight.error = e
+		raise
+	finally:
+		with _flights_lock:
+			del _flights[key]
+		flight.done.set()
+	return flight.result
+
+
+def _iter_prefix(data, keys: list) -> Iterator:
+	"""Walk already-parsed JSON the same way an ijson prefix does"""
+	if not keys:
+		yield data
+		return
+	key, *rest = keys
+	if key == 'item':
+		for item in data or []:
+			yield from _iter_prefix(item, rest)
+	elif isinstance(data, dict):
+		yield from _iter_prefix(data.get(key), rest)
+
+
+def _iter_json_items(response: requests.Response, prefix: str) -> Iterator:
+	try:
+		if ijson is None:
+			yield from _iter_prefix(loads(response.content), prefix.split('.'))
+			return
+		items = ijson.sendable_list()
+		parser = ijson.items_coro(items, prefix, use_float=True)
+		for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+			parser.send(chunk)
+			yield from items
+			del items[:]
+		parser.close()
+		yield from items
+	finally:
+		response.close()
+
+
+def api_request_stream(
+	session: CachedSession,
+	url: str,
+	prefix: str,
+	timeout: float | tuple = DEFAULT_TIMEOUT,
+	rate_limiter: RateLimiter | None = DEFAULT_RATE_LIMITER,
+	retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY
+) -> dict:
+	"""Get a URL and incrementally parse the items of one array in the response
+
+	Instead of building the whole document as Python objects, the body is fed to an
+	ijson parser chunk by chunk and each element of the array at `prefix` is yielded
+	as soon as it has been parsed, so the parsed items never all have to be in memory
+	at once. If ijson isn't installed, the response is parsed in one go and the same
+	items are yielded.
+
+	Only the parsing is incremental with a `CachedSession`: requests-cache reads the
+	whole body so it can cache it, so the raw response is still held in memory and
+	downloaded before the first item is yielded. Pass a plain `requests.Session` to
+	stream the body from the network as well, without caching it.
+
+	Streamed requests aren't coalesced, because their items can only be consumed once.
+
+	:param prefix: An ijson prefix for the items, like 'features.item' for GeoJSON
+		or '@graph.item' for JSON-LD collections
+	:returns: A dict like `api_request`, where 'response' is an iterator of items
+	"""
+	response = send_request(session,
+							url,
+							timeout,
+							rate_limiter,
+							retry_policy,
+							stream=True)
+	return {
+		'response': _iter_json_items(response, prefix),
+		# Responses from a plain requests.Session have no created_at
+		'retrieved_at': getattr(response, 'created_at', None) or datetime.now(timezone.utc),
+	}
+
+
+_output_timezone_name = DEFAULT_OUTPUT_TIMEZONE
+
+
+@lru_cache(maxsize=None)
+def get_timezone(name: str) -> tzinfo:
+	"""Get a timezone by name, only looking it up the first time"""
+	return pytz.timezone(name)
+
+
+def get_output_timezone() -> str:
+	return _output_timezone_name
+
+
+def set_output_timezone(name: str):
+	"""Set the timezone that `parse_timestamp` converts timestamps to
+
+	:param name: An IANA timezone name, like 'UTC' or 'America/Chicago'
+	:raises pytz.UnknownTimeZoneError: If the timezone doesn't exist
+	"""
+	global _output_timezone_name
+	get_timezone(name)
+	_output_timezone_name = name
+	logger.debug(f'Set output timezone to {name}')
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_timestamp(timestamp: str, timezone_name: str) -> datetime:
+	return (
+		datetime.fromisoformat(timestamp)
+				.astimezone(get_timezone(timezone_name))
+				.replace(tzinfo=None)
+	)
+
+
 def parse_timestamp(timestamp: str) -> datetime | None:
+	"""Parse an ISO 8601 timestamp into a naive datetime in the output timezone
+
+	Results are cached, so repeated timestamps are only parsed once. The cached
+	datetimes are immutable, so sharing them between records is safe.
+	"""
 	if timestamp:
-		return (
-			datetime.fromisoformat(timestamp)
-					.astimezone(pytz.timezone('US/Eastern'))
-					.replace(tzinfo=None)
-		)
\ No newline at end of file
+		return _parse_timestamp(timestamp, _output_timezone_name)
+
+
+def format_timestamp(timestamp: datetime | None) -> str | None:
+	"""Format a timestamp for use as an NWS API query parameter
+
+	Naive timestamps are assumed to be in the same timezone as the timestamps
+	returned by `parse_timestamp`.
+	"""
+	if timestamp is None:
+		return None
+	if timestamp.tzinfo is None:
+		timestamp = get_timezone(_output_timezone_name).localize(timestamp)
+	return timestamp.isoformat(timespec='seconds')
+
+
+def build_url(url: str, **params) -> str:
+	"""Append the given query parameters to `url`, skipping any that are None"""
+	params = {key: value for key, value in params.items() if value is not None}
+	if not params:
+		return url
+	return url + '?' + urlencode(params, safe=':')
+
+
+def get_page_size(limit: int | None) -> int | None:
+	"""Request no more items per page than the caller wants in total"""
+	if limit is None:
+		return None
+	return min(limit, MAX_PAGE_SIZE)
+
+
+def iter_pages(
+	session: CachedSession,
+	url: str,
+	max_pages: int | None = None
+) -> Iterator[dict]:
+	"""Get every page of a paginated NWS API collection
+
+	Pages are requested one at a time as the generator is consumed, by following the
+	`pagination.next` cursor of each response, so only one page is held in memory.
+	Iteration stops when a page has no next cursor, when a cursor repeats, or when a
+	page is empty (NWS keeps returning a next cursor after the last page).
+
+	:param max_pages: The maximum number of pages to get, or None for all of them
+	:returns: An iterator of `api_request` results
+	"""
+	seen_urls = set()
+	num_pages = 0
+	while url and url not in seen_urls:
+		if max_pages is not None and num_pages >= max_pages:
+			return
+		seen_urls.add(url)
+		page = api_request(session, url)
+		num_pages += 1
+		response = page.get('response') or {}
+		if not response.get('features') and not response.get('@graph'):
+			return
+		yield page
+		next_url = (response.get('pagination') or {}).get('next')
+		logger.debug(f'Got page {num_pages} from {url}, next page is {next_url}')
+		url = next_url
+
@@ -2,145 +2,181 @@
 """
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Sequence
+if TYPE_CHECKING:
+	import numpy as np
 logger = logging.getLogger(__name__)
 
 
-def convert_temperatures(data: dict) -> dict:
-	"""Ensure that temperatures are represented in both metric and imperial"""
-	new_data = {}
-	for field, value in data.items():
-		new_data[field] = value
-		if field[-2:] == '_c':
-			field_f = f'{field[:-2]}_f'
-			if field_f not in data:
-				new_data[field_f] = None
-				if value:
-					new_data[field_f] = (value * 9/5) + 32
-		if field[-2:] == '_f':
-			field_c = f'{field[:-2]}_c'
-			if field_c not in data:
-				new_data[field_c] = None
-				if value:
-					new_data[field_c] = (value - 32) * 5/9
-	return new_data
-
-
-def convert_speeds(data: dict) -> dict:
-	"""Ensure that speeds are represented in both metric and imperial"""
-	new_data = {}
-	for field, value in data.items():
-		new_data[field] = value
-		if field[-4:] == '_kmh':
-			field_mph = f'{field[:-4]}_mph'
-			if field_mph not in data:
-				new_data[field_mph] = None
-				if value:
-					new_data[field_mph] = value / 1.609344
-		if field[-4:] == '_mph':
-			field_kmph = f'{field[:-4]}_kmh'
-			if field_kmph not in data:
-				new_data[field_kmph] = None
-				if value:
-					new_data[field_kmph] = value * 1.609344
-	return new_data
-
-
-def convert_distances(data: dict) -> dict:
-	"""Ensure that distances are represented in both metric and imperial"""
-	new_data = {}
-	for field, value in data.items():
-		new_data[field] = value
-		if field[-2:] == '_m':
-			field_miles = f'{field[:-2]}_mi'
-			if field_miles not in data:
-				new_data[field_miles] = None
-				if value:
-					new_data[field_miles] = value / 1609.344
-		if field[-3:] == '_mi':
-			field_meters = f'{field[:-3]}_m'
-			if field_meters not in data:
-				new_data[field_miles] = None
-				if value:
-					new_data[field_meters] = value * 1609.344
-	return new_data
-
-
-def convert_pressures(data: dict) -> dict:
-	"""Ensure that pressures are represented in both metric and imperial"""
-	new_data = {}
-	for field, value in data.items():
-		new_data[field] = value
-		if field[-3:] == '_pa':
-			field_inhg = f'{field[:-3]}_inhg'
-			if field_inhg not in data:
-				new_data[field_inhg] = None
-				if value:
-					new_data[field_inhg] = value / 3386.39
-		if field[-5:] == '_inhg':
-			field_pa = f'{field[:-5]}_pa'
-			if field_pa not in data:
-				if value:
-					new_data[field_pa] = value * 3386.39
-	return new_data
-
-
-# See: http://tamivox.org/dave/compass/
+# Each unit suffix that has an equivalent in the other measurement system, mapped to
+# the suffix of that equivalent and the function that converts to it
+UNIT_CONVERSIONS = {
+	'_c':		('_f',		lambda value: (value * 9/5) + 32),
+	'_f':		('_c',		lambda value: (value - 32) * 5/9),
+	'_kmh':		('_mph',	lambda value: value / 1.609344),
+	'_mph':		('_kmh',	lambda value: value * 1.609344),
+	'_m':		('_mi',		lambda value: value / 1609.344),
+	'_mi':		('_m',		lambda value: value * 1609.344),
+	'_pa':		('_inhg',	lambda value: value / 3386.39),
+	'_inhg':	('_pa',		lambda value: value * 3386.39),
+}
+
+
+@lru_cache(maxsize=256)
+def get_conversion_plan(fields: tuple) -> tuple:
+	"""Work out which fields need to be derived from which, for a set of field names
+
+	A plan only depends on the field names, and every record parsed from the same
+	kind of response has the same names, so plans are cached and each one is only
+	worked out once.
+
+	:param fields: The field names of a record, in order
+	:returns: A tuple of `(source_field, derived_field, convert)` tuples
+	"""
+	field_set = set(fields)
+	plan = []
+	for field in fields:
+		for suffix, (derived_suffix, convert) in UNIT_CONVERSIONS.items():
+			if field.endswith(suffix):
+				derived_field = field[:-len(suffix)] + derived_suffix
+				if derived_field not in field_set:
+					plan.append((field, derived_field, convert))
+				break
+	return tuple(plan)
+
+
+# See:
+# - http://tamivox.org/dave/compass/
+# - https://en.wikipedia.org/wiki/Points_of_the_compass
+COMPASS_POINTS = {
+	8:	('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'),
+	16:	('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+		 'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW'),
+	32:	('N', 'NbE', 'NNE', 'NEbN', 'NE', 'NEbE', 'ENE', 'EbN',
+		 'E', 'EbS', 'ESE', 'SEbE', 'SE', 'SEbS', 'SSE', 'SbE',
+		 'S', 'SbW', 'SSW', 'SWbS', 'SW', 'SWbW', 'WSW', 'WbS',
+		 'W', 'WbN', 'WNW', 'NWbW', 'NW', 'NWbN', 'NNW', 'NbW'),
+}
+
+
+def _get_compass_points(points: int) -> tuple:
+	if points not in COMPASS_POINTS:
+		raise ValueError((
+			f'Invalid number of compass points: {points}. '
+			f'Valid values are: {", ".join(str(p) for p in COMPASS_POINTS)}'))
+	return COMPASS_POINTS[points]
+
+
+def compass_direction(degrees: float | None, points: int = 16) -> str | None:
+	"""Label a direction in degrees with the nearest point of the compass
+
+	The compass is divided into `points` equal bins centered on each point, so on a
+	16-point compass N covers [348.75, 11.25) degrees, NNE covers [11.25, 33.75), and
+	so on. Any angle is accepted and is wrapped into the 0-360 range first.
+
+	:param degrees: The direction, or None if it's missing
+	:param points: The resolution of the compass: 8, 16, or 32 points
+	:returns: The label of the point, or None if `degrees` is None or NaN
+	"""
+	labels = _get_compass_points(points)
+	if degrees is None or degrees != degrees:
+		return None
+	return labels[int(degrees % 360 * points / 360 + 0.5) % points]
+
+
+@lru_cache(maxsize=None)
+def _get_compass_point_array(points: int) -> 'np.ndarray':
+	import numpy as np
+	return np.array(_get_compass_points(points), dtype=object)
+
+
+def compass_directions(degrees, points: int = 16) -> 'np.ndarray':
+	"""Vectorized version of `compass_direction` for an array of directions
+
+	Requires NumPy, which is only imported when this is first called.
+
+	:returns: An object array of labels, with None for missing (NaN) directions
+	"""
+	import numpy as np
+	labels = _get_compass_point_array(points)
+	degrees = np.asarray(degrees, dtype=float)
+	missing = np.isnan(degrees)
+	indexes = (np.floor(np.where(missing, 0, degrees) % 360 * points / 360 + 0.5)
+				 .astype(int) % points)
+	labels = labels[indexes]
+	labels[missing] = None
+	return labels
+
+
 def convert_directions(data: dict) -> dict:
 	"""Add wind direction string on a 16-point compass"""
-	if data.get('wind_direction_deg_ang'):
-		if ((0 <= data['wind_direction_deg_ang'] <= 22.4) or
-	  		data['wind_direction_deg_ang'] == 360):
-			data['wind_direction_compass'] = 'N'
-		elif 22.5 <= data['wind_direction_deg_ang'] <= 44.9:
-			data['wind_direction_compass'] = 'NNE'
-		elif 45 <= data['wind_direction_deg_ang'] <= 67.4:
-			data['wind_direction_compass'] = 'NE'
-		elif 67.5 <= data['wind_direction_deg_ang'] <= 89.9:
-			data['wind_direction_compass'] = 'ENE'
-		elif 90 <= data['wind_direction_deg_ang'] <= 112.4:
-			data['wind_direction_compass'] = 'E'
-		elif 112.5 <= data['wind_direction_deg_ang'] <= 134.9:
-			data['wind_direction_compass'] = 'ESE'
-		elif 135 <= data['wind_direction_deg_ang'] <= 157.4:
-			data['wind_direction_compass'] = 'SE'
-		elif 157.5 <= data['wind_direction_deg_ang'] <= 179.9:
-			data['wind_direction_compass'] = 'SSE'
-		elif 180 <= data['wind_direction_deg_ang'] <= 202.4:
-			data['wind_direction_compass'] = 'S'
-		elif 202.5 <= data['wind_direction_deg_ang'] <= 224.9:
-			data['wind_direction_compass'] = 'SSW'
-		elif 225 <= data['wind_direction_deg_ang'] <= 247.4:
-			data['wind_direction_compass'] = 'SW'
-		elif 247.5 <= data['wind_direction_deg_ang'] <= 269.9:
-			data['wind_direction_compass'] = 'WSW'
-		elif 270 <= data['wind_direction_deg_ang'] <= 292.4:
-			data['wind_direction_compass'] = 'W'
-		elif 292.5 <= data['wind_direction_deg_ang'] <= 314.9:
-			data['wind_direction_compass'] = 'WNW'
-		elif 315 <= data['wind_direction_deg_ang'] <= 337.4:
-			data['wind_direction_compass'] = 'NW'
-		elif 337.5 <= data['wind_direction_deg_ang'] <= 359.9:
-			data['wind_direction_compass'] = 'NNW'
-		else:
-			data['wind_direction_compass'] = None
-	else:
-		if 'wind_direction_deg_ang' in data:
-			data['wind_direction_compass'] = None
+	if 'wind_direction_deg_ang' in data:
+		data['wind_direction_compass'] = compass_direction(data['wind_direction_deg_ang'])
 	return data
 
 
-def round_floats(data: dict) -> dict:
-	for k, v in data.items():
-		if isinstance(v, float):
-			data[k] = round(v, 2)
-	return data
+def convert_measures(data: dict) -> dict:
+	"""Ensure that measurements are represented in both metric and imperial
 
+	For every field with a unit suffix (eg `temperature_c` or `wind_speed_kmh`) whose
+	equivalent in the other system is missing, the equivalent is added (eg
+	`temperature_f` or `wind_speed_mph`), or set to None if the value is missing. A
+	16-point compass direction is added for wind directions, and all floats are
+	rounded to 2 decimal places.
 
-def convert_measures(data: dict) -> dict:
-	data = convert_temperatures(data)
-	data = convert_speeds(data)
-	data = convert_distances(data)
-	data = convert_pressures(data)
-	data = convert_directions(data)
-	data = round_floats(data)
+	`data` is updated in place and returned.
+	"""
+	for field, derived_field, convert in get_conversion_plan(tuple(data)):
+		value = data[field]
+		data[derived_field] = None if value is None else convert(value)
+	convert_directions(data)
+	for field, value in data.items():
+		if isinstance(value, float):
+			data[field] = round(value, 2)
 	return data
+
+
+def _to_column(values: Sequence) -> 'np.ndarray':
+	"""Convert a column to a float array if it only contains numbers and None"""
+	import numpy as np
+	if isinstance(values, np.ndarray) and values.dtype.kind in 'fiu':
+		return values.astype(float)
+	if all(value is None
+		   or (isinstance(value, (int, float)) and not isinstance(value, bool))
+		   for value in values):
+		return np.array(values, dtype=float)
+	return np.array(values, dtype=object)
+
+
+def convert_measures_batch(columns: Dict[str, Sequence]) -> Dict[str, 'np.ndarray']:
+	"""Columnar, vectorized version of `convert_measures`
+
+	Takes the same fields as `convert_measures`, but as columns of many records (eg
+	`{'temperature_c': [...], 'wind_speed_kmh': [...], ...}`), and converts every
+	record at once with NumPy instead of one record at a time.
+
+	Numeric columns are returned as float arrays, with NaN instead of None for
+	missing values. Other columns are returned as object arrays. Requires NumPy,
+	which is only imported when this is first called.
+
+	:param columns: Field names mapped to equal-length sequences or arrays of values
+	:returns: A new dict of all the given columns plus the derived columns
+	"""
+	import numpy as np
+	arrays = {field: _to_column(values) for field, values in columns.items()}
+	lengths = {len(array) for array in arrays.values()}
+	if len(lengths) > 1:
+		raise ValueError(f'All columns must be the same length, got lengths {lengths}')
+	for field, derived_field, convert in get_conversion_plan(tuple(arrays)):
+		array = arrays[field]
+		if array.dtype == object:
+			array = array.astype(float)
+		arrays[derived_field] = convert(array)
+	if 'wind_direction_deg_ang' in arrays:
+		arrays['wind_direction_compass'] = (
+			compass_directions(arrays['wind_direction_deg_ang']))
+	for field, array in arrays.items():
+		if array.dtype.kind == 'f':
+			arrays[field] = np.round(array, 2)
+	return arrays
@@ -0,0 +1,132 @@
+"""Fetch many NWS API endpoints concurrently while respecting their dependencies
+
+Most endpoints are independent of each other, but some need the result of another
+request first (eg the forecast needs the `Location` returned by `get_location`). A
+`FetchPlan` describes these requests as a directed acyclic graph and runs every
+request as soon as all of its dependencies are available, on a bounded pool of worker
+threads. The total time to fetch everything is then roughly the latency of the
+longest chain of dependent requests, instead of the sum of all latencies.
+
+.. code-block:: python
+
+	plan = FetchPlan(max_workers=8)
+	plan.add('location', get_location, session, address)
+	plan.add('forecast', get_extended_forecast, session, depends_on=['location'])
+	plan.add('glossary', get_glossary, session)
+	results = plan.run()
+"""
+
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(kw_only=True)
+class FetchNode:
+	name: str
+	func: Callable
+	args: tuple
+	depends_on: tuple
+
+
+class FetchPlan:
+	"""A dependency graph of API requests that can be run concurrently
+
+	:param max_workers: The maximum number of requests to run at the same time
+	"""
+
+	def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+		self.max_workers = max_workers
+		self.nodes: Dict[str, FetchNode] = {}
+
+	def add(
+		self,
+		name: str,
+		func: Callable,
+		*args,
+		depends_on: Iterable[str] = ()
+	) -> 'FetchPlan':
+		"""Add a request to the plan
+
+		The request is made by calling `func(*args, *results)`, where `results` are the
+		results of the requests named in `depends_on`, in the same order.
+
+		Functions decorated with `display_spinner` are unwrapped first, because Rich
+		can only show one live display at a time and the requests run in parallel.
+
+		:param name: A unique name for the request, used as its key in the results
+		:param func: The function that makes the request
+		:param args: Positional arguments to pass to `func`
+		:param depends_on: The names of requests whose results are needed by `func`
+		:returns: The plan itself, so that calls can be chained
+		"""
+		if name in self.nodes:
+			raise ValueError(f'A request named "{name}" is already in the fetch plan')
+		self.nodes[name] = FetchNode(name=name,
+									 func=inspect.unwrap(func),
+									 args=args,
+									 depends_on=tuple(depends_on))
+		return self
+
+	def _validate(self):
+		"""Ensure that every dependency exists and that the graph has no cycles"""
+		for node in self.nodes.values():
+			for dependency in node.depends_on:
+				if dependency not in self.nodes:
+					raise ValueError((
+						f'Request "{node.name}" depends on "{dependency}", which is not '
+						'in the fetch plan'))
+
+		# Kahn's algorithm: if some nodes can never be resolved, they form a cycle
+		resolved = set()
+		unresolved = dict(self.nodes)
+		while unresolved:
+			ready = [name for name, node in unresolved.items()
+					 if all(dep in resolved for dep in node.depends_on)]
+			if not ready:
+				raise ValueError((
+					'The fetch plan contains a dependency cycle between: '
+					f'{", ".join(sorted(unresolved))}'))
+			for name in ready:
+				resolved.add(name)
+				del unresolved[name]
+
+	def run(self) -> Dict[str, Any]:
+		"""Run every request in the plan and return the results keyed by name
+
+		If any request raises an exception, requests that haven't started yet are
+		cancelled and the exception is re-raised.
+		"""
+		self._validate()
+		results = {}
+		pending = dict(self.nodes)
+		running: Dict[Future, str] = {}
+		with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+			while pending or running:
+				ready: List[FetchNode] = [node for node in pending.values()
+										  if all(dep in results for dep in node.depends_on)]
+				for node in ready:
+					del pending[node.name]
+					dependency_results = [results[dep] for dep in node.depends_on]
+					future = executor.submit(node.func, *node.args, *dependency_results)
+					running[future] = node.name
+					logger.debug(f'Started request "{node.name}"')
+
+				done, _ = wait(running, return_when=FIRST_COMPLETED)
+				for future in done:
+					name = running.pop(future)
+					try:
+						results[name] = future.result()
+					except Exception:
+						for other_future in running:
+							other_future.cancel()
+						logger.error(f'Request "{name}" failed, cancelling the fetch plan')
+						raise
+					logger.debug(f'Finished request "{name}"')
+		return results
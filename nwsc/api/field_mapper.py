@@ -0,0 +1,97 @@
+"""Compile declarative field maps into fast extractor functions
+
+NWS API responses are deeply nested, and most `process_*` functions need dozens of
+values from the same few sub-objects (eg a feature's `properties`). Looking each one
+up with a chain of `.get('properties', {}).get(...)` calls repeats the same lookups
+and allocates a throwaway dict for every missing level.
+
+A field map declares where each output field comes from instead:
+
+.. code-block:: python
+
+	extract_alert = compile_field_map({
+		'url':			'id',
+		'alert_id':		path('properties', 'id'),
+		'sent_at':		path('properties', 'sent', convert=parse_timestamp),
+		'cap_vtec':		path('properties', 'parameters', 'VTEC'),
+	})
+	alert_dict = extract_alert(feature)
+
+`compile_field_map` generates the source of a function specialised to the map and
+compiles it once. The generated function looks up each shared prefix (like
+`properties`) a single time, and builds the output dict in one expression. A missing
+or non-dict intermediate value yields None for every field below it.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+
+class path:
+	"""The location of a value in a nested dict, and an optional converter for it
+
+	:param keys: The keys to follow from the root of the data to the value
+	:param convert: A function to call on the value, like `parse_timestamp`. It's
+		called even if the value is None.
+	"""
+
+	__slots__ = ('keys', 'convert')
+
+	def __init__(self, *keys: str, convert: Callable[[Any], Any] = None):
+		if not keys:
+			raise ValueError('A path needs at least one key')
+		self.keys: Tuple[str, ...] = keys
+		self.convert = convert
+
+	def __repr__(self) -> str:
+		return f'path{self.keys!r}'
+
+
+# Substituted for missing or non-dict intermediate values, so the rest of the
+# generated lookups can carry on without checking for None
+_EMPTY: dict = {}
+
+
+def compile_field_map(
+	field_map: Dict[str, 'path | str'],
+	name: str = 'extract'
+) -> Callable[[dict], dict]:
+	"""Compile a field map into a function that extracts the fields from a dict
+
+	:param field_map: Output field names mapped to a `path`, or to a single key
+	:param name: The name of the generated function, shown in tracebacks
+	:returns: A function that takes the data and returns a dict of the mapped fields
+	"""
+	namespace = {'_EMPTY': _EMPTY}
+	prefix_vars = {(): 'data'}
+	lines = [f'def {name}(data):']
+
+	def get_prefix_var(prefix: tuple) -> str:
+		"""Emit the lookups for a prefix and its parents, once each"""
+		if prefix in prefix_vars:
+			return prefix_vars[prefix]
+		parent_var = get_prefix_var(prefix[:-1])
+		var = f'_p{len(prefix_vars)}'
+		lines.append(f'\t{var} = {parent_var}.get({prefix[-1]!r})')
+		lines.append(f'\tif not isinstance({var}, dict): {var} = _EMPTY')
+		prefix_vars[prefix] = var
+		return var
+
+	values = []
+	for i, (field, spec) in enumerate(field_map.items()):
+		if isinstance(spec, str):
+			spec = path(spec)
+		parent_var = get_prefix_var(spec.keys[:-1])
+		value = f'{parent_var}.get({spec.keys[-1]!r})'
+		if spec.convert is not None:
+			namespace[f'_convert{i}'] = spec.convert
+			value = f'_convert{i}({value})'
+		values.append(f'\t\t{field!r}: {value},')
+
+	lines.append('\treturn {')
+	lines.extend(values)
+	lines.append('\t}')
+	source = '\n'.join(lines)
+	exec(compile(source, f'<field map {name}>', 'exec'), namespace)
+	extractor = namespace[name]
+	extractor.__source__ = source
+	return extractor
@@ -1,11 +1,20 @@
 """
 """
 
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 from datetime import datetime
 from requests_cache import CachedSession
 from nwsc.render.decorators import display_spinner
-from nwsc.api.api_request import api_request, parse_timestamp
+from nwsc.api.api_request import (
+	api_request,
+	build_url,
+	format_timestamp,
+	get_page_size,
+	iter_pages,
+	parse_timestamp,
+)
+from nwsc.api.field_mapper import compile_field_map, path
 from nwsc.api import (
 	NWS_API_ALERTS_AREA,
     NWS_API_ALERTS_ZONE,
@@ -17,6 +26,46 @@ from nwsc.api import (
 from nwsc.model.alerts import PriorAlert, Alert, AlertCounts
 
 
+extract_alert = compile_field_map({
+	'alert_id':				path('properties', 'id'),
+	'url':					'id',
+	'updated_at':			path('updated', convert=parse_timestamp),
+	'title':				'title',
+	'headline':				path('properties', 'headline'),
+	'description':			path('properties', 'description'),
+	'instruction':			path('properties', 'instruction'),
+	'urgency':				path('properties', 'urgency'),
+	'area_description':		path('properties', 'areaDesc'),
+	'affected_zones_urls':	path('properties', 'affectedZones'),
+	'areas_ugc':			path('properties', 'geocode', 'UGC'),
+	'areas_same':			path('properties', 'geocode', 'SAME'),
+	'sent_by':				path('properties', 'sender'),
+	'sent_by_name':			path('properties', 'senderName'),
+	'sent_at':				path('properties', 'sent', convert=parse_timestamp),
+	'effective_at':			path('properties', 'effective', convert=parse_timestamp),
+	'ends_at':				path('properties', 'ends', convert=parse_timestamp),
+	'status':				path('properties', 'status'),
+	'message_type':			path('properties', 'messageType'),
+	'category':				path('properties', 'category'),
+	'certainty':			path('properties', 'certainty'),
+	'event_type':			path('properties', 'event'),
+	'onset_at':				path('properties', 'onset', convert=parse_timestamp),
+	'expires_at':			path('properties', 'expires', convert=parse_timestamp),
+	'response_type':		path('properties', 'response'),
+	'cap_awips_id':			path('properties', 'parameters', 'AWIPSidentifier'),
+	'cap_wmo_id':			path('properties', 'parameters', 'WMOidentifier'),
+	'cap_headline':			path('properties', 'parameters', 'NWSheadline'),
+	'cap_blocked_channels':	path('properties', 'parameters', 'BLOCKCHANNEL'),
+	'cap_vtec':				path('properties', 'parameters', 'VTEC'),
+	'references':			path('properties', 'references'),
+}, name='extract_alert')
+extract_prior_alert = compile_field_map({
+	'prior_alert_id':	'identifier',
+	'url':				'@id',
+	'sent_at':			path('sent', convert=parse_timestamp),
+}, name='extract_prior_alert')
+
+
 # See:
 # - https://vlab.noaa.gov/web/nws-common-alerting-protocol
 # - https://www.weather.gov/media/alert/CAP_v12_guide_05-16-2017.pdf
@@ -25,69 +74,12 @@ def process_alert_data(alert_data: dict, retrieved_at: datetime) -> List[Alert]:
 	"""Get all current alerts for the given area, zone, or region"""
 	alerts = []
 	for feature in alert_data.get('features', {}):
-		alert_dict = {
-			'retrieved_at':	retrieved_at,
-			'alert_id':				feature.get('properties', {}).get('id'),
-			'url':                  feature.get('id'),
-			'updated_at':           parse_timestamp(feature.get('updated')),
-			'title':                feature.get('title'),
-			'headline':            	feature.get('properties', {}).get('headline'),
-			'description':         	feature.get('properties', {}).get('description'),
-			'instruction':         	feature.get('properties', {}).get('instruction'),
-			'urgency':             	feature.get('properties', {}).get('urgency'),
-			'area_description':   	feature.get('properties', {}).get('areaDesc'),
-			'affected_zones_urls':	feature.get('properties', {}).get('affectedZones'),
-			'areas_ugc':            (feature.get('properties', {})
-											.get('geocode', {})
-											.get('UGC')),
-			'areas_same':           (feature.get('properties', {})
-											.get('geocode', {})
-											.get('SAME')),
-			'sent_by':             	feature.get('properties', {}).get('sender'),
-			'sent_by_name':        	feature.get('properties', {}).get('senderName'),
-			'sent_at':             	(parse_timestamp(feature.get('properties', {})
-															.get('sent'))),
-			'effective_at':        	(parse_timestamp(feature.get('properties', {})
-															.get('effective'))),
-			'ends_at':             	(parse_timestamp(feature.get('properties', {})
-															.get('ends'))),
-			'status':              	feature.get('properties', {}).get('status'),
-			'message_type':        	feature.get('properties', {}).get('messageType'),
-			'category':            	feature.get('properties', {}).get('category'),
-			'certainty':           	feature.get('properties', {}).get('certainty'),
-			'event_type':          	feature.get('properties', {}).get('event'),
-			'onset_at':            	(parse_timestamp(feature.get('properties', {})
-															.get('onset'))),
-			'expires_at':          	(parse_timestamp(feature.get('properties', {})
-															.get('expires'))),
-			'response_type':       	feature.get('properties', {}).get('response'),
-			'cap_awips_id':        	(feature.get('properties', {})
-											.get('parameters', {})
-											.get('AWIPSidentifier')),
-			'cap_wmo_id':          	(feature.get('properties', {})
-											.get('parameters', {})
-											.get('WMOidentifier')),
-			'cap_headline':        	(feature.get('properties', {})
-											.get('parameters', {})
-											.get('NWSheadline')),
-			'cap_blocked_channels':	(feature.get('properties', {})
-											.get('parameters', {})
-											.get('BLOCKCHANNEL')),
-			'cap_vtec':            	(feature.get('properties', {})
-											.get('parameters', {})
-											.get('VTEC')),
-			'prior_alerts':         [],
-		}
-		alert = Alert(**alert_dict)
-		for reference in feature.get('properties', {}).get('references', {}):
-			prior_alert_dict = {
-				'prior_alert_id':   reference.get('identifier'),
-				'url':          	reference.get('@id'),
-				'sent_at':      	parse_timestamp(reference.get('sent')),
-			}
-			prior_alert = PriorAlert(**prior_alert_dict)
-			alert.prior_alerts.append(prior_alert)
-		alerts.append(alert)
+		alert_dict = extract_alert(feature)
+		references = alert_dict.pop('references') or []
+		alert_dict['retrieved_at'] = retrieved_at
+		alert_dict['prior_alerts'] = [PriorAlert(**extract_prior_alert(reference))
+									  for reference in references]
+		alerts.append(Alert(**alert_dict))
 	return alerts
 
 
@@ -99,6 +91,27 @@ def get_alerts(session: CachedSession) -> List[Alert]:
 	return process_alert_data(response, retrieved_at)
 
 
+def iter_alerts(
+	session: CachedSession,
+	since: datetime = None,
+	limit: int = None
+) -> Iterator[Alert]:
+	"""Get every alert, newest first, one page at a time
+
+	:param since: Only get alerts sent at or after this time
+	:param limit: The maximum number of alerts to get
+	"""
+	url = build_url(NWS_API_ALERTS,
+					start=format_timestamp(since),
+					limit=get_page_size(limit))
+	alerts = (
+		alert
+		for page in iter_pages(session, url)
+		for alert in process_alert_data(page.get('response'), page.get('retrieved_at'))
+	)
+	yield from islice(alerts, limit)
+
+
 @display_spinner('Getting alerts for the local area...')
 def get_alerts_by_area(session: CachedSession, area: str) -> List[Alert]:
 	alerts = api_request(session, NWS_API_ALERTS_AREA + area)
@@ -137,19 +150,25 @@ def get_alert_types(session: CachedSession) -> List[str]:
 	return alert_types_data.get('eventTypes')
 
 
+def process_alert_counts_data(
+	alert_counts_data: dict,
+	retrieved_at: datetime
+) -> AlertCounts:
+	alert_counts_dict = {
+		'retrieved_at':	retrieved_at,
+		'total':		alert_counts_data.get('total'),
+		'land':			alert_counts_data.get('land'),
+		'marine':		alert_counts_data.get('marine'),
+		'regions':		alert_counts_data.get('regions'),
+		'areas':		alert_counts_data.get('areas'),
+		'zones':		alert_counts_data.get('zones'),
+	}
+	return AlertCounts(**alert_counts_dict)
+
+
 @display_spinner('Getting alert counts...')
 def get_alert_counts(session: CachedSession) -> AlertCounts:
 	alert_counts_data = api_request(session, NWS_API_ALERT_COUNTS)
 	response = alert_counts_data.get('response')
 	retrieved_at = alert_counts_data.get('retrieved_at')
-	alert_counts_dict = {
-		'retrieved_at':	retrieved_at,
-		'total':		response.get('total'),
-		'land':			response.get('land'),
-		'marine':		response.get('marine'),
-		'regions':		response.get('regions'),
-		'areas':		response.get('areas'),
-		'zones':		response.get('zones'),
-	}
-	alert_counts = AlertCounts(**alert_counts_dict)
-	return alert_counts
+	return process_alert_counts_data(response, retrieved_at)
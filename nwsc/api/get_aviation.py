@@ -1,9 +1,9 @@
 import json
-from typing import List
+from typing import Iterator, List
 from datetime import datetime
 from requests_cache import CachedSession
 from nwsc.render.decorators import display_spinner
-from nwsc.api.api_request import api_request
+from nwsc.api.api_request import api_request, api_request_stream
 from nwsc.api import (
     NWS_API_AVIATION_SIGMETS,
     NWS_API_AVIATION_CWSU,
@@ -38,12 +38,20 @@ def process_sigmets(sigmets_data: list, retrieved_at: datetime) -> List[SIGMET]:
     return sigmets
 
 
+def iter_all_sigmets(session: CachedSession) -> Iterator[SIGMET]:
+    """Yield every SIGMET as soon as it has been parsed
+
+    See `api_request_stream` for when the response itself is streamed.
+    """
+    sigmets_data = api_request_stream(session, NWS_API_AVIATION_SIGMETS, 'features.item')
+    retrieved_at = sigmets_data.get('retrieved_at')
+    for feature in sigmets_data.get('response'):
+        yield process_sigmet_data(feature, retrieved_at)
+
+
 @display_spinner('Getting all SIGMETs...')
 def get_all_sigmets(session: CachedSession) -> List[SIGMET]:
-    sigmets_data = api_request(session, NWS_API_AVIATION_SIGMETS)
-    response = sigmets_data.get('response')
-    retrieved_at = sigmets_data.get('retrieved_at')
-    return process_sigmets(response, retrieved_at)
+    return list(iter_all_sigmets(session))
 
 
 @display_spinner('Getting all SIGMETs issued by ATSU...')
@@ -104,6 +112,27 @@ def process_cwa_data(cwa_data: dict, retrieved_at: datetime) -> CenterWeatherAdv
     return CenterWeatherAdvisory(**cwa_dict)
 
 
+def process_cwsu_data(
+    cwsu_data: dict,
+    retrieved_at: datetime
+) -> CentralWeatherServiceUnit:
+    cwsu_dict = {
+        'retrieved_at':   retrieved_at,
+        'cwsu_id':              cwsu_data.get('id'),
+        'street':               cwsu_data.get('street'),
+        'name':                 cwsu_data.get('name'),
+        'city':                 cwsu_data.get('city'),
+        'state':                cwsu_data.get('state'),
+        'zip_code':             cwsu_data.get('zipCcode'),
+        'email':                cwsu_data.get('email'),
+        'fax':                  cwsu_data.get('fax'),
+        'phone':                cwsu_data.get('phone'),
+        'url':                  cwsu_data.get('url'),
+        'nws_region':           cwsu_data.get('nwsRegion'),
+    }
+    return CentralWeatherServiceUnit(**cwsu_dict)
+
+
 @display_spinner('Getting CWSU details...')
 def get_cwsu(
     session: CachedSession,
@@ -112,21 +141,7 @@ def get_cwsu(
     cwsu_data = api_request(session, NWS_API_AVIATION_CWSU + cwsu_id)
     response = cwsu_data.get('response')
     retrieved_at = cwsu_data.get('retrieved_at')
-    cwsu_dict = {
-        'retrieved_at':   retrieved_at,
-        'cwsu_id':              response.get('id'),
-        'street':               response.get('street'),
-        'name':                 response.get('name'),
-        'city':                 response.get('city'),
-        'state':                response.get('state'),
-        'zip_code':             response.get('zipCcode'),
-        'email':                response.get('email'),
-        'fax':                  response.get('fax'),
-        'phone':                response.get('phone'),
-        'url':                  response.get('url'),
-        'nws_region':           response.get('nwsRegion'),
-    }
-    return CentralWeatherServiceUnit(**cwsu_dict)
+    return process_cwsu_data(response, retrieved_at)
 
 
 @display_spinner('Getting all CWAs issued by CWSU...')
@@ -152,7 +167,7 @@ def get_cwa(
 ) -> CenterWeatherAdvisory:
     cwa_data = api_request(session, (NWS_API_AVIATION_CWSU
                                      + cwsu_id
-                                     + f'/cwas/{date_str}/{sequence}')
+                                     + f'/cwas/{date_str}/{sequence}'))
     response = cwa_data.get('response')
     retrieved_at = cwa_data.get('retrieved_at')
     return process_cwa_data(response, retrieved_at)
@@ -4,16 +4,20 @@ from nwsc.api.api_request import api_request
 from nwsc.api import NWS_API_GLOSSARY
 
 
-@display_spinner('Getting glossary...')
-def get_glossary(session: CachedSession) -> dict:
-	"""Get the glossary of weather terms"""
-	glossary_data = api_request(session, NWS_API_GLOSSARY)
-	response = glossary_data.get('response')
+def process_glossary_data(glossary_data: dict) -> dict:
 	glossary = {}
-	for entry in response.get('glossary', {}):
+	for entry in glossary_data.get('glossary', {}):
 		term = entry.get('term')
 		definition = entry.get('definition')
 		if term and definition:
 			glossary.update({term: definition})
 	return glossary
 
+
+@display_spinner('Getting glossary...')
+def get_glossary(session: CachedSession) -> dict:
+	"""Get the glossary of weather terms"""
+	glossary_data = api_request(session, NWS_API_GLOSSARY)
+	response = glossary_data.get('response')
+	return process_glossary_data(response)
+
@@ -19,8 +19,15 @@ def uscb_geocode(
 
 	coord_data = api_request(session, USCB_API_GEOCODE + address.replace(' ', '+'))
 	response = coord_data.get('response')
+	return process_geocode_data(response, address)
+
+
+def process_geocode_data(
+	geocode_data: dict,
+	address: str
+) -> Tuple[float, float] | None:
 	try:
-		coords = response['result']['addressMatches'][0]['coordinates']
+		coords = geocode_data['result']['addressMatches'][0]['coordinates']
 		lat = round(coords['y'], 2)
 		lon = round(coords['x'], 2)
 		logger.debug(f'Geocoded address {address} to {lat}, {lon}')
@@ -29,35 +36,39 @@ def uscb_geocode(
 		return None
 
 
-@display_spinner('Getting location data...')
-def get_location(
-	session: CachedSession,
-	address: str
-) -> Location:
-	coords = uscb_geocode(session, address)
-	coords_str = f'{coords[0]},{coords[1]}'
-	location_data = api_request(session, NWS_API_POINTS + coords_str)
-	response = location_data.get('response')
+def process_location_data(location_data: dict) -> Location:
 	location_dict = {
-		'city':                     (response.get('properties', {})
+		'city':                     (location_data.get('properties', {})
 							   				 .get('relativeLocation', {})
 											 .get('properties', {})
 											 .get('city')),
-		'state':                    (response.get('properties', {})
+		'state':                    (location_data.get('properties', {})
 							   				 .get('relativeLocation', {})
 											 .get('properties', {})
 											 .get('state')),
-		'timezone':                 response.get('properties', {}).get('timeZone'),
-		'grid_x':                   response.get('properties', {}).get('gridX'),
-		'grid_y':                   response.get('properties', {}).get('gridY'),
-		'forecast_office':      	response.get('properties', {}).get('cwa'),
-		'radar_station':            response.get('properties', {}).get('radarStation'),
-		'forecast_office_url':      response.get('properties', {}).get('forecastOffice'),
-		'forecast_extended_url':    response.get('properties', {}).get('forecast'),			# /gridpoints/{wfo}/{x},{y}/forecast
-		'forecast_hourly_url':      response.get('properties', {}).get('forecastHourly'),	# /gridpoints/{wfo}/{x},{y}/forecast/hourly
-		'gridpoints_url':           (response.get('properties', {})
+		'timezone':                 location_data.get('properties', {}).get('timeZone'),
+		'grid_x':                   location_data.get('properties', {}).get('gridX'),
+		'grid_y':                   location_data.get('properties', {}).get('gridY'),
+		'forecast_office':      	location_data.get('properties', {}).get('cwa'),
+		'radar_station':            location_data.get('properties', {}).get('radarStation'),
+		'forecast_office_url':      location_data.get('properties', {}).get('forecastOffice'),
+		'forecast_extended_url':    location_data.get('properties', {}).get('forecast'),			# /gridpoints/{wfo}/{x},{y}/forecast
+		'forecast_hourly_url':      location_data.get('properties', {}).get('forecastHourly'),	# /gridpoints/{wfo}/{x},{y}/forecast/hourly
+		'gridpoints_url':           (location_data.get('properties', {})
 							   				 .get('forecastGridData')),						# /gridpoints/{wfo}/{x},{y}
-		'observation_stations_url': (response.get('properties', {})
+		'observation_stations_url': (location_data.get('properties', {})
 							   				 .get('observationStations')),					# /gridpoints/{wfo}/{x},{y}/stations
 	}
 	return Location(**location_dict)
+
+
+@display_spinner('Getting location data...')
+def get_location(
+	session: CachedSession,
+	address: str
+) -> Location:
+	coords = uscb_geocode(session, address)
+	coords_str = f'{coords[0]},{coords[1]}'
+	location_data = api_request(session, NWS_API_POINTS + coords_str)
+	response = location_data.get('response')
+	return process_location_data(response)
@@ -70,6 +70,29 @@ def get_office_headline(
     return process_headline_data(response, retrieved_at, office_id)
 
 
+def process_office_data(office_data: dict, retrieved_at: datetime) -> Office:
+    office_dict = {
+        'retrieved_at':   retrieved_at,
+        'office_id':            office_data.get('id'),
+        'name':                 office_data.get('name'),
+        'street_address':       office_data.get('address', {}).get('streetAddress'),
+        'city':                 office_data.get('address', {}).get('addressLocality'),
+        'state':                office_data.get('address', {}).get('addressRegion'),
+        'zip_code':             office_data.get('address', {}).get('postalCode'),
+        'phone_number':         office_data.get('telephone'),
+        'fax_number':           office_data.get('faxNumber'),
+        'email':                office_data.get('email'),
+        'url':                  office_data.get('sameAs'),
+        'parent_url':           office_data.get('parentOrganization'),
+        'nws_region':           office_data.get('nwsRegion'),
+        'counties':             office_data.get('responsibleCounties'),
+        'forecast_zones':       office_data.get('responsibleForecastZones'),
+        'fire_zones':           office_data.get('responsibleFireZones'),
+        'observation_stations': office_data.get('approvedObservationStations'),
+    }
+    return Office(**office_dict)
+
+
 @display_spinner('Getting forecast office details...')
 def get_office(
     session: CachedSession,
@@ -80,23 +103,4 @@ def get_office(
     office_data = api_request(session, NWS_API_OFFICES + office_id)
     response = office_data.get('response')
     retrieved_at = office_data.get('retrieved_at')
-    office_dict = {
-        'retrieved_at':   retrieved_at,
-        'office_id':            response.get('id'),
-        'name':                 response.get('name'),
-        'street_address':       response.get('address', {}).get('streetAddress'),
-        'city':                 response.get('address', {}).get('addressLocality'),
-        'state':                response.get('address', {}).get('addressRegion'),
-        'zip_code':             response.get('address', {}).get('postalCode'),
-        'phone_number':         response.get('telephone'),
-        'fax_number':           response.get('faxNumber'),
-        'email':                response.get('email'),
-        'url':                  response.get('sameAs'),
-        'parent_url':           response.get('parentOrganization'),
-        'nws_region':           response.get('nwsRegion'),
-        'counties':             response.get('responsibleCounties'),
-        'forecast_zones':       response.get('responsibleForecastZones'),
-        'fire_zones':           response.get('responsibleFireZones'),
-        'observation_stations': response.get('approvedObservationStations'),
-    }
-    return Office(**office_dict)
+    return process_office_data(response, retrieved_at)
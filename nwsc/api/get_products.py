@@ -1,8 +1,16 @@
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 from datetime import datetime
 from requests_cache import CachedSession
 from nwsc.render.decorators import display_spinner
-from nwsc.api.api_request import api_request
+from nwsc.api.api_request import (
+	api_request,
+	api_request_stream,
+	build_url,
+	format_timestamp,
+	get_page_size,
+	iter_pages,
+)
 from nwsc.api import (
 	NWS_API_PRODUCT_TYPES,
 	NWS_API_PRODUCT_LOCATIONS,
@@ -11,21 +19,22 @@ from nwsc.api import (
 from nwsc.model.products import Product, ProductLocation, ProductType
 
 
+def process_product_listing(product: dict, retrieved_at: datetime) -> Product:
+	product_dict = {
+		'retrieved_at':	retrieved_at,
+		'product_id':			product.get('id'),
+		'wmo_id':				product.get('wmoCollectiveId'),
+		'text':					None,
+		'code':					product.get('productCode'),
+		'name':					product.get('productName'),
+		'issuing_office':		product.get('issuingOffice'),
+		'issued_at':			product.get('issuanceTime'),
+	}
+	return Product(**product_dict)
+
+
 def process_product_data(products_data: dict, retrieved_at: datetime) -> List[Product]:
-	products = []
-	for product in products_data:
-		product_dict = {
-			'retrieved_at':	retrieved_at,
-			'product_id':			product.get('id'),
-			'wmo_id':				product.get('wmoCollectiveId'),
-			'text':					None,
-			'code':					product.get('productCode'),
-			'name':					product.get('productName'),
-			'issuing_office':		product.get('issuingOffice'),
-			'issued_at':			product.get('issuanceTime'),
-		}
-		products.append(Product(**product_dict))
-	return products
+	return [process_product_listing(product, retrieved_at) for product in products_data]
 
 
 def process_product_types_data(product_types_data: list) -> List[ProductType]:
@@ -89,12 +98,42 @@ def get_product_locations_by_type(
 	return process_product_locations_data(product_locations_data)
 
 
+def iter_all_products(session: CachedSession) -> Iterator[Product]:
+	"""Yield every product in the listing as soon as it has been parsed
+
+	See `api_request_stream` for when the response itself is streamed.
+	"""
+	products_data = api_request_stream(session, NWS_API_PRODUCTS, '@graph.item')
+	retrieved_at = products_data.get('retrieved_at')
+	for product in products_data.get('response'):
+		yield process_product_listing(product, retrieved_at)
+
+
 @display_spinner('Getting listing of all products...')
 def get_products(session: CachedSession) -> List[Product]:
-	products_data = api_request(session, NWS_API_PRODUCTS)
-	response = products_data.get('response')
-	retrieved_at = products_data.get('retrieved_at')
-	return process_product_data(response.get('@graph', {}), retrieved_at)
+	return list(iter_all_products(session))
+
+
+def iter_products(
+	session: CachedSession,
+	since: datetime = None,
+	limit: int = None
+) -> Iterator[Product]:
+	"""Get a listing of every product, newest first, one page at a time
+
+	:param since: Only get products issued at or after this time
+	:param limit: The maximum number of products to get
+	"""
+	url = build_url(NWS_API_PRODUCTS,
+					start=format_timestamp(since),
+					limit=get_page_size(limit))
+	products = (
+		product
+		for page in iter_pages(session, url)
+		for product in process_product_data(page.get('response').get('@graph', {}),
+											page.get('retrieved_at'))
+	)
+	yield from islice(products, limit)
 
 
 @display_spinner('Getting listing of all products by type...')
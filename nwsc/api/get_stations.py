@@ -2,7 +2,7 @@ from typing import List
 from datetime import datetime
 from requests_cache import CachedSession
 from nwsc.render.decorators import display_spinner
-from nwsc.api.get_weather import process_measurement_values
+from nwsc.api.measurements import process_measurement_values
 from nwsc.api.conversions import convert_measures
 from nwsc.api.api_request import api_request
 from nwsc.api import NWS_API_STATIONS, NWS_API_GRIDPOINTS
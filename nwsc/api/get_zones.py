@@ -1,9 +1,18 @@
 import json
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 from datetime import datetime
 from requests_cache import CachedSession
 from nwsc.render.decorators import display_spinner
-from nwsc.api.api_request import api_request, parse_timestamp
+from nwsc.api.api_request import (
+    api_request,
+    api_request_stream,
+    build_url,
+    format_timestamp,
+    get_page_size,
+    iter_pages,
+    parse_timestamp,
+)
 from nwsc.api.get_stations import process_station_data
 from nwsc.api.get_weather import process_observations_data
 from nwsc.api import (
@@ -61,21 +70,31 @@ def get_zone(
     return process_zone_data(response, retrieved_at)
 
 
-@display_spinner('Getting all zones...')
-def get_zones(
+def iter_all_zones(
     session: CachedSession,
     zone_type: str = None
-) -> List[Zone]:
+) -> Iterator[Zone]:
+    """Yield every zone (of `zone_type`, if given) as soon as it has been parsed
+
+    See `api_request_stream` for when the response itself is streamed.
+    """
     if zone_type:
-        zones_data = api_request(session, NWS_API_ZONES + f'/{zone_type}')
+        zones_data = api_request_stream(session,
+                                        NWS_API_ZONES + f'/{zone_type}',
+                                        'features.item')
     else:
-        zones_data = api_request(session, NWS_API_ZONES)
-    response = zones_data.get('response')
+        zones_data = api_request_stream(session, NWS_API_ZONES, 'features.item')
     retrieved_at = zones_data.get('retrieved_at')
-    zones = []
-    for feature in response.get('features', {}):
-        zones.append(process_zone_data(feature, retrieved_at))
-    return zones
+    for feature in zones_data.get('response'):
+        yield process_zone_data(feature, retrieved_at)
+
+
+@display_spinner('Getting all zones...')
+def get_zones(
+    session: CachedSession,
+    zone_type: str = None
+) -> List[Zone]:
+    return list(iter_all_zones(session, zone_type))
 
 
 @display_spinner('Getting stations servicing zone...')
@@ -110,24 +129,42 @@ def get_zone_observations(
     return zone_observations
 
 
-@display_spinner('Getting forecast for zone...')
-def get_zone_forecast(
+def iter_zone_observations(
     session: CachedSession,
+    zone_id: str,
+    since: datetime = None,
+    limit: int = None
+) -> Iterator[Observation]:
+    """Get every observation for a zone, newest first, one page at a time
+
+    :param since: Only get observations made at or after this time
+    :param limit: The maximum number of observations to get
+    """
+    url = build_url(NWS_API_ZONE_FORECASTS + f'{zone_id}/observations',
+                    start=format_timestamp(since),
+                    limit=get_page_size(limit))
+    observations = (
+        process_observations_data(feature, page.get('retrieved_at'), zone_id)
+        for page in iter_pages(session, url)
+        for feature in page.get('response').get('features', {})
+    )
+    yield from islice(observations, limit)
+
+
+def process_zone_forecast_data(
+    zone_forecast_data: dict,
+    retrieved_at: datetime,
     zone_id: str
 ) -> ZoneForecast:
-    zone_forecast_data = api_request(session,
-                                     NWS_API_ZONE_FORECASTS + f'{zone_id}/forecast')
-    response = zone_forecast_data.get('response')
-    retrieved_at = zone_forecast_data.get('retrieved_at')
     forecast_dict = {
         'retrieved_at':     retrieved_at,
         'zone_id':          zone_id,
-        'forecasted_at':    (parse_timestamp(response.get('properties', {})
+        'forecasted_at':    (parse_timestamp(zone_forecast_data.get('properties', {})
                                                      .get('updated'))),
         'periods':          []
     }
     forecast = ZoneForecast(**forecast_dict)
-    for period in response.get('properties', {}).get('periods', {}):
+    for period in zone_forecast_data.get('properties', {}).get('periods', {}):
         if period and isinstance(period, dict):
             period_dict = {
                 'period_num':        period.get('number'),
@@ -137,3 +174,15 @@ def get_zone_forecast(
             forecast_period = ZoneForecastPeriod(**period_dict)
             forecast.periods.append(forecast_period)
     return forecast
+
+
+@display_spinner('Getting forecast for zone...')
+def get_zone_forecast(
+    session: CachedSession,
+    zone_id: str
+) -> ZoneForecast:
+    zone_forecast_data = api_request(session,
+                                     NWS_API_ZONE_FORECASTS + f'{zone_id}/forecast')
+    response = zone_forecast_data.get('response')
+    retrieved_at = zone_forecast_data.get('retrieved_at')
+    return process_zone_forecast_data(response, retrieved_at, zone_id)
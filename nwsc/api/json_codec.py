@@ -0,0 +1,75 @@
+"""Decode and encode JSON with the fastest available library
+
+JSON decoding is the largest CPU cost of using the NWS API after the network itself.
+`loads` and `dumps` use `orjson` if it's installed, then `msgspec`, and fall back to
+the standard library `json` module. All backends accept and return the same types:
+
+- `loads` accepts `bytes` or `str` and returns plain dicts, lists, strs, floats, etc
+- `dumps` returns UTF-8 encoded `bytes`, serializes dataclasses and datetimes (as ISO
+  8601 strings) natively, and falls back to `str()` for any other unknown type
+
+The name of the backend in use is available as `JSON_BACKEND`.
+"""
+
+import json
+from datetime import date, datetime
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
+
+
+def _default(obj: Any) -> Any:
+	"""Serialize types that a backend doesn't support natively"""
+	if is_dataclass(obj) and not isinstance(obj, type):
+		return {field.name: getattr(obj, field.name) for field in fields(obj)}
+	if isinstance(obj, (date, datetime)):
+		return obj.isoformat()
+	if isinstance(obj, (set, frozenset, tuple)):
+		return list(obj)
+	return str(obj)
+
+
+if orjson is not None:
+	JSON_BACKEND = 'orjson'
+	_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+	def loads(data: bytes | str) -> Any:
+		return orjson.loads(data)
+
+	def dumps(obj: Any, indent: bool = False) -> bytes:
+		options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+		return orjson.dumps(obj, default=_default, option=options)
+
+elif msgspec is not None:
+	JSON_BACKEND = 'msgspec'
+	_decoder = msgspec.json.Decoder()
+	_encoder = msgspec.json.Encoder(enc_hook=_default)
+
+	def loads(data: bytes | str) -> Any:
+		return _decoder.decode(data)
+
+	def dumps(obj: Any, indent: bool = False) -> bytes:
+		encoded = _encoder.encode(obj)
+		if indent:
+			return msgspec.json.format(encoded, indent=2)
+		return encoded
+
+else:
+	JSON_BACKEND = 'json'
+
+	def loads(data: bytes | str) -> Any:
+		return json.loads(data)
+
+	def dumps(obj: Any, indent: bool = False) -> bytes:
+		if indent:
+			return json.dumps(obj, default=_default, indent=2).encode('utf-8')
+		return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,186 @@
+"""Throttle and retry requests to the NWS API
+
+The NWS API rejects clients that make too many requests too quickly with
+`429 Too Many Requests` or `503 Service Unavailable`, and doesn't publish its
+limits. This module provides:
+
+- `RateLimiter`, a per-host token bucket that spaces out requests so that bursts of
+  concurrent requests stay under a sustainable rate
+- `RetryPolicy`, which decides when a failed request should be retried and how long to
+  wait before retrying it, using jittered exponential backoff and honouring any
+  `Retry-After` header sent by the server
+
+Both are thread-safe, and `RateLimiter` can be awaited from coroutines, so a single
+instance can be shared by the synchronous and asynchronous APIs.
+"""
+
+import time
+import random
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict
+from urllib.parse import urlsplit
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_REQUESTS_PER_SECOND = 5
+DEFAULT_BURST_SIZE = 10
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+	"""A thread-safe token bucket
+
+	Tokens are refilled at `rate` tokens per second, up to `capacity` tokens. Each
+	request takes one token. When the bucket is empty, callers are told how long to wait
+	until a token becomes available, in the order they asked for one.
+
+	:param rate: The sustained number of requests allowed per second
+	:param capacity: The number of requests that can be made at once after being idle
+	"""
+
+	def __init__(self, rate: float, capacity: int):
+		if rate <= 0 or capacity < 1:
+			raise ValueError(f'Invalid token bucket parameters: {rate=}, {capacity=}')
+		self.rate = rate
+		self.capacity = capacity
+		self._interval = 1 / rate
+		self._burst_tolerance = (capacity - 1) * self._interval
+		# The time at which the bucket would be full again if no more tokens were taken
+		self._next_free_at = 0.0
+		self._paused_until = 0.0
+		self._lock = threading.Lock()
+
+	def reserve(self) -> float:
+		"""Take a token and return the number of seconds to wait before using it"""
+		with self._lock:
+			now = time.monotonic()
+			next_free_at = max(self._next_free_at, now)
+			allowed_at = max(next_free_at - self._burst_tolerance, self._paused_until)
+			self._next_free_at = max(next_free_at, allowed_at) + self._interval
+			return max(0.0, allowed_at - now)
+
+	def pause(self, seconds: float):
+		"""Don't hand out any tokens for the given number of seconds"""
+		with self._lock:
+			self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+	def acquire(self):
+		"""Take a token, blocking the current thread until it can be used"""
+		wait = self.reserve()
+		if wait > 0:
+			time.sleep(wait)
+
+	async def acquire_async(self):
+		"""Take a token, suspending the current task until it can be used"""
+		wait = self.reserve()
+		if wait > 0:
+			await asyncio.sleep(wait)
+
+
+class RateLimiter:
+	"""Rate limit requests separately for each host
+
+	:param rate: The default number of requests allowed per second for each host
+	:param capacity: The default burst size for each host
+	:param host_limits: Optional `(rate, capacity)` overrides for specific hosts
+	"""
+
+	def __init__(
+		self,
+		rate: float = DEFAULT_REQUESTS_PER_SECOND,
+		capacity: int = DEFAULT_BURST_SIZE,
+		host_limits: Dict[str, tuple] = None
+	):
+		self.rate = rate
+		self.capacity = capacity
+		self.host_limits = host_limits or {}
+		self._buckets: Dict[str, TokenBucket] = {}
+		self._lock = threading.Lock()
+
+	def get_bucket(self, url: str) -> TokenBucket:
+		host = urlsplit(url).netloc
+		with self._lock:
+			bucket = self._buckets.get(host)
+			if bucket is None:
+				rate, capacity = self.host_limits.get(host, (self.rate, self.capacity))
+				bucket = TokenBucket(rate, capacity)
+				self._buckets[host] = bucket
+			return bucket
+
+	def acquire(self, url: str):
+		self.get_bucket(url).acquire()
+
+	async def acquire_async(self, url: str):
+		await self.get_bucket(url).acquire_async()
+
+	def pause(self, url: str, seconds: float):
+		"""Stop all requests to the host of `url` for the given number of seconds"""
+		self.get_bucket(url).pause(seconds)
+
+
+def parse_retry_after(retry_after: str | None) -> float | None:
+	"""Convert a `Retry-After` header value to a number of seconds
+
+	The header can either be a number of seconds or an HTTP date.
+	"""
+	if not retry_after:
+		return None
+	try:
+		return max(0.0, float(retry_after))
+	except ValueError:
+		pass
+	try:
+		retry_at = parsedate_to_datetime(retry_after)
+	except (TypeError, ValueError):
+		logger.debug(f'Unable to parse Retry-After header: {retry_after}')
+		return None
+	if retry_at.tzinfo is None:
+		retry_at = retry_at.replace(tzinfo=timezone.utc)
+	return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(kw_only=True)
+class RetryPolicy:
+	"""Decide whether and when to retry a failed request
+
+	:param max_retries: The maximum number of times to retry a request
+	:param backoff_base: The maximum delay before the first retry, in seconds. The
+		maximum delay doubles after each attempt.
+	:param max_delay: The longest time to wait before any retry, in seconds
+	:param retry_statuses: The HTTP status codes that should be retried
+	"""
+	max_retries: int = 4
+	backoff_base: float = 0.5
+	max_delay: float = 60.0
+	retry_statuses: frozenset = DEFAULT_RETRY_STATUSES
+
+	def should_retry(self, attempt: int, status_code: int | None = None) -> bool:
+		"""Whether to retry after the given attempt (starting at 0) failed
+
+		:param status_code: The status code of the response, or None if the request
+			failed without a response (eg a connection error or timeout)
+		"""
+		if attempt >= self.max_retries:
+			return False
+		return status_code is None or status_code in self.retry_statuses
+
+	def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+		"""Get the number of seconds to wait before retrying
+
+		If the server sent a `Retry-After` header it's honoured, otherwise the delay is
+		chosen with "full jitter" exponential backoff so that many clients that failed
+		at the same time don't all retry at the same time.
+		"""
+		delay = parse_retry_after(retry_after)
+		if delay is None:
+			delay = random.uniform(0, self.backoff_base * 2 ** attempt)
+		return min(delay, self.max_delay)
+
+
+DEFAULT_RATE_LIMITER = RateLimiter()
+DEFAULT_RETRY_POLICY = RetryPolicy()
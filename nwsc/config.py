@@ -7,6 +7,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = Path(os.path.expanduser("~")) / '.config/nws/nws.conf'
 DEFAULT_EXPORT_DIR = Path(os.path.expanduser("~")) / 'nws_exports/'
+DEFAULT_SETTINGS = {
+    'address':              '1600 Pennsylvania Avenue NW, Washington, DC 20500',
+    'measurements':         'imperial',
+    'timezone':             'US/Eastern',
+    'cache_api_responses':  True,
+    'exports_dir':          DEFAULT_EXPORT_DIR,
+}
 
 
 class ConfigManager:
@@ -20,16 +27,23 @@ class ConfigManager:
             self._init_new_user_config()
         else:
             self.config.read(self.config_path)
+            self._add_missing_settings()
     
     def _init_new_user_config(self):
-        self.config['nws'] = {
-            'address':              '1600 Pennsylvania Avenue NW, Washington, DC 20500',
-            'measurements':         'imperial',
-            'cache_api_responses':  True,
-            'exports_dir':          DEFAULT_EXPORT_DIR,
-        }
+        self.config['nws'] = DEFAULT_SETTINGS
         self.save_settings()
 
+    def _add_missing_settings(self):
+        """Add settings introduced since the config file was created, with their defaults"""
+        if not self.config.has_section('nws'):
+            self.config.add_section('nws')
+        missing = [setting for setting in DEFAULT_SETTINGS if setting not in self.config['nws']]
+        for setting in missing:
+            self.config['nws'][setting] = str(DEFAULT_SETTINGS[setting])
+        if missing:
+            logger.info(f'Added new settings to {self.config_path}: {", ".join(missing)}')
+            self.save_settings()
+
     def get_all(self) -> dict:
         return self.config.items('nws')
     
@@ -1,8 +1,5 @@
 __version__ = '0.1.0'
-BUG_REPORT_MESSAGE = (
-    'This is an unexpected result and probably a bug. Please report it '
-    'on GitHub at https://github.com/1npo/nwsc/issues.'
-)
+from nwsc import BUG_REPORT_MESSAGE
 
 
 import os
@@ -12,7 +9,9 @@ import logging
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from requests_cache import CachedSession, SQLiteCache, FileCache, NEVER_EXPIRE
+from requests_cache import CachedSession, SQLiteCache, FileCache
+from nwsc.api import NWS_API_EXPIRE_AFTER, DEFAULT_EXPIRE_AFTER
+from nwsc.api.api_request import set_output_timezone
 from nwsc.config import ConfigManager
 from nwsc.render.decorators import display_spinner
 from nwsc.render.pprint_raw import (
@@ -33,21 +32,6 @@ logging.basicConfig(format='%(asctime)s : %(levelname)-8s : %(name)s : %(message
 logger = logging.getLogger(__name__)
 
 
-class LogFilter:
-    def __init__(self, level):
-        self.level = level
-	
-    def __call__(self, record):
-        levelno = logger.level(self.level).no
-        return record["level"].no >= levelno
-
-
-log_filter = LogFilter('INFO')
-LOG_FMT_TERM = '[<level>{level: <8}</level>] <level>{message}</level>'
-logger.remove()
-logger.add(sys.stderr, format=LOG_FMT_TERM, filter=log_filter, level=0)
-
-
 parser = argparse.ArgumentParser(prog='nws',
 								 formatter_class=argparse.RawDescriptionHelpFormatter,
 								 description=f'nws v{__version__} - Lightweight NWS API Client for the Terminal')
@@ -97,16 +81,18 @@ def main():
 	config = ConfigManager()
 	params, other = parser.parse_known_args()
 	address = params.address if params.address else config.get('address')
+	if config.get('timezone'):
+		set_output_timezone(config.get('timezone'))
 	backend = SQLiteCache()
 	session = CachedSession('nwsc_cache',
 						 	backend=backend,
 							use_cache_dir=True,
-							cache_control=True,
-							expire_after=NEVER_EXPIRE,
+							expire_after=DEFAULT_EXPIRE_AFTER,
+							urls_expire_after=NWS_API_EXPIRE_AFTER,
 							)
 	with session:
 		if params.debug:
-			log_filter.level = 'DEBUG'
+			logging.getLogger().setLevel(logging.DEBUG)
 		
 		if params.command == 'get':
 			if not params.get:
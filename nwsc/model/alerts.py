@@ -5,14 +5,14 @@ from nwsc.model.nws_item import NWSItem
 
 # If a new alert is issued as an update to a prior alert, the prior alert
 # is referenced in the new alert response
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PriorAlert(NWSItem):
     prior_alert_id: str
     url: str
     sent_at: datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Alert(NWSItem):
     retrieved_at: datetime
     alert_id: str
@@ -48,7 +48,7 @@ class Alert(NWSItem):
     prior_alerts: List[PriorAlert]
     
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AlertCounts(NWSItem):
     retrieved_at: datetime
     total: int
@@ -4,7 +4,7 @@ from typing import List
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SIGMET(NWSItem):
     retrieved_at: datetime
     url: str
@@ -18,7 +18,7 @@ class SIGMET(NWSItem):
     area_polygon: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CenterWeatherAdvisory(NWSItem):
     retrieved_at: datetime
     url: str
@@ -32,7 +32,7 @@ class CenterWeatherAdvisory(NWSItem):
     area_polygon: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CentralWeatherServiceUnit(NWSItem):
     retrieved_at: datetime
     cwsu_id: str
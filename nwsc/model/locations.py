@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Location(NWSItem):
     city: str
     state: str
@@ -1,7 +1,83 @@
-from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from dataclasses import dataclass, fields, is_dataclass, make_dataclass
+from typing import Any, Callable, Tuple, get_args, get_origin, get_type_hints
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NWSItem:
     """The base class for all dataclasses, used for type hinting"""
     pass
+
+
+@lru_cache(maxsize=None)
+def frozen_model(cls: type) -> type:
+    """Get an immutable version of a model class
+
+    The frozen class has the same fields as `cls`, uses slots, and raises
+    `dataclasses.FrozenInstanceError` when a field is assigned to. Python doesn't
+    allow frozen dataclasses to inherit from mutable ones, so it isn't a subclass of
+    `cls` or `NWSItem`. Use `is_frozen` to tell frozen items apart.
+    """
+    frozen_cls = make_dataclass(f'Frozen{cls.__name__}',
+                                [(field.name, field.type) for field in fields(cls)],
+                                kw_only=True,
+                                slots=True,
+                                frozen=True)
+    frozen_cls.__module__ = cls.__module__
+    return frozen_cls
+
+
+def is_frozen(item) -> bool:
+    return is_dataclass(item) and type(item).__dataclass_params__.frozen
+
+
+def freeze(item):
+    """Get an immutable copy of a model instance
+
+    Nested models are frozen too, and lists are converted to tuples. Dicts (like
+    `Observation.cloud_layers`) are left as they are. Items that are already frozen
+    are returned as is, without copying.
+    """
+    if isinstance(item, list):
+        return tuple(freeze(value) for value in item)
+    if not is_dataclass(item) or isinstance(item, type) or is_frozen(item):
+        return item
+    frozen_cls = frozen_model(type(item))
+    return frozen_cls(**{field.name: freeze(getattr(item, field.name))
+                         for field in fields(item)})
+
+
+def _get_converter(field_type: Any) -> Callable[[Any], Any]:
+    """Get a function converting a decoded JSON value to `field_type`, or None"""
+    if field_type is datetime:
+        return lambda value: datetime.fromisoformat(value) if isinstance(value, str) else value
+    if is_dataclass(field_type):
+        return lambda value: from_dict(field_type, value) if isinstance(value, dict) else value
+    if get_origin(field_type) is list and get_args(field_type):
+        convert = _get_converter(get_args(field_type)[0])
+        if convert is not None:
+            return lambda value: [convert(item) for item in value] if isinstance(value, list) else value
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_field_converters(model: type) -> Tuple[Tuple[str, Callable], ...]:
+    hints = get_type_hints(model)
+    return tuple((field.name, _get_converter(hints.get(field.name))) for field in fields(model))
+
+
+def from_dict(model: type, data: dict):
+    """Create a model instance from a dict, like one decoded from JSON
+
+    Datetime fields are parsed from ISO 8601 strings, and fields holding a model or
+    a list of models are converted recursively. Fields missing from `data` are set
+    to None, and keys that aren't fields are ignored.
+    """
+    values = {}
+    for name, convert in _get_field_converters(model):
+        value = data.get(name)
+        if convert is not None and value is not None:
+            value = convert(value)
+        values[name] = value
+    return model(**values)
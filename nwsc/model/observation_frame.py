@@ -0,0 +1,258 @@
+"""A columnar container for many observations
+
+Lists of `Observation` are convenient for a handful of records, but aggregating
+months of station history one dataclass at a time is slow. An `ObservationFrame`
+stores the same fields as one typed NumPy array per field instead:
+
+- measurements are float64 arrays, with NaN for missing values
+- `retrieved_at` and `observed_at` are datetime64[us] arrays, with NaT for missing
+  values
+- everything else (ids, text, cloud layers) is stored in object arrays
+
+Frames can be built from observations, from raw NWS API features, or from columns,
+and converted back to a list of `Observation` at any time.
+
+NumPy datetimes have no timezone. A time column of timezone-aware datetimes (like
+`retrieved_at`, from requests-cache) is stored in UTC and listed in `utc_fields`, and
+`to_observations` returns its values as timezone-aware UTC datetimes again. A column
+of naive datetimes (like `observed_at`, in the output timezone) is stored and
+returned as it is.
+"""
+
+from datetime import datetime, timezone
+from dataclasses import fields
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from nwsc.api.measurements import process_observations_dict
+from nwsc.model.weather import Observation
+
+
+OBSERVATION_FIELDS = tuple(field.name for field in fields(Observation))
+TIME_FIELDS = ('retrieved_at', 'observed_at')
+NUMERIC_FIELDS = tuple(field.name for field in fields(Observation)
+                       if field.type in (int, float))
+INT_FIELDS = tuple(field.name for field in fields(Observation) if field.type is int)
+TIME_DTYPE = 'datetime64[us]'
+AGGREGATIONS = ('min', 'max', 'mean', 'sum', 'count')
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to a naive UTC datetime, which NumPy can store"""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_time_column(field: str, values: list) -> Tuple[np.ndarray, bool]:
+    """Convert datetimes to a datetime64 array, and check whether they were aware
+
+    :raises ValueError: If the column mixes naive and aware datetimes
+    """
+    aware = {value.tzinfo is not None for value in values if isinstance(value, datetime)}
+    if len(aware) > 1:
+        raise ValueError(f'{field} mixes naive and timezone-aware datetimes')
+    return np.array([_to_utc(value) for value in values], dtype=TIME_DTYPE), aware == {True}
+
+
+def _to_column(field: str, values: list) -> np.ndarray:
+    if field in NUMERIC_FIELDS:
+        return np.array(values, dtype=float)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class ObservationFrame:
+    """Observations stored as one NumPy array per `Observation` field
+
+    :param columns: Every `Observation` field name mapped to an array or sequence
+        of values, all the same length
+    :param utc_fields: The time fields given as datetime64 arrays that hold UTC times
+        of timezone-aware datetimes. Time fields given as sequences of datetimes are
+        checked instead.
+    """
+
+    def __init__(self, columns: Dict[str, Iterable], utc_fields: Iterable[str] = ()):
+        missing = set(OBSERVATION_FIELDS) - set(columns)
+        if missing:
+            raise ValueError(f'Missing observation fields: {", ".join(sorted(missing))}')
+        self.columns: Dict[str, np.ndarray] = {}
+        self.utc_fields = set(utc_fields)
+        for field in OBSERVATION_FIELDS:
+            values = columns[field]
+            if isinstance(values, np.ndarray):
+                pass
+            elif field in TIME_FIELDS:
+                values, aware = _to_time_column(field, list(values))
+                if aware:
+                    self.utc_fields.add(field)
+                else:
+                    self.utc_fields.discard(field)
+            else:
+                values = _to_column(field, list(values))
+            self.columns[field] = values
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'All columns must be the same length, got lengths {lengths}')
+
+    @classmethod
+    def from_dicts(cls, observations: Iterable[dict]) -> 'ObservationFrame':
+        """Build a frame from dicts with the same keys as `Observation` fields"""
+        values = {field: [] for field in OBSERVATION_FIELDS}
+        for observation in observations:
+            for field, column in values.items():
+                column.append(observation.get(field))
+        return cls(values)
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[Observation]) -> 'ObservationFrame':
+        values = {field: [] for field in OBSERVATION_FIELDS}
+        for observation in observations:
+            for field, column in values.items():
+                column.append(getattr(observation, field))
+        return cls(values)
+
+    @classmethod
+    def from_features(
+        cls,
+        features: Iterable[dict],
+        retrieved_at: datetime,
+        station_or_zone_id: str
+    ) -> 'ObservationFrame':
+        """Build a frame from the raw GeoJSON features of an observations response
+
+        Features are parsed with the same code as `process_observations_data`, but
+        without creating an `Observation` for each one.
+        """
+        return cls.from_dicts(process_observations_dict(feature, retrieved_at, station_or_zone_id)
+                              for feature in features)
+
+    def to_observations(self) -> List[Observation]:
+        columns = {}
+        for field, column in self.columns.items():
+            if field in NUMERIC_FIELDS:
+                values = column.astype(object)
+                values[np.isnan(column)] = None
+                if field in INT_FIELDS:
+                    values = [value if value is None else int(value) for value in values]
+            elif field in self.utc_fields:
+                values = [None if value is None else value.replace(tzinfo=timezone.utc)
+                          for value in column.astype(object)]
+            elif field in TIME_FIELDS:
+                values = column.astype(object)
+            else:
+                values = column
+            columns[field] = values
+        return [Observation(**dict(zip(columns, row))) for row in zip(*columns.values())]
+
+    def __len__(self) -> int:
+        return len(self.columns['observed_at'])
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self)} observations)'
+
+    def take(self, selector) -> 'ObservationFrame':
+        """Get a new frame of the rows selected by a boolean mask, indexes, or slice"""
+        return type(self)({field: column[selector] for field, column in self.columns.items()},
+                          self.utc_fields)
+
+    def sort_by_time(self) -> 'ObservationFrame':
+        """Get a new frame sorted by station, then by observation time"""
+        order = np.lexsort((self.columns['observed_at'],
+                            self.columns['station_or_zone_id'].astype(str)))
+        return self.take(order)
+
+    def _to_time(self, field: str, value: datetime) -> np.datetime64:
+        """Convert a datetime to compare with a time column"""
+        if field in self.utc_fields:
+            value = _to_utc(value)
+        return np.datetime64(value, 'us')
+
+    def between(self, start: datetime = None, end: datetime = None) -> 'ObservationFrame':
+        """Get the observations made from `start` (inclusive) to `end` (exclusive)"""
+        observed_at = self.columns['observed_at']
+        mask = ~np.isnat(observed_at)
+        if start is not None:
+            mask &= observed_at >= self._to_time('observed_at', start)
+        if end is not None:
+            mask &= observed_at < self._to_time('observed_at', end)
+        return self.take(mask)
+
+    def for_station(self, station_or_zone_id: str) -> 'ObservationFrame':
+        return self.take(self.columns['station_or_zone_id'] == station_or_zone_id)
+
+    def stations(self) -> List[str]:
+        """Get the ids of the stations or zones in the frame, leaving out missing ids"""
+        return sorted({station_id for station_id in self.columns['station_or_zone_id']
+                       if station_id is not None})
+
+    def hourly(self, field: str, how: str = 'max') -> Tuple[np.ndarray, np.ndarray]:
+        """Aggregate a measurement by the hour it was observed in
+
+        Missing values are ignored. Hours where every value is missing are NaN,
+        except for 'count', which is 0. Frames with more than one station should be
+        filtered with `for_station` first, or every station is aggregated together.
+
+        :param field: The measurement to aggregate, like 'temperature_c'
+        :param how: One of 'min', 'max', 'mean', 'sum', or 'count'
+        :returns: A sorted array of hours and an array of the aggregated values
+        """
+        if how not in AGGREGATIONS:
+            raise ValueError(f'Invalid aggregation: {how}. Valid values are: {", ".join(AGGREGATIONS)}')
+        observed_at = self.columns['observed_at']
+        present = ~np.isnat(observed_at)
+        hours = observed_at[present].astype('datetime64[h]')
+        values = self.columns[field][present]
+        order = np.argsort(hours, kind='stable')
+        hours, values = hours[order], values[order]
+        unique_hours, starts = np.unique(hours, return_index=True)
+        if not len(unique_hours):
+            return unique_hours, np.array([], dtype=float)
+
+        is_valid = ~np.isnan(values)
+        counts = np.add.reduceat(is_valid.astype(int), starts)
+        if how == 'count':
+            return unique_hours, counts
+        if how in ('sum', 'mean'):
+            sums = np.add.reduceat(np.where(is_valid, values, 0.0), starts)
+            if how == 'sum':
+                result = sums
+            else:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result = sums / counts
+        else:
+            # fmin/fmax ignore NaN unless every value is NaN
+            reducer = np.fmin if how == 'min' else np.fmax
+            result = reducer.reduceat(values, starts)
+        result = np.where(counts > 0, result, np.nan)
+        return unique_hours, result
+
+    def tendency(self, field: str = 'barometric_pressure_pa', hours: float = 3) -> np.ndarray:
+        """Get the change in a measurement over the preceding `hours` at each observation
+
+        For each observation, this is its value minus the value of the latest
+        observation from the same station made at least `hours` earlier. It's NaN
+        when there is no such observation or either value is missing.
+
+        :returns: An array of changes, in the same order as the frame
+        """
+        result = np.full(len(self), np.nan)
+        window = np.timedelta64(int(hours * 3600 * 1_000_000), 'us')
+        station_ids = self.columns['station_or_zone_id']
+        for station_id in set(station_ids):
+            indexes = np.flatnonzero(station_ids == station_id)
+            observed_at = self.columns['observed_at'][indexes]
+            indexes = indexes[~np.isnat(observed_at)]
+            observed_at = self.columns['observed_at'][indexes]
+            order = np.argsort(observed_at, kind='stable')
+            indexes, observed_at = indexes[order], observed_at[order]
+            values = self.columns[field][indexes]
+            previous = np.searchsorted(observed_at, observed_at - window, side='right') - 1
+            has_previous = previous >= 0
+            changes = np.full(len(indexes), np.nan)
+            changes[has_previous] = values[has_previous] - values[previous[has_previous]]
+            result[indexes] = changes
+        return result
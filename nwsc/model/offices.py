@@ -4,7 +4,7 @@ from typing import List
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Office(NWSItem):
     retrieved_at: datetime
     office_id: str
@@ -26,7 +26,7 @@ class Office(NWSItem):
     
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OfficeHeadline(NWSItem):
     retrieved_at: datetime
     office_id: str
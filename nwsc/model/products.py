@@ -4,21 +4,21 @@ from dataclasses import dataclass
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductType(NWSItem):
     code: str
     name: str
     
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductLocation(NWSItem):
     code: str
     name: str
     
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Product(NWSItem):
     retrieved_at: datetime
     product_id: str
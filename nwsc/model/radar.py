@@ -5,7 +5,7 @@ from nwsc.model.nws_item import NWSItem
 
 
 # See: https://www.ncei.noaa.gov/products/radar/next-generation-weather-radar
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarDataAcquisition(NWSItem):
     refreshed_at: str
     reporting_host: str
@@ -24,7 +24,7 @@ class RadarDataAcquisition(NWSItem):
     reflectivity_calibration_correction_db: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarPerformance(NWSItem):
     refreshed_at: datetime
     performance_checked_at: datetime
@@ -58,7 +58,7 @@ class RadarPerformance(NWSItem):
     horizontal_long_pulse_noise_db_mi: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarPathLoss(NWSItem):
     wg04_circulator: float
     wg02_harmonic_filter: float
@@ -73,7 +73,7 @@ class RadarPathLoss(NWSItem):
     waveguide_klystron_to_switch: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarAdaptation(NWSItem):
     refreshed_at: datetime
     reporting_host: str
@@ -92,7 +92,7 @@ class RadarAdaptation(NWSItem):
     path_loss: RadarPathLoss
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarStationAlarm(NWSItem):
     retrieved_at: datetime
     status: str
@@ -101,7 +101,7 @@ class RadarStationAlarm(NWSItem):
     event_at: datetime
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarQueueItem(NWSItem):
     retrieved_at: datetime
     radar_station_id: str
@@ -116,7 +116,7 @@ class RadarQueueItem(NWSItem):
     size: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarStation(NWSItem):
     retrieved_at: datetime
     radar_station_id: str
@@ -139,7 +139,7 @@ class RadarStation(NWSItem):
     adaptation: RadarAdaptation
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NetworkInterface(NWSItem):
     interface_name: str
     is_interface_active: bool
@@ -153,7 +153,7 @@ class NetworkInterface(NWSItem):
     packets_in_overrun: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RadarServer(NWSItem):
     retrieved_at: datetime
     host: str
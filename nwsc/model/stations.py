@@ -3,7 +3,7 @@ from datetime import datetime
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Station(NWSItem):
     retrieved_at: datetime
     station_id: str
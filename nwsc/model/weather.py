@@ -4,7 +4,7 @@ from typing import Dict, List
 from nwsc.model.nws_item import NWSItem
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Observation(NWSItem):
     retrieved_at: datetime
     station_or_zone_id: str
@@ -45,7 +45,7 @@ class Observation(NWSItem):
     cloud_layers: Dict[str, str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ForecastPeriod(NWSItem):
     period_num: int
     period_name: str
@@ -66,7 +66,7 @@ class ForecastPeriod(NWSItem):
     precipitation_probability_pc: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Forecast(NWSItem):
     retrieved_at: datetime
     forecast_office: str
@@ -5,7 +5,7 @@ from nwsc.model.nws_item import NWSItem
 
 
 # See: https://www.weather.gov/gis/CWABounds
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Zone(NWSItem):
     retrieved_at: datetime
     zone_id: str
@@ -24,14 +24,14 @@ class Zone(NWSItem):
     multi_polygon: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneForecastPeriod(NWSItem):
     period_num: int
     period_name: str
     forecast_detailed: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneForecast(NWSItem):
     retrieved_at: datetime
     zone_id: str
@@ -11,6 +11,8 @@ from requests_cache import CachedSession
 from nwsc.repository.memory import InMemoryRepository
 from nwsc.repository.sqlite import SQLiteRepository
 from nwsc.render.decorators import display_spinner
+from nwsc.api.fetch_plan import FetchPlan, DEFAULT_MAX_WORKERS
+from nwsc.api.json_codec import dumps
 from nwsc.api.get_alerts import *
 from nwsc.api.get_aviation import *
 from nwsc.api.get_enums import *
@@ -26,116 +28,89 @@ from nwsc.model import *
 logger = logging.getLogger(__name__)
 
 
-def get_all_nws_data(session: CachedSession, address: str) -> dict:
+@display_spinner('Getting all NWS data...')
+def get_all_nws_data(
+	session: CachedSession,
+	address: str,
+	max_workers: int = DEFAULT_MAX_WORKERS
+) -> dict:
 	"""Get sample weather data for testing
+
+	Independent requests are made concurrently. Only the requests that need the
+	location or the nearest station wait for those to be retrieved first.
 	"""
-	
+
+	plan = FetchPlan(max_workers=max_workers)
+
 	# weather
-	location_data = get_location(session, address)
+	plan.add('location_data', get_location, session, address)
 
 	# stations
-	local_stations_data = get_stations_near_location(session, location_data)
-	nearest_station = local_stations_data[1].station_id
-	observations_latest = get_latest_observations(session, nearest_station)
-	observations_all = get_all_observations(session, nearest_station)
-	observations_at_time = get_observations_at_time(session, 'KBOS', '2024-08-19T18:54:00+00:00')
-	forecast_extended = get_extended_forecast(session, location_data)
-	forecast_hourly = get_hourly_forecast(session, location_data)
+	plan.add('local_stations_data', get_stations_near_location, session,
+			 depends_on=['location_data'])
+	plan.add('nearest_station', lambda stations: stations[1].station_id,
+			 depends_on=['local_stations_data'])
+	plan.add('observations_latest', get_latest_observations, session,
+			 depends_on=['nearest_station'])
+	plan.add('observations_all', get_all_observations, session,
+			 depends_on=['nearest_station'])
+	plan.add('observations_at_time', get_observations_at_time, session, 'KBOS', '2024-08-19T18:54:00+00:00')
+	plan.add('forecast_extended', get_extended_forecast, session,
+			 depends_on=['location_data'])
+	plan.add('forecast_hourly', get_hourly_forecast, session,
+			 depends_on=['location_data'])
 
 	# radar
-	radar_servers = get_radar_servers(session)
-	radar_server = get_radar_server(session, 'ldm2')
-	radar_stations = get_radar_stations(session)
-	radar_station = get_radar_station(session, 'KMVX')
-	radar_station_alarms = get_radar_station_alarms(session, 'KHPX')
-	radar_queue = get_radar_queue(session, 'rds', 'KBOX')
+	plan.add('radar_servers', get_radar_servers, session)
+	plan.add('radar_server', get_radar_server, session, 'ldm2')
+	plan.add('radar_stations', get_radar_stations, session)
+	plan.add('radar_station', get_radar_station, session, 'KMVX')
+	plan.add('radar_station_alarms', get_radar_station_alarms, session, 'KHPX')
+	plan.add('radar_queue', get_radar_queue, session, 'rds', 'KBOX')
 
 	# alerts
-	alerts = get_alerts_by_area(session, 'FL')
-	alert_counts = get_alert_counts(session)
+	plan.add('alerts', get_alerts_by_area, session, 'FL')
+	plan.add('alert_counts', get_alert_counts, session)
 
 	# products
-	product_types = get_product_types(session)
-	product_types_by_location = get_product_types_by_location(session, 'BGM')
-	product_locations = get_product_locations(session)
-	product_locations_by_type = get_product_locations_by_type(session, 'RVF')
-	products = get_products(session)
-	products_by_type = get_products_by_type(session, 'RR2')
-	products_by_type_and_location = get_products_by_type_and_location(session, 'ADA', 'SRH')
-	product = get_product(session, '5359e496-498b-40b9-bae6-0f0dcddc87a2')
+	plan.add('product_types', get_product_types, session)
+	plan.add('product_types_by_location', get_product_types_by_location, session, 'BGM')
+	plan.add('product_locations', get_product_locations, session)
+	plan.add('product_locations_by_type', get_product_locations_by_type, session, 'RVF')
+	plan.add('products', get_products, session)
+	plan.add('products_by_type', get_products_by_type, session, 'RR2')
+	plan.add('products_by_type_and_location', get_products_by_type_and_location, session, 'ADA', 'SRH')
+	plan.add('product', get_product, session, '5359e496-498b-40b9-bae6-0f0dcddc87a2')
 
 	# zones
-	zone = get_zone(session, 'county', 'AKC013')
-	zones = get_zones(session, 'coastal')
-	zone_stations = get_zone_stations(session, 'TXZ120')
-	zone_observations = get_zone_observations(session, 'TNZ061')
-	zone_forecast = get_zone_forecast(session, 'TNZ061')
+	plan.add('zone', get_zone, session, 'county', 'AKC013')
+	plan.add('zones', get_zones, session, 'coastal')
+	plan.add('zone_stations', get_zone_stations, session, 'TXZ120')
+	plan.add('zone_observations', get_zone_observations, session, 'TNZ061')
+	plan.add('zone_forecast', get_zone_forecast, session, 'TNZ061')
 
 	# enums
-	valid_zones = get_valid_zones(session)
-	valid_forecast_offices = get_valid_forecast_offices(session)
+	plan.add('valid_zones', get_valid_zones, session)
+	plan.add('valid_forecast_offices', get_valid_forecast_offices, session)
 
 	# offices
-	office = get_office(session, 'BOX')
-	office_headlines = get_office_headlines(session, 'BOX')
-	office_headline = get_office_headline(session, 'BOX', 'a194056daf964fce962ec37e0d6dcdef')
+	plan.add('office', get_office, session, 'BOX')
+	plan.add('office_headlines', get_office_headlines, session, 'BOX')
+	plan.add('office_headline', get_office_headline, session, 'BOX', 'a194056daf964fce962ec37e0d6dcdef')
 
 	# aviation
-	sigmets = get_all_sigmets(session)
-	atsu_sigmets = get_all_atsu_sigmets(session, 'KKCI')
-	atsu_date_sigmets = get_all_atsu_sigmets_by_date(session, 'KKCI', '2024-08-18')
-	sigmet = get_sigmet(session, 'KKCI', '2024-08-18', '0455')
-	cwsu = get_cwsu(session, 'ZOB')
-	cwas = get_cwas(session, 'ZOB')
-	cwa = get_cwa(session, 'ZOB', '2024-08-17', 101)
+	plan.add('sigmets', get_all_sigmets, session)
+	plan.add('atsu_sigmets', get_all_atsu_sigmets, session, 'KKCI')
+	plan.add('atsu_date_sigmets', get_all_atsu_sigmets_by_date, session, 'KKCI', '2024-08-18')
+	plan.add('sigmet', get_sigmet, session, 'KKCI', '2024-08-18', '0455')
+	plan.add('cwsu', get_cwsu, session, 'ZOB')
+	plan.add('cwas', get_cwas, session, 'ZOB')
+	plan.add('cwa', get_cwa, session, 'ZOB', '2024-08-17', 101)
 
 	# glossary
-	glossary = get_glossary(session)
-
-	weather_data = {
-		'location_data':					location_data,
-		'local_stations_data':				local_stations_data,
-		'nearest_station':					nearest_station,
-		'observations_latest':				observations_latest,
-		'observations_all':					observations_all,
-		'observations_at_time':				observations_at_time,
-		'forecast_extended':				forecast_extended,
-		'forecast_hourly':					forecast_hourly,
-		'alerts':							alerts,
-		'alert_counts':						alert_counts,
-		'radar_server':						radar_server,
-		'radar_servers':					radar_servers,
-		'radar_station':					radar_station,
-		'radar_stations':					radar_stations,
-		'radar_station_alarms':				radar_station_alarms,
-		'radar_queue':						radar_queue,
-		'product_types':					product_types,
-		'product_types_by_location':		product_types_by_location,
-		'product_locations':				product_locations,
-		'product_locations_by_type':		product_locations_by_type,
-		'products':							products,
-		'products_by_type':					products_by_type,
-		'products_by_type_and_location':	products_by_type_and_location,
-		'product':							product,
-		'zone':								zone,
-		'zones':							zones,
-		'zone_stations':					zone_stations,
-		'zone_observations':				zone_observations,
-		'zone_forecast':					zone_forecast,
-		'valid_zones':						valid_zones,
-		'valid_forecast_offices':			valid_forecast_offices,
-		'office':							office,
-		'office_headlines':					office_headlines,
-		'office_headline':					office_headline,
-		'sigmets':							sigmets,
-		'atsu_sigmets':						atsu_sigmets,
-		'atsu_date_sigmets':				atsu_date_sigmets,
-		'sigmet':							sigmet,
-		'cwas':								cwas,
-		'cwa':								cwa,
-		'cwsu':								cwsu,
-		'glossary':							glossary,
-	}
+	plan.add('glossary', get_glossary, session)
+
+	weather_data = plan.run()
 	weather_data_sorted = {k: v for k, v in sorted(weather_data.items(), key=lambda i: i[0])}
 	return weather_data_sorted
 
@@ -146,11 +121,9 @@ def nws_data_to_json(session: CachedSession, address: str):
 	Path(output_path).mkdir(parents=True, exist_ok=True)
 	for name, data in nws_data.items():
 		output_file = output_path / f'nws_raw_{name}.json'
-		if is_dataclass(data):
-			data = asdict(data)
-		with open(output_file, 'w') as f:
-			f.write(json.dumps(data, default=str, indent=4))
-		logger.success(f'Wrote {name} to {output_file}')
+		with open(output_file, 'wb') as f:
+			f.write(dumps(data, indent=True))
+		logger.info(f'Wrote {name} to {output_file}')
 
 
 def pprint_raw_nws_data(session: CachedSession, address: str):
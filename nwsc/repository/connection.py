@@ -0,0 +1,126 @@
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+logger = logging.getLogger(__name__)
+
+
+# Applied to the writer connection. WAL journaling lets readers keep reading while
+# a write is in progress, and with WAL, synchronous=NORMAL only syncs at checkpoints
+# instead of on every commit, without risking corruption.
+WRITER_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -64_000,      # Negative values are in KiB, so 64 MB
+    'mmap_size': 268_435_456,   # 256 MB
+    'temp_store': 'MEMORY',
+}
+READER_PRAGMAS = {
+    'cache_size': -64_000,
+    'mmap_size': 268_435_456,
+    'temp_store': 'MEMORY',
+}
+DEFAULT_READERS = 4
+# Seconds to wait for a lock held by another connection before raising
+# sqlite3.OperationalError
+BUSY_TIMEOUT = 30
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: dict):
+    for name, value in pragmas.items():
+        conn.execute(f'PRAGMA {name} = {value}')
+
+
+class SQLiteConnectionManager:
+    """One writer connection and a pool of read-only connections to a SQLite database
+
+    Writes are serialized by a lock on the writer connection. Readers each get their
+    own read-only connection from the pool, so with WAL journaling they can query
+    the database from other threads while a write is in progress. Reader connections
+    are opened as they're needed, up to `readers` at a time.
+
+    In-memory databases are private to the connection that opened them, so for
+    ':memory:' every reader uses the writer connection (and waits for its lock).
+
+    :param sqlite_path: The path to the SQLite database to open, or ':memory:'
+    :param readers: The maximum number of read-only connections to open
+    :param writer_pragmas: The PRAGMAs to set on the writer connection
+    :param reader_pragmas: The PRAGMAs to set on each reader connection
+    """
+
+    def __init__(
+        self,
+        sqlite_path: str = ':memory:',
+        readers: int = DEFAULT_READERS,
+        writer_pragmas: dict = WRITER_PRAGMAS,
+        reader_pragmas: dict = READER_PRAGMAS
+    ):
+        self.sqlite_path = sqlite_path
+        self.is_memory = (sqlite_path == ':memory:')
+        self.max_readers = readers
+        self.reader_pragmas = reader_pragmas
+        self.writer_conn = sqlite3.connect(sqlite_path,
+                                           timeout=BUSY_TIMEOUT,
+                                           check_same_thread=False)
+        apply_pragmas(self.writer_conn, writer_pragmas)
+        self._write_lock = threading.RLock()
+        self._readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_conns = []
+        self._pool_lock = threading.Lock()
+
+    @property
+    def readers_use_writer(self) -> bool:
+        """Whether `reader` hands out the writer connection, holding the write lock"""
+        return self.is_memory or self.max_readers < 1
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = Path(self.sqlite_path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        apply_pragmas(conn, self.reader_pragmas)
+        logger.debug(f'Opened read-only connection {len(self._reader_conns) + 1} '
+                     f'to {self.sqlite_path}')
+        return conn
+
+    def _get_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if len(self._reader_conns) < self.max_readers:
+                conn = self._open_reader()
+                self._reader_conns.append(conn)
+                return conn
+        # Every reader is in use, so wait for one to be returned
+        return self._readers.get()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Get the writer connection, holding the write lock until the block exits"""
+        with self._write_lock:
+            yield self.writer_conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Get a read-only connection from the pool, returning it when the block exits"""
+        if self.readers_use_writer:
+            with self.writer() as conn:
+                yield conn
+            return
+        conn = self._get_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self):
+        with self._pool_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+            self._readers = queue.LifoQueue()
+        with self._write_lock:
+            self.writer_conn.close()
@@ -0,0 +1,75 @@
+"""Detect repeated snapshots of the same content
+
+Polling the NWS API returns the same alert, station or radar server over and over
+until it changes. Every stored snapshot is keyed by its `retrieved_at`, so storing
+each one would add an identical row per poll.
+
+`content_hash` hashes everything about an item except when it was retrieved, and
+`item_key` identifies which alert, station or radar server an item is a snapshot
+of. The SQLite repository stores a snapshot only when its hash differs from the
+latest stored version of the same item, so if an alert changes from A to B and
+back to A, all three versions are stored and the latest row is always current.
+Each stored version gets a row in the `sightings` table, and every later snapshot
+with the same content updates that row instead of being stored:
+
+- `first_seen` is the `retrieved_at` of the snapshot that was stored
+- `last_seen` is the latest `retrieved_at` the content was seen at
+- `sightings` is the number of times it was seen
+"""
+
+import hashlib
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from typing import Any, FrozenSet, Iterable
+
+
+SIGHTINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sightings
+(
+    sighting_id     INTEGER PRIMARY KEY,
+    table_name      TEXT,
+    item_key        TEXT,
+    content_hash    TEXT,
+    first_seen      TEXT, -- ISO8601 timestamp
+    last_seen       TEXT, -- ISO8601 timestamp
+    sightings       INTEGER
+);
+
+-- The latest version of an item is its sighting with the highest sighting_id
+CREATE INDEX IF NOT EXISTS sightings_item
+    ON sightings (table_name, item_key, sighting_id);
+"""
+HASH_EXCLUDED_FIELDS = frozenset({'retrieved_at'})
+
+
+def normalize(value: Any, exclude: FrozenSet[str] = HASH_EXCLUDED_FIELDS) -> Any:
+    """Convert a value to nested tuples of plain values with a stable repr
+
+    Dataclass fields named in `exclude` are left out, dict items are sorted by key,
+    and lists, tuples and sets become tuples, so equal content always normalizes to
+    the same value regardless of dict ordering or container type.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return tuple((field.name, normalize(getattr(value, field.name), exclude))
+                     for field in fields(value) if field.name not in exclude)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), normalize(item, exclude)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(item, exclude) for item in value)
+    if isinstance(value, (set, frozenset)):
+        # Sorted by repr, since sets can mix types that can't be compared
+        return tuple(sorted((normalize(item, exclude) for item in value), key=repr))
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def content_hash(item: Any, exclude: FrozenSet[str] = HASH_EXCLUDED_FIELDS) -> str:
+    """Get a hex digest of an item's content, ignoring the fields in `exclude`"""
+    return hashlib.blake2b(repr(normalize(item, exclude)).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def item_key(item: Any, key_fields: Iterable[str]) -> str:
+    """Get a string identifying which item `item` is a snapshot of, from its `key_fields`"""
+    return repr(tuple(normalize(getattr(item, field)) for field in key_fields))
@@ -1,6 +1,352 @@
-import json
-from nwsc.repository.memory import InMemoryRepository
+import os
+import logging
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from nwsc.api.json_codec import dumps, loads
+from nwsc.repository.base import BaseRepository
+from nwsc.model.nws_item import NWSItem, from_dict
+logger = logging.getLogger(__name__)
 
 
-class JSONRepository(InMemoryRepository):
-    pass
\ No newline at end of file
+# Written in place of a record when an item is deleted
+DELETED_MARKER = '__deleted__'
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class JSONRepository(BaseRepository):
+    """An append-only archive of items in a JSON Lines file
+
+    Every `create` or `update` appends one JSON record per line, so each version of
+    an item is kept and nothing already written is rewritten. Appends are buffered;
+    call `flush` (or `close`, or use the repository as a context manager) to write
+    them to disk. Reads flush the buffer first, so they always see every append.
+
+    Items are identified by the values of `key_fields`. The repository keeps an
+    index of the file offset of every version of every item, and a sorted index of
+    `time_field`, so the latest version of an item, its history, or the versions in
+    a time window are read by seeking straight to their lines. The records
+    themselves stay on disk, and `iter_records` and `iter_latest` read them back one
+    at a time.
+
+    `compact` rewrites the file with only the latest version of each item that
+    hasn't been deleted. It can run in a background thread while items are still
+    being appended.
+
+    :param path: The path to the JSON Lines file. It's created if it doesn't exist.
+    :param model: The model of the stored items
+    :param key_fields: The fields that identify an item, like ('alert_id',). Their
+        values should be strings, numbers or datetimes. Datetime values are
+        indexed as UTC ISO 8601 strings, treating naive datetimes as UTC, so an item
+        is found by the same key before and after the file is reopened.
+    :param time_field: The datetime field to index for `between`. Its values are
+        indexed as UTC times, and naive datetimes are treated as UTC, so naive and
+        aware values can be mixed.
+    :param buffer_size: The size of the write buffer in bytes
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: type,
+        key_fields: Tuple[str, ...],
+        time_field: str = 'retrieved_at',
+        buffer_size: int = WRITE_BUFFER_SIZE
+    ):
+        self.path = path
+        self.model = model
+        self.key_fields = tuple(key_fields)
+        self.time_field = time_field
+        self.buffer_size = buffer_size
+        self._datetime_key_fields = frozenset(field.name for field in fields(model)
+                                              if field.type is datetime
+                                              and field.name in self.key_fields)
+        self._lock = threading.RLock()
+        self._offsets: Dict[tuple, List[int]] = {}
+        self._times: List[Tuple[datetime, int]] = []
+        # The offsets of every version of every item that hasn't been deleted.
+        # Deleted versions stay in `_times`, and are filtered out with this.
+        self._live: Set[int] = set()
+        self._reader = None
+        self._writer = open(self.path, 'ab', buffering=self.buffer_size)
+        self._load_index()
+
+    def __enter__(self) -> 'JSONRepository':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _normalize_key(self, values: Iterable) -> tuple:
+        """Get the index key for `key_fields` values from an item, a record, or a lookup
+
+        Datetimes read back from JSON as strings, so datetime fields are converted to
+        UTC ISO 8601 strings, whichever form they're given in.
+        """
+        return tuple(
+            value if value is None or field not in self._datetime_key_fields
+            else self._get_time(value, field).isoformat()
+            for field, value in zip(self.key_fields, values)
+        )
+
+    def _get_key(self, item: NWSItem) -> tuple:
+        return self._normalize_key(getattr(item, field) for field in self.key_fields)
+
+    def _get_time(self, value, field: str = None) -> datetime:
+        """Convert a datetime, or its ISO 8601 string, to an aware UTC datetime
+
+        :param field: The name of the field the value is from, for errors (default:
+            `time_field`)
+        :raises ValueError: If the value isn't a datetime or an ISO 8601 string
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if not isinstance(value, datetime):
+            raise ValueError(f'{field or self.time_field} must be a datetime, got {value!r}')
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def _index(self, key: tuple, time: datetime, offset: int, deleted: bool = False):
+        if deleted:
+            self._live.difference_update(self._offsets.pop(key, ()))
+            return
+        self._offsets.setdefault(key, []).append(offset)
+        self._live.add(offset)
+        if time is not None:
+            insort(self._times, (time, offset))
+
+    def _load_index(self):
+        """Index every record in the file, reading it once from the start"""
+        self._offsets = {}
+        self._times = []
+        self._live = set()
+        offset = 0
+        skipped = 0
+        with open(self.path, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    # A record that can't be indexed (like a line cut short by a
+                    # crash) is skipped rather than making the whole file unreadable
+                    try:
+                        record = loads(line)
+                        key = self._normalize_key(record.get(field) for field in self.key_fields)
+                        hash(key)
+                        deleted = record.get(DELETED_MARKER, False)
+                        time = None if deleted else self._get_time(record.get(self.time_field))
+                    except (ValueError, TypeError, AttributeError) as e:
+                        logger.warning(f'Skipping unreadable record at offset {offset} '
+                                       f'of {self.path}: {e}')
+                        skipped += 1
+                    else:
+                        self._index(key, time, offset, deleted)
+                offset += len(line)
+        if offset and not line.endswith(b'\n'):
+            # End the cut-off line, so the next record appended starts on its own line
+            self._writer.write(b'\n')
+        logger.debug(f'Indexed {len(self._offsets)} items in {self.path}, skipped {skipped} records')
+
+    def _get_reader(self):
+        """Flush pending appends and get the handle used for random access reads"""
+        self._writer.flush()
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        return self._reader
+
+    def _read_at(self, offset: int) -> dict:
+        """Read the record at an offset
+
+        Compaction moves every record, so offsets must be looked up in the index
+        under the same acquisition of `_lock` as the read.
+        """
+        with self._lock:
+            reader = self._get_reader()
+            reader.seek(offset)
+            return loads(reader.readline())
+
+    def _append(self, items: Iterable[NWSItem]):
+        with self._lock:
+            for item in items:
+                # Everything that can fail is done before the record is written, so
+                # a record that can't be indexed never reaches the file
+                key = self._get_key(item)
+                hash(key)
+                time = self._get_time(getattr(item, self.time_field, None))
+                line = dumps(item) + b'\n'
+                offset = self._writer.tell()
+                self._writer.write(line)
+                self._index(key, time, offset)
+
+    def flush(self, fsync: bool = False):
+        """Write buffered appends to the file, and optionally to the disk itself"""
+        with self._lock:
+            self._writer.flush()
+            if fsync:
+                os.fsync(self._writer.fileno())
+
+    def close(self):
+        with self._lock:
+            self._writer.close()
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def serialize(self, item: NWSItem) -> dict:
+        return loads(dumps(item))
+
+    def deserialize(self, data: dict) -> NWSItem:
+        return from_dict(self.model, data)
+
+    def create(self, item: NWSItem) -> NWSItem:
+        self._append([item])
+        return item
+
+    def create_many(self, items: Iterable[NWSItem]) -> int:
+        items = list(items)
+        self._append(items)
+        return len(items)
+
+    def update(self, item: NWSItem) -> bool:
+        """Append a new version of an item. Its earlier versions are kept until `compact`."""
+        self._append([item])
+        return True
+
+    def delete(self, item: NWSItem) -> bool:
+        """Append a marker that deletes every version of an item"""
+        key = self._get_key(item)
+        with self._lock:
+            if key not in self._offsets:
+                return False
+            record = dict(zip(self.key_fields, key))
+            record[DELETED_MARKER] = True
+            self._writer.write(dumps(record) + b'\n')
+            self._index(key, None, None, deleted=True)
+        return True
+
+    def get(self, *key) -> NWSItem:
+        """Get the latest version of the item with the given `key_fields` values"""
+        with self._lock:
+            offsets = self._offsets.get(self._normalize_key(key))
+            if not offsets:
+                return None
+            record = self._read_at(offsets[-1])
+        return self.deserialize(record)
+
+    def history(self, *key) -> List[NWSItem]:
+        """Get every version of an item, oldest first"""
+        with self._lock:
+            records = [self._read_at(offset)
+                       for offset in self._offsets.get(self._normalize_key(key), [])]
+        return [self.deserialize(record) for record in records]
+
+    def between(self, start: datetime = None, end: datetime = None) -> List[NWSItem]:
+        """Get the versions with `time_field` from `start` (inclusive) to `end` (exclusive)
+
+        Versions of items that have since been deleted are left out. Naive `start`
+        and `end` datetimes are treated as UTC, like the indexed values.
+        """
+        start, end = self._get_time(start), self._get_time(end)
+        with self._lock:
+            lo = 0 if start is None else bisect_left(self._times, (start, -1))
+            hi = len(self._times) if end is None else bisect_left(self._times, (end, -1))
+            offsets = [offset for _, offset in self._times[lo:hi] if offset in self._live]
+            records = [self._read_at(offset) for offset in offsets]
+        return [self.deserialize(record) for record in records]
+
+    def iter_records(self) -> Iterator[dict]:
+        """Yield every record in the file as a dict, in the order they were written
+
+        This includes earlier versions of items and deletion markers. Lines that
+        aren't valid JSON are skipped, like when the index is loaded.
+        """
+        self.flush()
+        with open(self.path, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    try:
+                        yield loads(line)
+                    except ValueError as e:
+                        logger.warning(f'Skipping unreadable record in {self.path}: {e}')
+
+    def iter_latest(self) -> Iterator[NWSItem]:
+        """Yield the latest version of every item that hasn't been deleted
+
+        Items are yielded in the order their latest versions were written when
+        iteration started. Each item's offset is looked up again as it's read, so
+        this is safe to use while the file is being compacted. Items deleted in the
+        meantime are skipped, and items updated in the meantime are read at their
+        newest version.
+        """
+        with self._lock:
+            keys = [key for _, key in sorted((offsets[-1], key)
+                                             for key, offsets in self._offsets.items())]
+        for key in keys:
+            with self._lock:
+                offsets = self._offsets.get(key)
+                if not offsets:
+                    continue
+                record = self._read_at(offsets[-1])
+            yield self.deserialize(record)
+
+    def get_all(self) -> List[NWSItem]:
+        return list(self.iter_latest())
+
+    def filter_by(self, filter: dict) -> List[NWSItem]:
+        """Get the latest version of every item whose fields equal all of the values in `filter`"""
+        if set(filter) == set(self.key_fields):
+            item = self.get(*(filter[field] for field in self.key_fields))
+            return [] if item is None else [item]
+        return [item for item in self.iter_latest()
+                if all(getattr(item, field) == value for field, value in filter.items())]
+
+    def compact(self, background: bool = False) -> 'threading.Thread | None':
+        """Rewrite the file with only the latest version of each item
+
+        Records appended while the file is being rewritten are copied over at the
+        end, so compaction doesn't need to block writers until the final swap.
+
+        :param background: Run in a background thread and return the thread
+        """
+        if background:
+            thread = threading.Thread(target=self._compact, name='jsonl-compaction', daemon=True)
+            thread.start()
+            return thread
+        self._compact()
+
+    def _compact(self):
+        with self._lock:
+            self._writer.flush()
+            end = self._writer.tell()
+            keep = sorted(offsets[-1] for offsets in self._offsets.values())
+        compacted_path = self.path + '.compact'
+        source = open(self.path, 'rb')
+        compacted = open(compacted_path, 'wb')
+        try:
+            for offset in keep:
+                source.seek(offset)
+                compacted.write(source.readline())
+            with self._lock:
+                # Copy whatever was appended since compaction started, then swap the
+                # files while no one can append. Both files are closed before the
+                # swap, since open files can't be replaced on Windows.
+                self._writer.flush()
+                source.seek(end)
+                compacted.write(source.read())
+                compacted.flush()
+                os.fsync(compacted.fileno())
+                source.close()
+                compacted.close()
+                self.close()
+                os.replace(compacted_path, self.path)
+                self._writer = open(self.path, 'ab', buffering=self.buffer_size)
+                # Rebuilding the index also drops anything superseded or deleted by
+                # the records that were copied from the end
+                self._load_index()
+        finally:
+            source.close()
+            compacted.close()
+        logger.info(f'Compacted {self.path} from {end} to {os.path.getsize(self.path)} bytes')
@@ -0,0 +1,143 @@
+"""Describe how models with nested fields are stored across SQLite tables
+
+Most models map to one table row, but some have fields holding many values, like
+`Alert.areas_ugc` (a list of strings), `Alert.prior_alerts` (a list of models), or
+`Observation.cloud_layers` (a dict). Those are stored as rows in a child table,
+each carrying the key of the parent item they belong to.
+
+A `ModelMapping` lists a model's child tables, and `SQLiteRepository.save_nested`
+and `get_nested` use it to write an item with all of its children, and read them
+back, in one go. `MODEL_MAPPINGS` holds the mappings for the tables defined in
+`schemas/sqlite`.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from nwsc.model.alerts import Alert, PriorAlert
+from nwsc.model.radar import RadarServer, NetworkInterface
+from nwsc.model.weather import Forecast, ForecastPeriod, Observation
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChildMapping:
+    """How one nested field of a model is stored in a child table
+
+    Set exactly one of `model` (for a list of models), `value_column` alone (for a
+    list of plain values), or `key_column` and `value_column` (for a dict).
+
+    :param field: The name of the parent model's field holding the children
+    :param table: The child table
+    :param parent_columns: Child table columns mapped to the parent field stored in
+        them. These must include every field in the parent's `key`.
+    :param model: The model of each child
+    :param key_column: The column storing the keys of a dict field
+    :param value_column: The column storing each value of a list, or each value of
+        a dict
+    """
+    field: str
+    table: str
+    parent_columns: Dict[str, str]
+    model: type = None
+    key_column: str = None
+    value_column: str = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ModelMapping:
+    """How a model with nested fields is stored
+
+    :param model: The parent model
+    :param table: The table parent items are stored in, or None if the parent's
+        fields are stored in every child row instead (like `Forecast`, which is
+        stored as one `forecasts` row per period)
+    :param key: The parent fields that identify one item
+    :param children: The mappings of the parent's nested fields
+    """
+    model: type
+    table: str
+    key: Tuple[str, ...]
+    children: Tuple[ChildMapping, ...]
+
+
+def _alert_values(field: str, table: str, value_column: str) -> ChildMapping:
+    return ChildMapping(field=field,
+                        table=table,
+                        parent_columns={'retrieved_at': 'retrieved_at', 'alert_id': 'alert_id'},
+                        value_column=value_column)
+
+
+ALERT_MAPPING = ModelMapping(
+    model=Alert,
+    table='alerts',
+    key=('retrieved_at', 'alert_id'),
+    children=(
+        _alert_values('affected_zones_urls', 'alert_affected_zones', 'affected_zone_url'),
+        _alert_values('areas_ugc', 'alert_areas_ugc', 'cap_ugc_area'),
+        _alert_values('areas_same', 'alert_areas_same', 'cap_same_area'),
+        _alert_values('cap_awips_id', 'alert_cap_awips_ids', 'cap_awips_id'),
+        _alert_values('cap_wmo_id', 'alert_cap_wmo_ids', 'cap_wmo_id'),
+        _alert_values('cap_headline', 'alert_cap_headlines', 'cap_headline'),
+        _alert_values('cap_blocked_channels', 'alert_cap_blocked_channels', 'cap_blocked_channel'),
+        _alert_values('cap_vtec', 'alert_cap_vtecs', 'cap_vtec'),
+        ChildMapping(field='prior_alerts',
+                     table='prior_alerts',
+                     parent_columns={'retrieved_at': 'retrieved_at', 'parent_alert_id': 'alert_id'},
+                     model=PriorAlert),
+    )
+)
+
+RADAR_SERVER_MAPPING = ModelMapping(
+    model=RadarServer,
+    table='radar_servers',
+    key=('retrieved_at', 'host'),
+    children=(
+        ChildMapping(field='interfaces',
+                     table='network_interfaces',
+                     parent_columns={'retrieved_at': 'retrieved_at', 'host': 'host'},
+                     model=NetworkInterface),
+    )
+)
+
+FORECAST_MAPPING = ModelMapping(
+    model=Forecast,
+    table=None,
+    key=('retrieved_at', 'forecast_office', 'grid_x', 'grid_y'),
+    children=(
+        ChildMapping(field='periods',
+                     table='forecasts',
+                     parent_columns={'retrieved_at': 'retrieved_at',
+                                     'forecast_office': 'forecast_office',
+                                     'grid_x': 'grid_x',
+                                     'grid_y': 'grid_y',
+                                     'generated_at': 'generated_at',
+                                     'updated_at': 'updated_at'},
+                     model=ForecastPeriod),
+    )
+)
+
+OBSERVATION_MAPPING = ModelMapping(
+    model=Observation,
+    table='observations',
+    key=('retrieved_at', 'station_or_zone_id', 'observed_at'),
+    children=(
+        ChildMapping(field='cloud_layers',
+                     table='observations_cloud_layers',
+                     parent_columns={'retrieved_at': 'retrieved_at',
+                                     'station_or_zone_id': 'station_or_zone_id',
+                                     'observed_at': 'observed_at'},
+                     key_column='cloud_layer_height',
+                     value_column='cloud_layer_description'),
+    )
+)
+
+MODEL_MAPPINGS: Dict[type, ModelMapping] = {
+    mapping.model: mapping
+    for mapping in (ALERT_MAPPING, RADAR_SERVER_MAPPING, FORECAST_MAPPING, OBSERVATION_MAPPING)
+}
+
+
+def get_mapping(model: type) -> ModelMapping:
+    if model not in MODEL_MAPPINGS:
+        raise ValueError(f'No nested mapping for {model.__name__}. Mapped models: '
+                         f'{", ".join(model.__name__ for model in MODEL_MAPPINGS)}')
+    return MODEL_MAPPINGS[model]
@@ -1,81 +1,357 @@
 import logging
-from typing import List
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List
 from copy import deepcopy
 from nwsc.repository.base import BaseRepository
-from nwsc.model.nws_item import NWSItem
+from nwsc.model.nws_item import NWSItem, is_frozen
 logger = logging.getLogger(__name__)
 
 
+class SortedIndex:
+    """The keys of items ordered by the value of one of their fields
+
+    Entries are kept as a sorted list of (value, key) tuples, so range lookups are
+    a binary search. Items where the field is None can't be ordered, and are kept
+    in `missing` instead.
+    """
+
+    __slots__ = ('field', 'entries', 'missing')
+
+    def __init__(self, field: str):
+        self.field = field
+        self.entries: List[tuple] = []
+        self.missing: Dict[int, None] = {}
+
+    def add(self, key: int, obj: NWSItem):
+        value = getattr(obj, self.field, None)
+        if value is None:
+            self.missing[key] = None
+        else:
+            insort(self.entries, (value, key))
+
+    def remove(self, key: int, obj: NWSItem):
+        value = getattr(obj, self.field, None)
+        if value is None:
+            self.missing.pop(key, None)
+            return
+        i = bisect_left(self.entries, (value, key))
+        if i < len(self.entries) and self.entries[i] == (value, key):
+            del self.entries[i]
+
+    def bounds(self, start=None, end=None) -> tuple:
+        """Get the slice of `entries` from `start` (inclusive) to `end` (exclusive)"""
+        # Keys are never negative, so (value, -1) sorts before every entry for value
+        lo = 0 if start is None else bisect_left(self.entries, (start, -1))
+        hi = len(self.entries) if end is None else bisect_left(self.entries, (end, -1))
+        return lo, max(lo, hi)
+
+    def keys(self, start=None, end=None) -> List[int]:
+        lo, hi = self.bounds(start, end)
+        return [key for _, key in self.entries[lo:hi]]
+
+
 class InMemoryRepository(BaseRepository):
-    def __init__(self):
-        self._repository = []
-    
-    def _filter_mask(self, obj: NWSItem, filter: dict):
-        mask = None
-        for key, value in filter.items():
-            mask_element = (getattr(obj, key) == value)
-            if mask is None:
-                mask = mask_element
+    """
+    Items are stored in a dict keyed by an internal, auto-incrementing key, so the
+    insertion order is kept. Fields listed in `indexes` get a hash index mapping each
+    field value to the keys of the items that have it. Equality lookups on indexed
+    fields are O(1), and filters on several fields only check the items found by the
+    most selective index.
+
+    Indexes are maintained by `create`, `update` and `delete`. Stored items must not
+    be modified in place, or the indexes will go stale; pass a modified copy to
+    `update` instead.
+
+    Fields listed in `sorted_indexes` are also kept in order, for the range queries
+    `between`, `overlapping` and `latest_per`. These are usually datetime fields like
+    'observed_at', 'effective_at' or 'expires_at'. Values of a sorted field must be
+    comparable with each other, so datetimes in one field must be either all naive
+    or all timezone-aware.
+
+    :param indexes: The names of the fields to index, like 'station_id' or 'alert_id'.
+        Indexed field values must be hashable.
+    :param sorted_indexes: The names of the fields to keep a sorted index of
+    """
+
+    def __init__(self, indexes: Iterable[str] = (), sorted_indexes: Iterable[str] = ()):
+        self._repository: Dict[int, NWSItem] = {}
+        self._next_key = 0
+        self._indexes: Dict[str, Dict[Any, Dict[int, None]]] = {}
+        self._sorted_indexes: Dict[str, SortedIndex] = {}
+        for field in indexes:
+            self.add_index(field)
+        for field in sorted_indexes:
+            self.add_sorted_index(field)
+
+    @property
+    def indexes(self) -> List[str]:
+        return list(self._indexes)
+
+    @property
+    def sorted_indexes(self) -> List[str]:
+        return list(self._sorted_indexes)
+
+    def add_index(self, field: str):
+        """Index a field, including the items that are already stored"""
+        if field in self._indexes:
+            return
+        index = self._indexes[field] = {}
+        for key, obj in self._repository.items():
+            index.setdefault(getattr(obj, field, None), {})[key] = None
+        logger.debug(f'Indexed {len(self._repository)} items on {field}')
+
+    def add_sorted_index(self, field: str):
+        """Keep a sorted index of a field, including the items that are already stored"""
+        if field in self._sorted_indexes:
+            return
+        index = SortedIndex(field)
+        for key, obj in self._repository.items():
+            value = getattr(obj, field, None)
+            if value is None:
+                index.missing[key] = None
             else:
-                mask = mask & mask_element
-        return mask
-    
-    def _get_index(self):
-        if len(filter) == 1:
-            key = list(filter.keys())[0]
-            value = list(filter.values())[0]
-            index = next((i for i, obj in enumerate(self._repository)
-                          if getattr(obj, key) == value), None)
+                index.entries.append((value, key))
+        index.entries.sort()
+        self._sorted_indexes[field] = index
+        logger.debug(f'Created a sorted index of {len(self._repository)} items on {field}')
+
+    def _get_sorted_index(self, field: str) -> SortedIndex:
+        if field not in self._sorted_indexes:
+            raise KeyError(f'{field} has no sorted index. Sorted indexes: {", ".join(self._sorted_indexes)}')
+        return self._sorted_indexes[field]
+
+    def _index_item(self, key: int, obj: NWSItem):
+        for field, index in self._indexes.items():
+            # The inner dicts are used as insertion-ordered sets of keys
+            index.setdefault(getattr(obj, field, None), {})[key] = None
+        for index in self._sorted_indexes.values():
+            index.add(key, obj)
+
+    def _unindex_item(self, key: int, obj: NWSItem):
+        for field, index in self._indexes.items():
+            value = getattr(obj, field, None)
+            keys = index.get(value)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[value]
+        for index in self._sorted_indexes.values():
+            index.remove(key, obj)
+
+    def _filter_mask(self, obj: NWSItem, filter: dict) -> bool:
+        return all(getattr(obj, key) == value for key, value in filter.items())
+
+    def _iter_keys(self, filter: dict) -> Iterator[int]:
+        """Yield the keys of the items matching every field in `filter`, in order"""
+        indexed = [self._indexes[key].get(value, {}) for key, value in filter.items()
+                   if key in self._indexes]
+        if not indexed:
+            candidates = list(self._repository)
+            remaining = filter
         else:
-            index = next((i for i, obj in enumerate(self._repository)
-                          if self._filter_mask(obj, filter)), None)
-        return index
+            # Start from the smallest candidate set, then check the rest of the
+            # filter against each candidate. Keys are sorted because an update can
+            # move an item to the end of an index entry.
+            smallest = min(indexed, key=len)
+            candidates = sorted(smallest)
+            remaining = {key: value for key, value in filter.items()
+                         if key not in self._indexes}
+            indexed = [keys for keys in indexed if keys is not smallest]
+        for key in candidates:
+            if any(key not in keys for keys in indexed):
+                continue
+            if not remaining or self._filter_mask(self._repository[key], remaining):
+                yield key
+
+    def _get_index(self, filter: dict) -> int:
+        return next(self._iter_keys(filter), None)
 
     def get_all(self) -> list:
-        return self._repository
+        return list(self._repository.values())
 
     def get(self, id_field: str, id_value: str) -> dict:
         if not isinstance(id_field, str):
             id_field = str(id_field)
         if not isinstance(id_value, str):
             id_value = str(id_value)
-        return next((obj for obj in self._repository
-                     if getattr(obj, id_field) == id_value), None)
-    
+        key = self._get_index({id_field: id_value})
+        return None if key is None else self._repository[key]
+
     def filter_by(self, filter: dict) -> List[NWSItem]:
-        if len(filter) == 1:
-            key = list(filter.keys())[0]
-            value = list(filter.values())[0]
-            return [next((obj for obj in self._repository
-                         if getattr(obj, key) == value), None)]
-        else:
+        """Get every item whose fields equal all of the values in `filter`"""
+        return [self._repository[key] for key in self._iter_keys(filter)]
+
+    def between(
+        self,
+        field: str,
+        start: datetime = None,
+        end: datetime = None,
+        filter: dict = None
+    ) -> List[NWSItem]:
+        """Get the items where `field` is from `start` (inclusive) to `end` (exclusive)
+
+        For example, the observations from a station in a time window:
+
+        .. code-block:: python
+
+            repo.between('observed_at', start, end, {'station_or_zone_id': 'KVGT'})
+
+        :param field: A field with a sorted index
+        :param start: The lowest value to include, or None for no lower bound
+        :param end: The value to stop before, or None for no upper bound
+        :param filter: Other field values the items must equal, like `filter_by`
+        :returns: The matching items, ordered by `field`
+        """
+        index = self._get_sorted_index(field)
+        lo, hi = index.bounds(start, end)
+        if not filter:
+            return [self._repository[key] for _, key in index.entries[lo:hi]]
+
+        indexed = [self._indexes[key].get(value, {}) for key, value in filter.items()
+                   if key in self._indexes]
+        smallest = min(indexed, key=len, default=None)
+        if smallest is not None and len(smallest) < hi - lo:
+            # Fewer items match the filter than the range, so check those instead
             items = []
-            for key, value in filter.items():
-                items.append(next((obj for obj in self._repository
-                                  if getattr(obj, key) == value), None))
+            for obj in self.filter_by(filter):
+                value = getattr(obj, field, None)
+                if (value is not None
+                        and (start is None or value >= start)
+                        and (end is None or value < end)):
+                    items.append(obj)
+            items.sort(key=lambda obj: getattr(obj, field))
             return items
-    
-    def create(self, item: NWSItem) -> NWSItem:
-        new_item = deepcopy(item)
-        self._repository.append(new_item)
+        return [self._repository[key] for _, key in index.entries[lo:hi]
+                if self._filter_mask(self._repository[key], filter)]
+
+    def overlapping(
+        self,
+        at: datetime,
+        start_field: str = 'effective_at',
+        end_field: str = 'expires_at'
+    ) -> List[NWSItem]:
+        """Get the items whose interval contains `at`, like the alerts in effect now
+
+        An item matches when `start_field` <= `at` < `end_field`. A None start or end
+        is treated as unbounded. Both fields need a sorted index; whichever side of
+        the interval matches fewer items is searched, and the other side is checked
+        per item.
+
+        :returns: The matching items, in insertion order
+        """
+        starts = self._get_sorted_index(start_field)
+        ends = self._get_sorted_index(end_field)
+        # Every key is below _next_key, so (at, _next_key) sorts after every entry
+        # for `at`
+        started_hi = bisect_left(starts.entries, (at, self._next_key))
+        not_ended_lo = bisect_left(ends.entries, (at, self._next_key))
+        started_count = started_hi + len(starts.missing)
+        not_ended_count = len(ends.entries) - not_ended_lo + len(ends.missing)
+
+        if started_count <= not_ended_count:
+            keys = [key for _, key in starts.entries[:started_hi]]
+            keys.extend(starts.missing)
+            check_field, in_range = end_field, lambda value: value > at
+        else:
+            keys = [key for _, key in ends.entries[not_ended_lo:]]
+            keys.extend(ends.missing)
+            check_field, in_range = start_field, lambda value: value <= at
+        items = []
+        for key in sorted(keys):
+            obj = self._repository[key]
+            value = getattr(obj, check_field, None)
+            if value is None or in_range(value):
+                items.append(obj)
+        return items
+
+    def latest_per(self, key_field: str, field: str = 'retrieved_at') -> Dict[Any, NWSItem]:
+        """Get the item with the highest value of `field` for each value of `key_field`
+
+        For example, the latest observation from each station:
+        `repo.latest_per('station_or_zone_id', 'observed_at')`. Items where `field`
+        is None are ignored.
+
+        :param key_field: The field to group items by
+        :param field: A field with a sorted index
+        :returns: Each value of `key_field` mapped to its latest item
+        """
+        index = self._get_sorted_index(field)
+        # With a hash index on key_field the number of groups is known, so the
+        # search can stop as soon as every group has been seen
+        groups = len(self._indexes[key_field]) if key_field in self._indexes else None
+        latest = {}
+        for _, key in reversed(index.entries):
+            obj = self._repository[key]
+            latest.setdefault(getattr(obj, key_field, None), obj)
+            if len(latest) == groups:
+                break
+        return latest
+
+    def create(self, item: NWSItem, copy: bool = True) -> NWSItem:
+        """Store an item
+
+        :param item: The item to store
+        :param copy: Store a deep copy of the item, so later changes to `item` don't
+            affect the repository. Pass False to hand ownership of `item` over to
+            the repository instead, which is much faster for nested models like
+            `Alert` and `RadarServer`; the caller must not modify it afterwards.
+            Frozen items (see `nwsc.model.nws_item.freeze`) are never copied.
+        :returns: The stored item
+        """
+        new_item = deepcopy(item) if copy and not is_frozen(item) else item
+        key = self._next_key
+        self._next_key += 1
+        self._repository[key] = new_item
+        self._index_item(key, new_item)
         return new_item
 
+    def create_many(self, items: Iterable[NWSItem], copy: bool = True) -> List[NWSItem]:
+        """Store many items at once
+
+        Like calling `create` for each item, but sorted indexes are re-sorted once
+        for the whole batch instead of for each item.
+
+        :param items: The items to store
+        :param copy: Whether to store deep copies of the items, like `create`
+        :returns: The stored items
+        """
+        new_items = [deepcopy(item) if copy and not is_frozen(item) else item
+                     for item in items]
+        first_key = self._next_key
+        self._next_key += len(new_items)
+        for field, index in self._indexes.items():
+            for key, obj in enumerate(new_items, first_key):
+                index.setdefault(getattr(obj, field, None), {})[key] = None
+        for field, index in self._sorted_indexes.items():
+            for key, obj in enumerate(new_items, first_key):
+                value = getattr(obj, field, None)
+                if value is None:
+                    index.missing[key] = None
+                else:
+                    index.entries.append((value, key))
+            index.entries.sort()
+        self._repository.update(zip(range(first_key, self._next_key), new_items))
+        return new_items
+
     def update(self, item: NWSItem, filter: dict) -> bool:
-        index = self._get_index(filter)
-        if index is not None:
-            self._repository[index] = item
+        key = self._get_index(filter)
+        if key is not None:
+            self._unindex_item(key, self._repository[key])
+            self._repository[key] = item
+            self._index_item(key, item)
             return True
         return False
-    
+
     def delete(self, item: NWSItem, filter: dict) -> bool:
-        index = self._get_index(filter)
-        if index is not None:
-            self._repository.pop(index)
+        key = self._get_index(filter)
+        if key is not None:
+            self._unindex_item(key, self._repository.pop(key))
             return True
         return False
-    
+
     def serialize(self, item):
         raise NotImplementedError
-    
+
     def deserialize(self, data):
         raise NotImplementedError
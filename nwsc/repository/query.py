@@ -0,0 +1,153 @@
+"""Build parameterized SELECT, UPDATE and DELETE statements for SQLiteRepository
+
+Filter values are always passed to SQLite as bound parameters, never spliced into
+the SQL text. This means quotes in values can't break a query, and queries with the
+same shape share one SQL string, so sqlite3 can reuse its prepared statement.
+
+A filter maps column names to values:
+
+- a plain value matches with `=`, and None matches with `IS NULL`
+- a list, tuple, set or frozenset matches any of its values with `IN`
+- a `Range` matches from its start (inclusive) to its end (exclusive)
+
+.. code-block:: python
+
+    query, params = build_select(
+        'observations',
+        {'station_or_zone_id': ['KVGT', 'KLAS'], 'observed_at': Range(start, end)},
+        order_by='-observed_at',
+        limit=100,
+    )
+
+Table and column names can't be bound parameters, so they're checked against
+`IDENTIFIER_PATTERN` instead, and a `ValueError` is raised for anything else.
+"""
+
+import re
+from typing import Any, Iterable, List, Tuple
+
+
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+SEQUENCE_TYPES = (list, tuple, set, frozenset)
+
+
+class Range:
+    """Match values from `start` (inclusive) to `end` (exclusive)
+
+    Either bound can be None to leave that side open.
+    """
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start: Any = None, end: Any = None):
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f'Range({self.start!r}, {self.end!r})'
+
+
+def validate_identifier(name: str) -> str:
+    if not isinstance(name, str) or not IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f'Invalid table or column name: {name!r}')
+    return name
+
+
+def build_where(filter: dict) -> Tuple[str, List[Any]]:
+    """Build a WHERE clause matching every item in `filter`
+
+    :returns: The clause (an empty string if the filter is empty) and its parameters
+    """
+    conditions = []
+    params = []
+    for column, value in (filter or {}).items():
+        column = validate_identifier(column)
+        if value is None:
+            conditions.append(f'{column} IS NULL')
+        elif isinstance(value, Range):
+            if value.start is not None:
+                conditions.append(f'{column} >= ?')
+                params.append(value.start)
+            if value.end is not None:
+                conditions.append(f'{column} < ?')
+                params.append(value.end)
+        elif isinstance(value, SEQUENCE_TYPES):
+            values = list(value)
+            if not values:
+                # Nothing is IN an empty list
+                conditions.append('0')
+                continue
+            conditions.append(f'{column} IN ({", ".join("?" * len(values))})')
+            params.extend(values)
+        else:
+            conditions.append(f'{column} = ?')
+            params.append(value)
+    if not conditions:
+        return '', params
+    return 'WHERE ' + ' AND '.join(conditions), params
+
+
+def build_order_by(order_by: 'str | Iterable[str]') -> str:
+    """Build an ORDER BY clause from column names, prefixed with '-' for descending"""
+    if not order_by:
+        return ''
+    if isinstance(order_by, str):
+        order_by = [order_by]
+    terms = []
+    for column in order_by:
+        if column.startswith('-'):
+            terms.append(f'{validate_identifier(column[1:])} DESC')
+        else:
+            terms.append(validate_identifier(column))
+    return 'ORDER BY ' + ', '.join(terms)
+
+
+def build_select(
+    table: str,
+    filter: dict = None,
+    order_by: 'str | Iterable[str]' = None,
+    limit: int = None,
+    offset: int = None,
+    columns: Iterable[str] = None,
+    distinct: bool = False
+) -> Tuple[str, List[Any]]:
+    """Build a SELECT statement and its parameters
+
+    :param table: The table to select from
+    :param filter: The values to match, as described in the module docstring
+    :param order_by: A column name or list of column names to sort by. Prefix a name
+        with '-' to sort it in descending order.
+    :param limit: The maximum number of rows to return
+    :param offset: The number of rows to skip
+    :param columns: The columns to select (default: all columns)
+    :param distinct: Whether to leave out duplicate rows
+    """
+    column_list = ', '.join(validate_identifier(column) for column in columns) if columns else '*'
+    where, params = build_where(filter)
+    select = 'SELECT DISTINCT' if distinct else 'SELECT'
+    clauses = [f'{select} {column_list} FROM {validate_identifier(table)}', where,
+               build_order_by(order_by)]
+    if limit is not None or offset is not None:
+        clauses.append('LIMIT ?')
+        params.append(-1 if limit is None else int(limit))
+    if offset is not None:
+        clauses.append('OFFSET ?')
+        params.append(int(offset))
+    return ' '.join(clause for clause in clauses if clause), params
+
+
+def build_update(table: str, columns: Iterable[str], filter: dict) -> Tuple[str, List[Any]]:
+    """Build an UPDATE statement setting `columns` on the rows matching `filter`
+
+    The returned parameters are only those of the WHERE clause; the new column
+    values go in front of them, in the same order as `columns`.
+    """
+    assignments = ', '.join(f'{validate_identifier(column)} = ?' for column in columns)
+    where, params = build_where(filter)
+    query = f'UPDATE OR IGNORE {validate_identifier(table)} SET {assignments} {where}'
+    return query.strip(), params
+
+
+def build_delete(table: str, filter: dict) -> Tuple[str, List[Any]]:
+    where, params = build_where(filter)
+    return f'DELETE FROM {validate_identifier(table)} {where}'.strip(), params
@@ -152,3 +152,12 @@ CREATE TABLE IF NOT EXISTS alert_counts_zone
     PRIMARY KEY     (retrieved_at, zone_name),
     FOREIGN KEY     (retrieved_at) REFERENCES alert_counts_total_land_marine (retrieved_at)
 );
+
+-- Alerts are looked up by ID, by the zones they affect, and by whether they're
+-- still in effect
+CREATE INDEX IF NOT EXISTS alerts_alert_id
+    ON alerts (alert_id, retrieved_at);
+CREATE INDEX IF NOT EXISTS alerts_expires_at
+    ON alerts (expires_at, effective_at);
+CREATE INDEX IF NOT EXISTS alert_areas_ugc_area
+    ON alert_areas_ugc (cap_ugc_area, alert_id);
@@ -48,3 +48,9 @@ CREATE TABLE IF NOT EXISTS central_weather_service_units
     nws_region	    TEXT,
     PRIMARY KEY     (cwsu_id)
 );
+
+-- Active SIGMETs and CWAs are found by their expiry
+CREATE INDEX IF NOT EXISTS sigmets_expires_at
+    ON sigmets (expires_at, effective_at);
+CREATE INDEX IF NOT EXISTS center_weather_advisories_expires_at
+    ON center_weather_advisories (expires_at, effective_at);
@@ -197,7 +197,7 @@ CREATE TABLE IF NOT EXISTS network_interfaces
     packets_in_error	INTEGER,
     packets_in_dropped	INTEGER,
     packets_in_overrun	INTEGER,
-    PRIMARY KEY         (retrieved_at, host),
+    PRIMARY KEY         (retrieved_at, host, interface_name),
     FOREIGN KEY         (retrieved_at, host) REFERENCES radar_servers (retrieved_at, host)
 );
 
@@ -232,3 +232,9 @@ CREATE TABLE IF NOT EXISTS radar_station_alarms
     active_channel	INTEGER,
     PRIMARY KEY     (event_at)
 );
+
+-- Radar history is queried by station or server, then time
+CREATE INDEX IF NOT EXISTS radar_stations_station_time
+    ON radar_stations (radar_station_id, retrieved_at);
+CREATE INDEX IF NOT EXISTS radar_servers_host_time
+    ON radar_servers (host, retrieved_at);
@@ -40,17 +40,18 @@ CREATE TABLE IF NOT EXISTS observations
     wind_chill_f	            REAL,
     heat_index_c	            REAL,
     heat_index_f	            REAL,
-    PRIMARY KEY                 (retrieved_at, station_or_zone_id)
+    PRIMARY KEY                 (retrieved_at, station_or_zone_id, observed_at)
 );
 
 CREATE TABLE IF NOT EXISTS observations_cloud_layers
 (
     retrieved_at            TEXT, -- ISO8601 timestamp
     station_or_zone_id      TEXT,
+    observed_at             TEXT, -- ISO8601 timestamp
     cloud_layer_height	    TEXT,
     cloud_layer_description	TEXT,
-    PRIMARY KEY             (retrieved_at, station_or_zone_id, cloud_layer_height),
-    FOREIGN KEY             (retrieved_at, station_or_zone_id) REFERENCES observations (retrieved_at, station_or_zone_id)
+    PRIMARY KEY             (retrieved_at, station_or_zone_id, observed_at, cloud_layer_height),
+    FOREIGN KEY             (retrieved_at, station_or_zone_id, observed_at) REFERENCES observations (retrieved_at, station_or_zone_id, observed_at)
 );
 
 CREATE TABLE IF NOT EXISTS forecasts
@@ -78,5 +79,9 @@ CREATE TABLE IF NOT EXISTS forecasts
     dew_point_f	                    REAL,
     relative_humidity_pc	        REAL,
     precipitation_probability_pc    REAL,
-    PRIMARY KEY                     (retrieved_at, forecast_office, grid_x, grid_y)
+    PRIMARY KEY                     (retrieved_at, forecast_office, grid_x, grid_y, period_num)
 );
+
+-- Observation history is queried by station and time
+CREATE INDEX IF NOT EXISTS observations_station_time
+    ON observations (station_or_zone_id, observed_at);
@@ -2,32 +2,75 @@ import os
 import sqlite3
 import glob
 import logging
-from dataclasses import asdict
+from functools import lru_cache
+from itertools import chain
+from dataclasses import MISSING, asdict, fields
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Tuple
 from nwsc.repository.base import BaseRepository
+from nwsc.repository.connection import SQLiteConnectionManager, DEFAULT_READERS
+from nwsc.repository.query import build_select, build_update, build_delete
+from nwsc.repository.mapper import MODEL_MAPPINGS, ChildMapping, ModelMapping, get_mapping
+from nwsc.repository.dedup import HASH_EXCLUDED_FIELDS, SIGHTINGS_SCHEMA, content_hash, item_key
 from nwsc.model.nws_item import NWSItem
 logger = logging.getLogger(__name__)
 
 
 SQLITE_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schemas/sqlite/')
+FETCH_SIZE = 1000
+HASH_LOOKUP_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def get_row_factory(nws_item: type, columns: Tuple[str, ...]) -> Callable[[tuple], NWSItem]:
+    """Get a function that creates an `nws_item` from a row with the given columns
+
+    The function is generated once per model and column list, and passes each value
+    to the model by its position in the row, without building a dict per row. Model
+    fields that aren't in `columns` (like nested lists of child items) get their
+    default, or None if they have no default.
+    """
+    args = []
+    for field in fields(nws_item):
+        if field.name in columns:
+            args.append(f'{field.name}=row[{columns.index(field.name)}]')
+        elif field.default is MISSING and field.default_factory is MISSING:
+            args.append(f'{field.name}=None')
+    name = f'make_{nws_item.__name__}'
+    source = f'def {name}(row):\n    return nws_item({", ".join(args)})'
+    namespace = {'nws_item': nws_item}
+    exec(compile(source, f'<row factory {nws_item.__name__}>', 'exec'), namespace)
+    factory = namespace[name]
+    factory.__source__ = source
+    return factory
 
 
 class SQLiteRepository(BaseRepository):
     """
+    The database is opened in WAL mode through a `SQLiteConnectionManager`. Writes
+    go through a single locked writer connection, and reads use a pool of read-only
+    connections, so a repository can be shared between threads and queried while
+    another thread is writing to it.
+
     :param sqlite_path: The path to the SQLite database to open (default: in-memory)
     :param sqlite_schema: The path to a file containing the schema to initialize
         a new database with
+    :param readers: The maximum number of read-only connections to open
     """
 
     def __init__(
         self,
         sqlite_path: str = ':memory:',
-        sqlite_schema_path: str = SQLITE_SCHEMA_PATH
+        sqlite_schema_path: str = SQLITE_SCHEMA_PATH,
+        readers: int = DEFAULT_READERS
     ):
         self.sqlite_path = sqlite_path
         self.sqlite_schema_path = sqlite_schema_path
-        self.conn = sqlite3.connect(self.sqlite_path)
-        self.curs = self.conn.cursor()
+        self.connections = SQLiteConnectionManager(self.sqlite_path, readers=readers)
+        self.conn = self.connections.writer_conn
+        self._table_columns = {}
+        self._primary_keys = {}
+        self._insert_sql = {}
 
         if self.sqlite_path == ':memory:':
             self._init_new_sqlite_db()
@@ -36,84 +79,494 @@ class SQLiteRepository(BaseRepository):
             # at sqlite_path is empty, initialize a new database using the
             # given sqlite_schema
             query = 'SELECT name FROM sqlite_master WHERE type="table"'
-            if not self.curs.execute(query).fetchall():
+            if not self.conn.execute(query).fetchall():
                 self._init_new_sqlite_db()
+        # Created separately from the schema files, so databases created before
+        # deduplication was added get the table too
+        with self.connections.writer() as conn:
+            conn.executescript(SIGHTINGS_SCHEMA)
 
     def _init_new_sqlite_db(self):
         schema_files = glob.glob(os.path.join(self.sqlite_schema_path, '*.sql'))
-        for schema_file in schema_files:
-            with open(schema_file) as file:
-                self.curs.executescript(file.read())
-                logger.debug(f'Created "{Path(schema_file).stem}" tables')
+        with self.connections.writer() as conn:
+            for schema_file in schema_files:
+                with open(schema_file) as file:
+                    conn.executescript(file.read())
+                    logger.debug(f'Created "{Path(schema_file).stem}" tables')
         logger.info(f'Initialized new SQLite3 database at {self.sqlite_path}')
+
+    def close(self):
+        self.connections.close()
     
-    def _res_to_item(self, res, nws_item: NWSItem) -> sqlite3.Cursor:
-        res_cols = [desc[0] for desc in self.curs.description]
-        records = []
-        for row in res:
-            record = {k:v for k,v in zip(res_cols, row)}
-            records.append(nws_item(**record))
-        return records
-
-    def _get_filter_str(self, filter: dict) -> str:
-        if len(filter) == 1:
-            key = list(filter.keys())[0]
-            value = list(filter.values())[0]
-            if isinstance(value, str):
-                value = f'"{value}"'
-            filter_str = f'WHERE {key} == {value}'
+    def _load_table_info(self, table: str):
+        # pragma_table_info() takes the table name as a bound parameter, so unknown
+        # or malformed names just return no rows
+        query = 'SELECT name, pk FROM pragma_table_info(?)'
+        with self.connections.writer() as conn:
+            res = conn.execute(query, (table,)).fetchall()
+        if not res:
+            raise ValueError(f'Table does not exist: {table}')
+        self._table_columns[table] = tuple(name for name, _ in res)
+        self._primary_keys[table] = tuple(name for name, pk in sorted(res, key=lambda col: col[1])
+                                          if pk)
+
+    def get_columns(self, table: str) -> Tuple[str, ...]:
+        """Get the names of a table's columns, in order"""
+        if table not in self._table_columns:
+            self._load_table_info(table)
+        return self._table_columns[table]
+
+    def get_primary_key(self, table: str) -> Tuple[str, ...]:
+        """Get the names of the columns in a table's primary key, in key order"""
+        if table not in self._primary_keys:
+            self._load_table_info(table)
+        return self._primary_keys[table]
+
+    def _get_item_columns(self, table: str, nws_item: type) -> Tuple[str, ...]:
+        """Get the columns of `table` that are also fields of `nws_item`"""
+        item_fields = {field.name for field in fields(nws_item)}
+        return tuple(column for column in self.get_columns(table) if column in item_fields)
+
+    def _get_insert_sql(self, table: str, columns: Tuple[str, ...], upsert: bool = False) -> str:
+        """Get the INSERT statement for a table and columns, building it only once
+
+        sqlite3 caches prepared statements by their SQL text, so reusing the same
+        string also reuses the prepared statement.
+        """
+        cache_key = (table, columns, upsert)
+        if cache_key in self._insert_sql:
+            return self._insert_sql[cache_key]
+        column_list = ', '.join(columns)
+        params = ', '.join('?' * len(columns))
+        primary_key = self.get_primary_key(table)
+        if not upsert:
+            query = f'INSERT OR IGNORE INTO {table} ({column_list}) VALUES ({params})'
+        elif primary_key:
+            updates = ', '.join(f'{column} = excluded.{column}'
+                                for column in columns if column not in primary_key)
+            conflict = (f'DO UPDATE SET {updates}' if updates else 'DO NOTHING')
+            query = (f'INSERT INTO {table} ({column_list}) VALUES ({params}) '
+                     f'ON CONFLICT ({", ".join(primary_key)}) {conflict}')
         else:
-            filter_str = ''
-            for key, value in filter.items():
-                if isinstance(value, str):
-                    value = f'"{value}"'
-                if not filter_str:
-                    filter_str = f'WHERE {key} == {value}'
+            query = f'INSERT INTO {table} ({column_list}) VALUES ({params})'
+        self._insert_sql[cache_key] = query
+        return query
+
+    def _insert_items(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        items: Iterable[NWSItem],
+        upsert: bool
+    ) -> int:
+        items = iter(items)
+        first_item = next(items, None)
+        if first_item is None:
+            return 0
+        columns = self._get_item_columns(table, type(first_item))
+        query = self._get_insert_sql(table, columns, upsert)
+        rows = ([getattr(item, column) for column in columns]
+                for item in chain((first_item,), items))
+        return conn.executemany(query, rows).rowcount
+
+    def _write_many(self, table: str, items: Iterable[NWSItem], upsert: bool) -> int:
+        # One transaction for the whole batch: it's committed when the block exits,
+        # or rolled back if any row fails
+        with self.connections.writer() as conn, conn:
+            return self._insert_items(conn, table, items, upsert)
+
+    def create_many(self, table: str, items: Iterable[NWSItem]) -> int:
+        """Insert many items of the same model in a single transaction
+
+        Items that conflict with a row already in the table are skipped, like `create`.
+        Only the model fields that are also columns of `table` are stored.
+
+        :returns: The number of rows inserted
+        """
+        return self._write_many(table, items, upsert=False)
+
+    def upsert_many(self, table: str, items: Iterable[NWSItem]) -> int:
+        """Insert many items of the same model, updating the rows that already exist
+
+        Rows are matched on the table's primary key, and every other stored column is
+        replaced with the item's value. It all happens in a single transaction.
+
+        :returns: The number of rows inserted or updated
+        """
+        return self._write_many(table, items, upsert=True)
+
+    def _get_child_columns(self, child: ChildMapping) -> Tuple[str, ...]:
+        """Get the columns that hold a child's own values, after its parent columns"""
+        if child.model is not None:
+            return self._get_item_columns(child.table, child.model)
+        if child.key_column is not None:
+            return (child.key_column, child.value_column)
+        return (child.value_column,)
+
+    def _get_child_rows(self, child: ChildMapping, item: NWSItem, columns: Tuple[str, ...]) -> list:
+        parent_values = [getattr(item, field) for field in child.parent_columns.values()]
+        values = getattr(item, child.field)
+        if not values:
+            return []
+        if child.model is not None:
+            return [parent_values + [getattr(value, column) for column in columns]
+                    for value in values]
+        if child.key_column is not None:
+            return [parent_values + [key, value] for key, value in values.items()]
+        return [parent_values + [value] for value in values]
+
+    def save_nested(self, items: Iterable[NWSItem], upsert: bool = False) -> int:
+        """Store items of a model in `nwsc.repository.mapper.MODEL_MAPPINGS`, with their children
+
+        The parent rows and the rows of every child table are each written with one
+        `executemany`, all in a single transaction.
+
+        :param items: Items of the same model, like a page of `Alert`s or a list of
+            `Forecast`s
+        :param upsert: Update items that are already stored, and replace their
+            children, instead of skipping them
+        :returns: The number of parent rows inserted (or updated, with `upsert`).
+            For models stored only in their child table, like `Forecast`, it's the
+            number of child rows instead.
+        """
+        items = list(items)
+        if not items:
+            return 0
+        mapping = get_mapping(type(items[0]))
+        with self.connections.writer() as conn, conn:
+            return self._insert_nested(conn, mapping, items, upsert)
+
+    def _insert_nested(
+        self,
+        conn: sqlite3.Connection,
+        mapping: ModelMapping,
+        items: List[NWSItem],
+        upsert: bool
+    ) -> int:
+        """Write items and their children, and get the number of parent rows written"""
+        rowcount = None
+        if mapping.table is not None:
+            rowcount = self._insert_items(conn, mapping.table, items, upsert)
+        for child in mapping.children:
+            child_columns = self._get_child_columns(child)
+            if upsert:
+                key_columns = [column for column, field in child.parent_columns.items()
+                               if field in mapping.key]
+                where = ' AND '.join(f'{column} = ?' for column in key_columns)
+                conn.executemany(f'DELETE FROM {child.table} WHERE {where}',
+                                 ([getattr(item, child.parent_columns[column])
+                                   for column in key_columns] for item in items))
+            query = self._get_insert_sql(child.table, (*child.parent_columns, *child_columns))
+            curs = conn.executemany(query, (row for item in items
+                                            for row in self._get_child_rows(child, item, child_columns)))
+            if rowcount is None:
+                rowcount = curs.rowcount
+        return rowcount
+
+    def _get_dedup_table(self, nws_item: type, table: str = None) -> Tuple[str, Tuple[str, ...]]:
+        """Get the table to deduplicate items in, and the fields that identify an item
+
+        The fields are the mapping key of models in `MODEL_MAPPINGS`, or otherwise
+        the table's primary key, without the fields `content_hash` ignores (like
+        `retrieved_at`).
+        """
+        mapping = MODEL_MAPPINGS.get(nws_item)
+        if table is None:
+            if mapping is None:
+                raise ValueError(f'A table is needed to store {nws_item.__name__} items')
+            table = mapping.table or mapping.children[0].table
+        key_fields = mapping.key if mapping is not None else self.get_primary_key(table)
+        return table, tuple(field for field in key_fields if field not in HASH_EXCLUDED_FIELDS)
+
+    def _get_item_key(self, item: NWSItem, key_fields: Tuple[str, ...], item_hash: str) -> str:
+        # Without key fields there's no way to tell which item a snapshot is of, so
+        # each distinct content is treated as its own item
+        return item_key(item, key_fields) if key_fields else item_hash
+
+    def save_deduplicated(self, items: Iterable[NWSItem], table: str = None) -> int:
+        """Store only the items whose content differs from their latest stored version
+
+        Each item is hashed with `nwsc.repository.dedup.content_hash`, ignoring its
+        `retrieved_at`, and identified by its key fields: the mapping key for models
+        in `MODEL_MAPPINGS`, or otherwise the table's primary key, without
+        `retrieved_at`. An item whose hash differs from the latest version stored for its key is stored
+        (with its children, for models in `nwsc.repository.mapper.MODEL_MAPPINGS`)
+        and gets a new row in the `sightings` table. For an item with the same hash
+        as its latest version, only that version's sighting row is updated. It all
+        happens in a single transaction.
+
+        An item whose row is ignored, because its primary key is already taken by a
+        row with other content, isn't stored and gets no sighting, so its content is
+        stored if it's seen again later.
+
+        :param items: Items of the same model
+        :param table: The table to store the items in. Not needed for models in
+            `MODEL_MAPPINGS`.
+        :returns: The number of items stored; the rest were repeats or ignored
+        """
+        items = list(items)
+        if not items:
+            return 0
+        mapping = MODEL_MAPPINGS.get(type(items[0]))
+        table, key_fields = self._get_dedup_table(type(items[0]), table)
+        hashes = [content_hash(item) for item in items]
+        keys = [self._get_item_key(item, key_fields, item_hash)
+                for item, item_hash in zip(items, hashes)]
+
+        stored = 0
+        repeats = 0
+        ignored = 0
+        with self.connections.writer() as conn, conn:
+            # The latest sighting of each item, as (sighting_id, content_hash)
+            latest = {}
+            unique_keys = list(dict.fromkeys(keys))
+            # Stay well under SQLite's limit on the number of bound parameters
+            for i in range(0, len(unique_keys), HASH_LOOKUP_SIZE):
+                chunk = unique_keys[i:i + HASH_LOOKUP_SIZE]
+                query = (f'SELECT item_key, max(sighting_id), content_hash FROM sightings '
+                         f'WHERE table_name = ? AND item_key IN ({", ".join("?" * len(chunk))}) '
+                         f'GROUP BY item_key')
+                for key, sighting_id, item_hash in conn.execute(query, [table, *chunk]):
+                    latest[key] = (sighting_id, item_hash)
+
+            # Items are handled one at a time and in order, since an item can change
+            # more than once in a batch, and the rowcount of a single executemany
+            # can't tell which of its rows were ignored
+            for item, item_hash, key in zip(items, hashes, keys):
+                retrieved_at = getattr(item, 'retrieved_at', None)
+                sighting_id, latest_hash = latest.get(key, (None, None))
+                if latest_hash == item_hash:
+                    conn.execute(
+                        'UPDATE sightings SET last_seen = coalesce(max(last_seen, ?), ?, last_seen), '
+                        'sightings = sightings + 1 WHERE sighting_id = ?',
+                        (retrieved_at, retrieved_at, sighting_id))
+                    repeats += 1
+                    continue
+                if mapping is not None:
+                    rowcount = self._insert_nested(conn, mapping, [item], upsert=False)
                 else:
-                    filter_str += f' AND {key} == {value}'
-        return filter_str
+                    rowcount = self._insert_items(conn, table, [item], upsert=False)
+                if rowcount <= 0:
+                    ignored += 1
+                    continue
+                curs = conn.execute(
+                    'INSERT INTO sightings (table_name, item_key, content_hash, first_seen, '
+                    'last_seen, sightings) VALUES (?, ?, ?, ?, ?, 1)',
+                    (table, key, item_hash, retrieved_at, retrieved_at))
+                latest[key] = (curs.lastrowid, item_hash)
+                stored += 1
+        logger.debug(f'Stored {stored} new {table} items, {repeats} were repeats, '
+                     f'{ignored} were ignored')
+        return stored
+
+    def get_sighting(self, item: NWSItem, table: str = None) -> dict:
+        """Get when the latest version of an item with this content was first and last seen
+
+        :returns: A dict with the keys 'first_seen', 'last_seen' and 'sightings', or
+            None if the content was never stored with `save_deduplicated`
+        """
+        table, key_fields = self._get_dedup_table(type(item), table)
+        item_hash = content_hash(item)
+        query = ('SELECT first_seen, last_seen, sightings FROM sightings '
+                 'WHERE table_name = ? AND item_key = ? AND content_hash = ? '
+                 'ORDER BY sighting_id DESC LIMIT 1')
+        with self.connections.reader() as conn:
+            row = conn.execute(query, (table, self._get_item_key(item, key_fields, item_hash),
+                                       item_hash)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('first_seen', 'last_seen', 'sightings'), row))
+
+    def get_nested(
+        self,
+        nws_item: type,
+        filter: dict = None,
+        order_by: 'str | List[str]' = None,
+        limit: int = None,
+        offset: int = None
+    ) -> List[NWSItem]:
+        """Get items of a model in `nwsc.repository.mapper.MODEL_MAPPINGS`, with their children
+
+        The parents are selected with one query, and the children of every selected
+        parent are read with one joined query per child table, all in a single read
+        transaction.
+
+        :param filter: The parent columns to match, like `filter_by`
+        :param order_by: The parent columns to sort by, like `filter_by`
+        :param limit: The maximum number of parent items to return
+        :param offset: The number of parent items to skip
+        """
+        mapping = get_mapping(nws_item)
+        if mapping.table is not None:
+            parent_table = mapping.table
+            parent_columns = self._get_item_columns(parent_table, nws_item)
+        else:
+            # The parent's fields are repeated in every child row, so select each
+            # distinct parent from the child table. Those columns must be named like
+            # the parent's fields.
+            parent_table = mapping.children[0].table
+            parent_columns = tuple(mapping.children[0].parent_columns)
+        select_args = (parent_table, filter, order_by, limit, offset)
+        parent_query, parent_params = build_select(*select_args, columns=parent_columns,
+                                                   distinct=(mapping.table is None))
+        key_query, key_params = build_select(*select_args, columns=mapping.key, distinct=True)
+        make_parent = get_row_factory(nws_item, parent_columns)
+
+        with self.connections.reader() as conn:
+            # Read the parents and children from the same snapshot of the database
+            conn.execute('BEGIN')
+            try:
+                parents = {}
+                for row in conn.execute(parent_query, parent_params):
+                    parent = make_parent(row)
+                    for child in mapping.children:
+                        setattr(parent, child.field, {} if child.key_column else [])
+                    parents[tuple(getattr(parent, field) for field in mapping.key)] = parent
+
+                for child in mapping.children:
+                    key_columns = {field: column for column, field in child.parent_columns.items()}
+                    key_columns = [key_columns[field] for field in mapping.key]
+                    child_columns = self._get_child_columns(child)
+                    on = ' AND '.join(f'c.{column} = p.{field}'
+                                      for column, field in zip(key_columns, mapping.key))
+                    query = (f'SELECT {", ".join(f"c.{column}" for column in (*key_columns, *child_columns))} '
+                             f'FROM {child.table} AS c JOIN ({key_query}) AS p ON {on} '
+                             f'ORDER BY c.rowid')
+                    make_child = (get_row_factory(child.model, child_columns)
+                                  if child.model is not None else None)
+                    key_size = len(key_columns)
+                    for row in conn.execute(query, key_params):
+                        values = getattr(parents[row[:key_size]], child.field)
+                        if make_child is not None:
+                            values.append(make_child(row[key_size:]))
+                        elif child.key_column is not None:
+                            values[row[key_size]] = row[key_size + 1]
+                        else:
+                            values.append(row[key_size])
+            finally:
+                conn.commit()
+        return list(parents.values())
+
+    def _select(
+        self,
+        table: str,
+        nws_item: NWSItem,
+        filter: dict = None,
+        order_by: 'str | List[str]' = None,
+        limit: int = None,
+        offset: int = None
+    ) -> Tuple[str, list, Callable[[tuple], NWSItem]]:
+        """Build a query for the columns of `table` that `nws_item` has, and a row factory"""
+        columns = self._get_item_columns(table, nws_item)
+        query, params = build_select(table, filter, order_by, limit, offset, columns)
+        return query, params, get_row_factory(nws_item, columns)
+
+    def _query(self, query: str, params: list, row_factory: Callable) -> List[NWSItem]:
+        with self.connections.reader() as conn:
+            return list(map(row_factory, conn.execute(query, params).fetchall()))
+
+    def _iter_query(
+        self,
+        query: str,
+        params: list,
+        row_factory: Callable,
+        batch_size: int
+    ) -> Iterator[NWSItem]:
+        if self.connections.readers_use_writer:
+            # Reading from the writer connection holds the write lock, so fetch every
+            # row up front rather than blocking writers until the generator finishes
+            with self.connections.reader() as conn:
+                rows = conn.execute(query, params).fetchall()
+            yield from map(row_factory, rows)
+            return
+        # The reader connection stays checked out of the pool until the generator
+        # is exhausted or closed
+        with self.connections.reader() as conn:
+            curs = conn.execute(query, params)
+            while True:
+                rows = curs.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from map(row_factory, rows)
+
+    def _execute_write(self, query: str, params=()) -> sqlite3.Cursor:
+        with self.connections.writer() as conn:
+            curs = conn.execute(query, params)
+            conn.commit()
+        return curs
 
     def get_all(self, table: str, nws_item: NWSItem) -> list:
-        res = self.curs.execute(f'SELECT * FROM {table}').fetchall()
-        return self._res_to_item(res, nws_item)
+        return self._query(*self._select(table, nws_item))
+
+    def iter_all(self, table: str, nws_item: NWSItem, batch_size: int = FETCH_SIZE) -> Iterator[NWSItem]:
+        """Like `get_all`, but yield the items, fetching `batch_size` rows at a time
+
+        A read-only connection is checked out of the pool until the generator is
+        exhausted or closed. For in-memory databases, where readers share the writer
+        connection, every row is fetched when the generator starts instead, so that
+        writers in other threads aren't blocked while it's partly consumed.
+        """
+        return self._iter_query(*self._select(table, nws_item), batch_size)
 
     def get(self, table: str, id_field: str, id_value: str, nws_item: NWSItem) -> list:
-        query = f'SELECT * FROM {table} WHERE {id_field} == {id_value}'
-        res = self.curs.execute(query).fetchall()
-        return self._res_to_item(res, nws_item)
+        return self._query(*self._select(table, nws_item, {id_field: id_value}))
     
-    def filter_by(self, table: str, nws_item: NWSItem, filter: dict) -> list:
-        filter_str = self._get_filter_str(filter)
-        res = self.curs.execute(f'SELECT * FROM {table} {filter_str}').fetchall()
-        return self._res_to_item(res, nws_item)
+    def filter_by(
+        self,
+        table: str,
+        nws_item: NWSItem,
+        filter: dict,
+        order_by: 'str | List[str]' = None,
+        limit: int = None,
+        offset: int = None
+    ) -> list:
+        """Get the rows matching a filter
+
+        :param filter: Column names mapped to a value to match, a list of values to
+            match any of, or a `nwsc.repository.query.Range`
+        :param order_by: A column name or list of column names to sort by, prefixed
+            with '-' to sort in descending order
+        :param limit: The maximum number of rows to return
+        :param offset: The number of rows to skip
+        """
+        return self._query(*self._select(table, nws_item, filter, order_by, limit, offset))
+
+    def iter_filter(
+        self,
+        table: str,
+        nws_item: NWSItem,
+        filter: dict,
+        order_by: 'str | List[str]' = None,
+        limit: int = None,
+        offset: int = None,
+        batch_size: int = FETCH_SIZE
+    ) -> Iterator[NWSItem]:
+        """Like `filter_by`, but yield the items, fetching `batch_size` rows at a time
+
+        Connections are used as described in `iter_all`.
+        """
+        query, params, row_factory = self._select(table, nws_item, filter, order_by, limit, offset)
+        return self._iter_query(query, params, row_factory, batch_size)
     
     def create(self, table: str, item: NWSItem) -> int:
         record = self.serialize(item)
-        fields = ', '.join([k for k in record.keys()])
-        named_params = ', '.join([f':{k}' for k in record.keys()])
-        query = f'INSERT OR IGNORE INTO {table} ({fields}) VALUES ({named_params})'
-        self.curs.execute(query, record)
-        self.conn.commit()
-        return self.curs.lastrowid
+        columns = self._get_item_columns(table, type(item))
+        query = self._get_insert_sql(table, columns)
+        return self._execute_write(query, [record[column] for column in columns]).lastrowid
 
     def update(self, table: str, item: NWSItem, filter: dict) -> bool:
         record = self.serialize(item)
-        update_str = ', '.join([f'{k} = :{k}' for k in record.keys() if k != 'id'])
-        filter_str = self._get_filter_str(filter)
-        query = f'UPDATE OR IGNORE {table} SET {update_str} {filter_str}'
-        self.curs.execute(query, record)
-        self.conn.commit()
-        if self.curs.rowcount >= 1:
+        columns = [column for column in self._get_item_columns(table, type(item))
+                   if column != 'id']
+        query, params = build_update(table, columns, filter)
+        params = [record[column] for column in columns] + params
+        if self._execute_write(query, params).rowcount >= 1:
             return True
         else:
             return False
 
     def delete(self, table: str, filter: dict) -> bool:
-        filter_str = self._get_filter_str(filter)
-        print(filter_str)
-        self.curs.execute(f'DELETE FROM {table} {filter_str}', )
-        self.conn.commit()
-        if self.curs.rowcount >= 1:
+        if self._execute_write(*build_delete(table, filter)).rowcount >= 1:
             return True
         else:
             return False
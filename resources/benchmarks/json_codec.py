@@ -0,0 +1,58 @@
+"""Compare JSON decoding and encoding speed of the available backends
+
+Decodes and re-encodes every response fixture in tests/test_data/api_responses with
+the standard library `json` module, and with `orjson` and `msgspec` if they're
+installed, then prints the total time for each and its speedup over `json`.
+
+Usage: python resources/benchmarks/json_codec.py [repetitions]
+"""
+
+import sys
+import json
+import timeit
+from pathlib import Path
+
+
+FIXTURES_PATH = Path(__file__).parents[2] / 'tests/test_data/api_responses'
+
+
+def get_backends() -> dict:
+	backends = {
+		'json': (json.loads, lambda obj: json.dumps(obj, default=str).encode('utf-8')),
+	}
+	try:
+		import orjson
+		backends['orjson'] = (orjson.loads, lambda obj: orjson.dumps(obj, default=str))
+	except ImportError:
+		pass
+	try:
+		import msgspec
+		backends['msgspec'] = (msgspec.json.decode,
+							   msgspec.json.Encoder(enc_hook=str).encode)
+	except ImportError:
+		pass
+	return backends
+
+
+def main(repetitions: int = 20):
+	fixtures = [path.read_bytes() for path in sorted(FIXTURES_PATH.glob('*.json'))]
+	decoded = [json.loads(fixture) for fixture in fixtures]
+	total_mb = sum(len(fixture) for fixture in fixtures) / 1_000_000
+	print(f'{len(fixtures)} fixtures, {total_mb:.1f} MB, {repetitions} repetitions\n')
+	print(f'{"backend":<10}{"decode (s)":>12}{"speedup":>10}{"encode (s)":>12}{"speedup":>10}')
+
+	baseline = None
+	for name, (loads, dumps) in get_backends().items():
+		decode_time = timeit.timeit(lambda: [loads(fixture) for fixture in fixtures],
+									number=repetitions)
+		encode_time = timeit.timeit(lambda: [dumps(data) for data in decoded],
+									number=repetitions)
+		if baseline is None:
+			baseline = (decode_time, encode_time)
+		print((
+			f'{name:<10}{decode_time:>12.3f}{baseline[0] / decode_time:>9.1f}x'
+			f'{encode_time:>12.3f}{baseline[1] / encode_time:>9.1f}x'))
+
+
+if __name__ == '__main__':
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
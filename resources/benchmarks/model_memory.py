@@ -0,0 +1,60 @@
+"""Compare the memory used by model instances with and without slots
+
+Creates many `Observation` instances as a plain dataclass (with a per-instance
+`__dict__`, like the models used to be), as the slotted model, and as the frozen
+model from `nwsc.model.nws_item.freeze`, and prints the memory used per instance.
+
+Usage: python resources/benchmarks/model_memory.py [instances]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime
+from nwsc.model.weather import Observation
+from nwsc.model.nws_item import frozen_model
+
+
+def get_observation_values(i: int) -> dict:
+	values = {}
+	for field in fields(Observation):
+		if field.name.endswith('_at'):
+			values[field.name] = datetime(2024, 8, 18, i % 24)
+		elif field.type in (int, float):
+			values[field.name] = float(i)
+		elif field.name == 'cloud_layers':
+			values[field.name] = {}
+		else:
+			values[field.name] = 'KVGT'
+	return values
+
+
+def measure(cls: type, instances: int) -> float:
+	"""Return the number of bytes allocated per instance of `cls`"""
+	values = [get_observation_values(i) for i in range(instances)]
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	items = [cls(**value) for value in values]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del items
+	return (after - before) / instances
+
+
+def main(instances: int = 100_000):
+	unslotted = make_dataclass('Observation',
+							   [(field.name, field.type) for field in fields(Observation)],
+							   kw_only=True)
+	results = {
+		'dataclass (__dict__)':	measure(unslotted, instances),
+		'slotted':				measure(Observation, instances),
+		'frozen slotted':		measure(frozen_model(Observation), instances),
+	}
+	baseline = results['dataclass (__dict__)']
+	print(f'{instances} Observation instances, excluding shared field values\n')
+	for name, size in results.items():
+		print(f'{name:<22}{size:>8.0f} bytes/instance{size / baseline:>8.0%}')
+
+
+if __name__ == '__main__':
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
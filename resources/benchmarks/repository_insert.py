@@ -0,0 +1,88 @@
+"""Compare the insert throughput of InMemoryRepository with and without copying
+
+Loads the alert and radar server fixtures in tests/test_data/api_responses into
+models (the fixtures' field names are matched to the model fields, ignoring prefixes
+like 'alert_'), multiplies them up to a few thousand items, then stores them in an `InMemoryRepository` with `create` (which deep copies
+each item), with `create(copy=False)`, with frozen items, and with `create_many`,
+and prints the number of items inserted per second for each.
+
+Usage: python resources/benchmarks/repository_insert.py [repetitions]
+"""
+
+import sys
+import json
+import timeit
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from nwsc.model.alerts import Alert, PriorAlert
+from nwsc.model.radar import RadarServer, NetworkInterface
+from nwsc.model.nws_item import freeze
+from nwsc.repository.memory import InMemoryRepository
+
+
+FIXTURES_PATH = Path(__file__).parents[2] / 'tests/test_data/api_responses'
+
+
+FIXTURE_PREFIXES = ('', 'alert_', 'prior_alert_', 'server_')
+COPIES = 500
+
+
+def to_model(model: type, data: dict, nested: dict):
+	retrieved_at = datetime.now()
+	values = {}
+	for field in fields(model):
+		value = next((data[prefix + field.name] for prefix in FIXTURE_PREFIXES
+					  if prefix + field.name in data), None)
+		if field.name in nested:
+			value = [to_model(nested[field.name], item, nested) for item in value or []]
+		elif field.name == 'retrieved_at':
+			value = retrieved_at
+		values[field.name] = value
+	return model(**values)
+
+
+def get_fixture_items() -> dict:
+	alerts = json.loads((FIXTURES_PATH / 'nws_raw_alerts.json').read_bytes())
+	servers = json.loads((FIXTURES_PATH / 'nws_raw_radar_servers.json').read_bytes())
+	return {
+		'Alert':		[to_model(Alert, alert, {'prior_alerts': PriorAlert})
+						 for alert in alerts] * COPIES,
+		'RadarServer':	[to_model(RadarServer, server, {'interfaces': NetworkInterface})
+						 for server in servers] * COPIES,
+	}
+
+
+def insert_each(items: list, copy: bool = True):
+	repo = InMemoryRepository(indexes=['retrieved_at'])
+	for item in items:
+		repo.create(item, copy=copy)
+
+
+def insert_many(items: list, copy: bool = True):
+	InMemoryRepository(indexes=['retrieved_at']).create_many(items, copy=copy)
+
+
+def main(repetitions: int = 5):
+	print(f'{repetitions} repetitions\n')
+	print(f'{"model":<13}{"insert mode":<24}{"items/s":>12}{"speedup":>10}')
+	for name, items in get_fixture_items().items():
+		frozen_items = [freeze(item) for item in items]
+		modes = {
+			'create (deepcopy)':	lambda: insert_each(items),
+			'create(copy=False)':	lambda: insert_each(items, copy=False),
+			'create (frozen)':		lambda: insert_each(frozen_items),
+			'create_many (deepcopy)':	lambda: insert_many(items),
+			'create_many(copy=False)':	lambda: insert_many(items, copy=False),
+		}
+		baseline = None
+		for mode, insert in modes.items():
+			elapsed = timeit.timeit(insert, number=repetitions)
+			rate = len(items) * repetitions / elapsed
+			if baseline is None:
+				baseline = rate
+			print(f'{name:<13}{mode:<24}{rate:>12,.0f}{rate / baseline:>9.1f}x')
+
+
+if __name__ == '__main__':
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
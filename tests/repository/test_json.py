@@ -0,0 +1,120 @@
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+import pytest
+from nwsc.model.aviation import SIGMET
+from nwsc.repository.json import JSONRepository
+
+
+RETRIEVED_AT = datetime(2024, 8, 16, 19, 0, tzinfo=timezone.utc)
+
+
+def make_sigmet(url: str, hours: int = 0, **values) -> SIGMET:
+    sigmet = dict.fromkeys((field.name for field in fields(SIGMET)), None)
+    sigmet.update({'url': url, 'retrieved_at': RETRIEVED_AT + timedelta(hours=hours)})
+    sigmet.update(values)
+    return SIGMET(**sigmet)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    with JSONRepository(str(tmp_path / 'sigmets.jsonl'), SIGMET, ('url',)) as repository:
+        yield repository
+
+
+def test_compact_during_iter_latest(repository):
+    for hours in range(2):
+        repository.create_many(make_sigmet(f'sigmet-{i}', hours, phenomenon=f'v{hours}')
+                               for i in range(5))
+    items = repository.iter_latest()
+    first = next(items)
+    repository.compact()
+    rest = list(items)
+
+    assert [item.url for item in [first, *rest]] == [f'sigmet-{i}' for i in range(5)]
+    assert all(item.phenomenon == 'v1' for item in [first, *rest])
+
+
+def test_get_during_background_compaction(repository):
+    for hours in range(50):
+        repository.create_many(make_sigmet(f'sigmet-{i}', hours) for i in range(20))
+    thread = repository.compact(background=True)
+    while thread.is_alive():
+        assert repository.get('sigmet-7').retrieved_at == RETRIEVED_AT + timedelta(hours=49)
+    thread.join()
+    assert len(repository.history('sigmet-7')) == 1
+
+
+def test_between_leaves_out_deleted_items(repository):
+    repository.create(make_sigmet('untimed', retrieved_at=None))
+    deleted = repository.create(make_sigmet('deleted', 1))
+    repository.create(make_sigmet('kept', 2))
+    repository.delete(deleted)
+
+    assert [item.url for item in repository.between()] == ['kept']
+    assert [item.url for item in repository.between(RETRIEVED_AT, RETRIEVED_AT + timedelta(hours=2))] == []
+
+
+def test_datetime_keys_after_reopen(tmp_path):
+    path = str(tmp_path / 'sigmets.jsonl')
+    key_fields = ('url', 'issued_at')
+    issued_at = datetime(2024, 8, 16, 12, 0, tzinfo=timezone(timedelta(hours=-5)))
+    sigmet = make_sigmet('sigmet-1', issued_at=issued_at)
+    with JSONRepository(path, SIGMET, key_fields) as repository:
+        repository.create(sigmet)
+        assert repository.get('sigmet-1', issued_at) is not None
+
+    with JSONRepository(path, SIGMET, key_fields) as repository:
+        assert repository.get('sigmet-1', issued_at).issued_at == issued_at
+        assert repository.get('sigmet-1', issued_at.astimezone(timezone.utc)) is not None
+        assert repository.delete(sigmet)
+        assert repository.get('sigmet-1', issued_at) is None
+
+
+def test_reopen_keeps_history_and_deletes(tmp_path):
+    path = str(tmp_path / 'sigmets.jsonl')
+    with JSONRepository(path, SIGMET, ('url',)) as repository:
+        assert repository.create_many(make_sigmet(f'sigmet-{i}') for i in range(3)) == 3
+        repository.update(make_sigmet('sigmet-0', 1, phenomenon='TURB'))
+        assert repository.delete(make_sigmet('sigmet-1'))
+        assert not repository.delete(make_sigmet('missing'))
+
+    with JSONRepository(path, SIGMET, ('url',)) as repository:
+        assert [item.url for item in repository.get_all()] == ['sigmet-2', 'sigmet-0']
+        assert [item.phenomenon for item in repository.history('sigmet-0')] == [None, 'TURB']
+        assert repository.get('sigmet-0').retrieved_at == RETRIEVED_AT + timedelta(hours=1)
+        assert repository.get('sigmet-1') is None
+        assert repository.filter_by({'phenomenon': 'TURB'}) == [repository.get('sigmet-0')]
+
+
+def test_compact_keeps_latest_versions(tmp_path):
+    path = tmp_path / 'sigmets.jsonl'
+    with JSONRepository(str(path), SIGMET, ('url',)) as repository:
+        for hours in range(3):
+            repository.create_many(make_sigmet(f'sigmet-{i}', hours) for i in range(4))
+        repository.delete(make_sigmet('sigmet-3'))
+        latest = repository.get_all()
+        repository.flush()
+        size = path.stat().st_size
+        repository.compact()
+
+        assert path.stat().st_size < size
+        assert repository.get_all() == latest
+        assert len(list(repository.iter_records())) == 3
+        repository.create(make_sigmet('sigmet-4', 3))
+
+    with JSONRepository(str(path), SIGMET, ('url',)) as repository:
+        assert [item.url for item in repository.get_all()] == [f'sigmet-{i}' for i in (0, 1, 2, 4)]
+        assert [len(repository.history(f'sigmet-{i}')) for i in range(5)] == [1, 1, 1, 0, 1]
+
+
+def test_reopen_skips_truncated_record(tmp_path):
+    path = tmp_path / 'sigmets.jsonl'
+    with JSONRepository(str(path), SIGMET, ('url',)) as repository:
+        repository.create(make_sigmet('sigmet-1'))
+    with open(path, 'ab') as file:
+        file.write(b'{"url": "sigmet-2", "retrie')
+
+    with JSONRepository(str(path), SIGMET, ('url',)) as repository:
+        repository.create(make_sigmet('sigmet-3'))
+    with JSONRepository(str(path), SIGMET, ('url',)) as repository:
+        assert [item.url for item in repository.get_all()] == ['sigmet-1', 'sigmet-3']
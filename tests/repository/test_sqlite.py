@@ -0,0 +1,116 @@
+from dataclasses import fields
+import pytest
+from nwsc.model.alerts import Alert, PriorAlert
+from nwsc.model.aviation import SIGMET
+from nwsc.model.radar import NetworkInterface, RadarServer
+from nwsc.model.weather import Forecast, ForecastPeriod, Observation
+from nwsc.repository.sqlite import SQLiteRepository
+
+
+# Timestamps are given as the ISO 8601 strings SQLite stores and returns, so items
+# compare equal after a round trip
+RETRIEVED_AT = '2024-08-16T19:00:00+00:00'
+
+
+def make(model: type, **values):
+    """Make an item with every field that isn't in `values` set to None"""
+    item = dict.fromkeys((field.name for field in fields(model)), None)
+    item.update(values)
+    return model(**item)
+
+
+def make_sigmet(url: str, phenomenon: str = None, retrieved_at: str = RETRIEVED_AT) -> SIGMET:
+    return make(SIGMET, retrieved_at=retrieved_at, issued_at='2024-08-16T18:00:00+00:00',
+                fir='KZNY', atsu='KKCI', sequence=url, url=url, phenomenon=phenomenon)
+
+
+def count_rows(repository: SQLiteRepository, table: str) -> int:
+    return repository.conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]
+
+
+@pytest.fixture
+def repository():
+    repository = SQLiteRepository()
+    yield repository
+    repository.close()
+
+
+def test_create_many_and_upsert_many_counts(repository):
+    assert repository.create_many('sigmets', [make_sigmet('1'), make_sigmet('2')]) == 2
+    assert repository.create_many('sigmets', [make_sigmet('2'), make_sigmet('3')]) == 1
+    assert repository.upsert_many('sigmets', [make_sigmet('3', 'TURB'), make_sigmet('4')]) == 2
+    assert repository.create_many('sigmets', []) == 0
+
+    assert count_rows(repository, 'sigmets') == 4
+    assert repository.get('sigmets', 'url', '3', SIGMET)[0].phenomenon == 'TURB'
+
+
+def test_alert_round_trip(repository):
+    alert = make(Alert,
+                 retrieved_at=RETRIEVED_AT,
+                 alert_id='alert-1',
+                 affected_zones_urls=['https://api.weather.gov/zones/forecast/MAZ014'],
+                 areas_ugc=['MAZ014', 'MAZ015'],
+                 areas_same=['025017'],
+                 cap_awips_id=['NPWBOX'],
+                 cap_wmo_id=['WWUS71 KBOX 161900'],
+                 cap_headline=['HEAT ADVISORY REMAINS IN EFFECT'],
+                 cap_blocked_channels=[],
+                 cap_vtec=['/O.CON.KBOX.HT.Y.0003.000000T0000Z-240817T0000Z/'],
+                 prior_alerts=[PriorAlert(prior_alert_id='alert-0', url='https://api.weather.gov/alerts/alert-0',
+                                          sent_at='2024-08-16T12:00:00+00:00')])
+
+    assert repository.save_nested([alert]) == 1
+    assert repository.save_nested([alert]) == 0
+    assert repository.get_nested(Alert) == [alert]
+    assert count_rows(repository, 'alert_areas_ugc') == 2
+
+
+def test_forecast_round_trip(repository):
+    periods = [make(ForecastPeriod, period_num=num, period_name=name, start_at=f'2024-08-16T{hour}:00:00-04:00',
+                    is_daytime=(num == 1), temperature_f=temperature)
+               for num, name, hour, temperature in ((1, 'Today', '06', 84.0), (2, 'Tonight', '18', 67.0))]
+    forecast = make(Forecast, retrieved_at=RETRIEVED_AT, forecast_office='BOX', grid_x=71, grid_y=90,
+                    generated_at='2024-08-16T18:30:00+00:00', updated_at='2024-08-16T18:00:00+00:00',
+                    periods=periods)
+
+    assert repository.save_nested([forecast]) == 2
+    assert repository.get_nested(Forecast) == [forecast]
+    assert repository.save_nested([forecast], upsert=True) == 2
+    assert count_rows(repository, 'forecasts') == 2
+
+
+def test_radar_server_round_trip(repository):
+    interfaces = [make(NetworkInterface, interface_name=name, is_interface_active=active, packets_in_ok=packets)
+                  for name, active, packets in (('eth0', True, 1000), ('eth1', False, 0))]
+    server = make(RadarServer, retrieved_at=RETRIEVED_AT, host='ldm1', server_type='ldm',
+                  is_server_active=True, interfaces=interfaces)
+
+    assert repository.save_nested([server]) == 1
+    assert repository.get_nested(RadarServer) == [server]
+
+
+def test_observations_with_several_observed_at(repository):
+    observations = [make(Observation, retrieved_at=RETRIEVED_AT, station_or_zone_id='KBOS',
+                         observed_at=f'2024-08-16T{hour}:54:00+00:00', temperature_c=temperature,
+                         cloud_layers={'1200': 'FEW', '25000': 'SCT'})
+                    for hour, temperature in (('17', 27.2), ('18', 28.3))]
+
+    assert repository.save_nested(observations) == 2
+    assert repository.get_nested(Observation, order_by='observed_at') == observations
+
+
+def test_save_deduplicated_across_polls(repository):
+    # The first SIGMET changes and then changes back, and the second never changes
+    phenomena = ['TURB', 'TURB', 'TS', 'TURB']
+    stored = [repository.save_deduplicated([make_sigmet('1', phenomenon, f'2024-08-16T19:0{poll}:00+00:00'),
+                                            make_sigmet('2', 'ICE', f'2024-08-16T19:0{poll}:00+00:00')],
+                                           'sigmets')
+              for poll, phenomenon in enumerate(phenomena)]
+
+    assert stored == [2, 0, 1, 1]
+    versions = repository.filter_by('sigmets', SIGMET, {'url': '1'}, order_by='retrieved_at')
+    assert [sigmet.phenomenon for sigmet in versions] == ['TURB', 'TS', 'TURB']
+    assert repository.get_sighting(make_sigmet('2', 'ICE'), 'sigmets')['sightings'] == 4
+    assert repository.get_sighting(make_sigmet('1', 'TURB'), 'sigmets')['sightings'] == 1
+    assert repository.get_sighting(make_sigmet('1', 'SAND'), 'sigmets') is None